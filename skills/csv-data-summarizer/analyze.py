@@ -1,195 +1,591 @@
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import argparse
+import hashlib
+import io
+import json
 import os
+import pickle
 
-def summarize_csv(file_path, output_dir=None):
+# Chart names accepted by the ``charts`` selector, in report order
+CHART_TYPES = ('heatmap', 'time_series', 'distributions', 'categorical')
+
+# Above this many points a plotted series is thinned before it is handed to
+# a renderer; histograms are always binned up front so they never ship raw data
+MAX_PLOT_POINTS = 5000
+HIST_BINS = 30
+
+# Artifact cache kept inside the output directory
+CACHE_DIR_NAME = '.csv_summary_cache'
+CACHE_VERSION = 3
+FINGERPRINT_BLOCK = 64 * 1024
+
+
+def _init_chart_worker():
+    """Switch chart worker processes to the non-interactive Agg backend."""
+    matplotlib.use('Agg')
+
+
+def _downsample(series, max_points=MAX_PLOT_POINTS):
     """
-    Comprehensively analyzes a CSV file and generates multiple visualizations.
-    
+    Thin a series to at most ``max_points`` evenly strided points.
+
+    The first and last points and the minimum and maximum are always kept,
+    so the plotted range and extent of the series match the full data.
+    """
+    if len(series) <= max_points:
+        return series
+    n = len(series)
+    keep = {0, n - 1}
+    values = series.to_numpy(dtype=float)
+    if not np.isnan(values).all():
+        keep.update((int(np.nanargmin(values)), int(np.nanargmax(values))))
+    step = -(-n // max(max_points - len(keep), 1))
+    return series.iloc[sorted(keep.union(range(0, n, step)))]
+
+
+def render_chart(spec):
+    """
+    Render a single chart specification to a PNG file.
+
+    Specs only carry precomputed, already-reduced data (a correlation matrix,
+    histogram bins, downsampled series or top value counts), so they are cheap
+    to pickle into a worker process.
+
     Args:
-        file_path (str): Path to the CSV file
-        output_dir (str, optional): Directory to save visualizations. 
-                                   Defaults to current directory.
-        
+        spec (dict): Chart specification built by ``summarize_csv``
+
     Returns:
-        str: Formatted comprehensive analysis of the dataset
+        str: File name of the rendered chart
     """
-    # Set up output directory
-    if output_dir is None:
-        output_dir = os.getcwd()
+    kind = spec['kind']
+
+    if kind == 'heatmap':
+        plt.figure(figsize=(10, 8))
+        sns.heatmap(spec['corr'], annot=True, cmap='coolwarm', center=0,
+                   square=True, linewidths=1)
+        plt.title('Correlation Heatmap')
+
+    elif kind == 'time_series':
+        series = spec['series']
+        fig, axes = plt.subplots(len(series), 1, figsize=(12, 4 * len(series)))
+        if len(series) == 1:
+            axes = [axes]
+
+        for ax, (num_col, mean_series) in zip(axes, series):
+            mean_series.plot(ax=ax, label='Average', linewidth=2)
+            ax.set_title(f'{num_col} Over Time')
+            ax.set_xlabel('Date')
+            ax.set_ylabel(num_col)
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+
+    elif kind == 'distributions':
+        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+        axes = axes.flatten()
+
+        for idx, (col, counts, edges) in enumerate(spec['histograms']):
+            axes[idx].hist(edges[:-1], bins=edges, weights=counts,
+                           edgecolor='black', alpha=0.7)
+            axes[idx].set_title(f'Distribution of {col}')
+            axes[idx].set_xlabel(col)
+            axes[idx].set_ylabel('Frequency')
+            axes[idx].grid(True, alpha=0.3)
+
+        # Hide unused subplots
+        for idx in range(len(spec['histograms']), 4):
+            axes[idx].set_visible(False)
+
+    elif kind == 'categorical':
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        axes = axes.flatten()
+
+        for idx, (col, value_counts) in enumerate(spec['value_counts']):
+            axes[idx].barh(range(len(value_counts)), value_counts.values)
+            axes[idx].set_yticks(range(len(value_counts)))
+            axes[idx].set_yticklabels(value_counts.index)
+            axes[idx].set_title(f'Top Values in {col}')
+            axes[idx].set_xlabel('Count')
+            axes[idx].grid(True, alpha=0.3, axis='x')
+
+        # Hide unused subplots
+        for idx in range(len(spec['value_counts']), 4):
+            axes[idx].set_visible(False)
+
     else:
-        os.makedirs(output_dir, exist_ok=True)
-    
-    df = pd.read_csv(file_path)
+        raise ValueError(f"Unknown chart kind: {kind}")
+
+    plt.tight_layout()
+    plt.savefig(spec['output_path'], dpi=150)
+    plt.close('all')
+    return spec['filename']
+
+
+def render_charts(specs, max_workers=None):
+    """
+    Render chart specifications concurrently in a process pool.
+
+    Args:
+        specs (list): Chart specifications to render
+        max_workers (int, optional): Worker process count. Defaults to one
+                                     process per chart, capped at the CPU count.
+                                     ``1`` renders in the current process.
+
+    Returns:
+        list: File names of the rendered charts, in specification order
+    """
+    if not specs:
+        return []
+
+    if max_workers is None:
+        max_workers = min(len(specs), os.cpu_count() or 1)
+
+    if max_workers <= 1 or len(specs) == 1:
+        return [render_chart(spec) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_chart_worker) as executor:
+        return list(executor.map(render_chart, specs))
+
+
+def _resolve_charts(charts):
+    """Normalize the ``charts`` selector to a set of chart names."""
+    if charts is None:
+        return set(CHART_TYPES)
+    if isinstance(charts, str):
+        charts = [c.strip() for c in charts.split(',') if c.strip()]
+    selected = set(charts)
+    if 'all' in selected:
+        return set(CHART_TYPES)
+    if 'none' in selected:
+        return set()
+    unknown = selected - set(CHART_TYPES)
+    if unknown:
+        raise ValueError(
+            f"Unknown chart type(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(CHART_TYPES)}"
+        )
+    return selected
+
+
+def _find_date_column(columns):
+    date_cols = [c for c in columns if 'date' in c.lower() or 'time' in c.lower()]
+    return date_cols[0] if date_cols else None
+
+
+def compute_stats(df):
+    """
+    Reduce a DataFrame to the partial statistics the report is built from.
+
+    Everything except the numeric columns is kept in additive form (row and
+    null counts, full value counts, per-date sums and counts), so statistics
+    for appended rows can be merged in with ``merge_stats``. Numeric columns
+    are kept as values because quartiles, correlations and histogram bins
+    need the whole column.
+
+    Args:
+        df (DataFrame): Parsed CSV data
+
+    Returns:
+        dict: Partial statistics
+    """
+    numeric_cols = df.select_dtypes(include='number').columns.tolist()
+    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+    categorical_cols = [c for c in categorical_cols if 'id' not in c.lower()]
+
+    stats = {
+        'n_rows': df.shape[0],
+        'columns': df.columns.tolist(),
+        'dtypes': df.dtypes,
+        'null_counts': df.isnull().sum(),
+        'numeric': df[numeric_cols].reset_index(drop=True),
+        'value_counts': {col: df[col].value_counts(sort=False) for col in categorical_cols},
+        'date': None,
+    }
+
+    date_col = _find_date_column(df.columns)
+    if date_col is not None:
+        dates = pd.to_datetime(df[date_col], errors='coerce')
+        grouped = df[numeric_cols].groupby(dates)
+        stats['date'] = {
+            'column': date_col,
+            'min': dates.min(),
+            'max': dates.max(),
+            'value_counts': dates.value_counts(sort=False),
+            'sums': grouped.sum(),
+            'counts': grouped.count(),
+        }
+
+    return stats
+
+
+class IncompatibleAppend(ValueError):
+    """Raised when appended rows cannot be merged into cached statistics."""
+
+
+def _merge_counts(old, new):
+    # Keep values in order of first appearance, as a full recount would
+    order = old.index.union(new.index, sort=False)
+    return old.add(new, fill_value=0).reindex(order).astype('int64')
+
+
+def _top_counts(counts, n=10):
+    """Most frequent values first, ties in order of first appearance."""
+    return counts.sort_values(ascending=False, kind='stable').head(n)
+
+
+def merge_stats(old, new):
+    """
+    Merge statistics of appended rows into previously computed statistics.
+
+    Raises:
+        IncompatibleAppend: If the appended rows change the column layout or
+                            the type of a non-numeric column
+    """
+    if old['columns'] != new['columns']:
+        raise IncompatibleAppend("Column layout changed")
+
+    dtypes = {}
+    for col in old['columns']:
+        old_dtype, new_dtype = old['dtypes'][col], new['dtypes'][col]
+        if old_dtype == new_dtype:
+            dtypes[col] = old_dtype
+        elif (pd.api.types.is_numeric_dtype(old_dtype) and pd.api.types.is_numeric_dtype(new_dtype)
+              and not pd.api.types.is_bool_dtype(old_dtype) and not pd.api.types.is_bool_dtype(new_dtype)):
+            dtypes[col] = np.result_type(old_dtype, new_dtype)
+        else:
+            raise IncompatibleAppend(f"Column '{col}' changed type: {old_dtype} -> {new_dtype}")
+
+    merged = {
+        'n_rows': old['n_rows'] + new['n_rows'],
+        'columns': old['columns'],
+        'dtypes': pd.Series(dtypes, dtype=object),
+        'null_counts': old['null_counts'].add(new['null_counts'], fill_value=0).astype('int64'),
+        'numeric': pd.concat([old['numeric'], new['numeric']], ignore_index=True),
+        'value_counts': {col: _merge_counts(counts, new['value_counts'][col])
+                         for col, counts in old['value_counts'].items()},
+        'date': old['date'],
+    }
+
+    if old['date'] is not None:
+        old_date, new_date = old['date'], new['date']
+        merged['date'] = {
+            'column': old_date['column'],
+            'min': pd.Series([old_date['min'], new_date['min']]).min(),
+            'max': pd.Series([old_date['max'], new_date['max']]).max(),
+            'value_counts': _merge_counts(old_date['value_counts'], new_date['value_counts']),
+            'sums': old_date['sums'].add(new_date['sums'], fill_value=0).sort_index(),
+            'counts': old_date['counts'].add(new_date['counts'], fill_value=0).sort_index(),
+        }
+
+    return merged
+
+
+def build_report(stats, output_dir, selected_charts, max_workers=None):
+    """
+    Format the text summary from partial statistics and render the charts.
+
+    Returns:
+        tuple: (formatted analysis of the dataset, list of rendered chart files)
+    """
+    n_rows, columns = stats['n_rows'], stats['columns']
+    numeric = stats['numeric']
+    numeric_cols = numeric.columns.tolist()
+    categorical_cols = list(stats['value_counts'])
+    date = stats['date']
+
     summary = []
-    charts_created = []
-    
+    chart_specs = {}
+
+    def add_chart(kind, filename, **data):
+        if kind in selected_charts:
+            chart_specs[kind] = dict(
+                kind=kind,
+                filename=filename,
+                output_path=os.path.join(output_dir, filename),
+                **data,
+            )
+
     # Basic info
     summary.append("=" * 60)
     summary.append("📊 DATA OVERVIEW")
     summary.append("=" * 60)
-    summary.append(f"Rows: {df.shape[0]:,} | Columns: {df.shape[1]}")
-    summary.append(f"\nColumns: {', '.join(df.columns.tolist())}")
-    
+    summary.append(f"Rows: {n_rows:,} | Columns: {len(columns)}")
+    summary.append(f"\nColumns: {', '.join(columns)}")
+
     # Data types
     summary.append(f"\n📋 DATA TYPES:")
-    for col, dtype in df.dtypes.items():
+    for col, dtype in stats['dtypes'].items():
         summary.append(f"  • {col}: {dtype}")
-    
+
     # Missing data analysis
-    missing = df.isnull().sum().sum()
-    missing_pct = (missing / (df.shape[0] * df.shape[1])) * 100
+    null_counts = stats['null_counts']
+    missing = null_counts.sum()
+    missing_pct = (missing / (n_rows * len(columns))) * 100
     summary.append(f"\n🔍 DATA QUALITY:")
     if missing:
         summary.append(f"Missing values: {missing:,} ({missing_pct:.2f}% of total data)")
         summary.append("Missing by column:")
-        for col in df.columns:
-            col_missing = df[col].isnull().sum()
+        for col in columns:
+            col_missing = null_counts[col]
             if col_missing > 0:
-                col_pct = (col_missing / len(df)) * 100
+                col_pct = (col_missing / n_rows) * 100
                 summary.append(f"  • {col}: {col_missing:,} ({col_pct:.1f}%)")
     else:
         summary.append("✓ No missing values - dataset is complete!")
-    
+
     # Numeric analysis
-    numeric_cols = df.select_dtypes(include='number').columns.tolist()
     if numeric_cols:
         summary.append(f"\n📈 NUMERICAL ANALYSIS:")
-        summary.append(str(df[numeric_cols].describe()))
-        
+        summary.append(str(numeric.describe()))
+
         # Correlations if multiple numeric columns
         if len(numeric_cols) > 1:
             summary.append(f"\n🔗 CORRELATIONS:")
-            corr_matrix = df[numeric_cols].corr()
+            corr_matrix = numeric.corr()
             summary.append(str(corr_matrix))
-            
-            # Create correlation heatmap
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0, 
-                       square=True, linewidths=1)
-            plt.title('Correlation Heatmap')
-            plt.tight_layout()
-            output_path = os.path.join(output_dir, 'correlation_heatmap.png')
-            plt.savefig(output_path, dpi=150)
-            plt.close()
-            charts_created.append('correlation_heatmap.png')
-    
+            add_chart('heatmap', 'correlation_heatmap.png', corr=corr_matrix)
+
     # Categorical analysis
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    categorical_cols = [c for c in categorical_cols if 'id' not in c.lower()]
-    
     if categorical_cols:
         summary.append(f"\n📊 CATEGORICAL ANALYSIS:")
         for col in categorical_cols[:5]:  # Limit to first 5
-            value_counts = df[col].value_counts()
+            value_counts = _top_counts(stats['value_counts'][col])
             summary.append(f"\n{col}:")
-            for val, count in value_counts.head(10).items():
-                pct = (count / len(df)) * 100
+            for val, count in value_counts.items():
+                pct = (count / n_rows) * 100
                 summary.append(f"  • {val}: {count:,} ({pct:.1f}%)")
-    
+
     # Time series analysis
-    date_cols = [c for c in df.columns if 'date' in c.lower() or 'time' in c.lower()]
-    if date_cols:
+    if date is not None:
         summary.append(f"\n📅 TIME SERIES ANALYSIS:")
-        date_col = date_cols[0]
-        df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
-        
-        date_range = df[date_col].max() - df[date_col].min()
-        summary.append(f"Date range: {df[date_col].min()} to {df[date_col].max()}")
+        date_range = date['max'] - date['min']
+        summary.append(f"Date range: {date['min']} to {date['max']}")
         summary.append(f"Span: {date_range.days} days")
-        
-        # Create time-series plots for numeric columns
+
+        # Time-series plots for numeric columns
         if numeric_cols:
-            fig, axes = plt.subplots(min(3, len(numeric_cols)), 1, 
-                                    figsize=(12, 4 * min(3, len(numeric_cols))))
-            if len(numeric_cols) == 1:
-                axes = [axes]
-            
-            for idx, num_col in enumerate(numeric_cols[:3]):
-                ax = axes[idx] if len(numeric_cols) > 1 else axes[0]
-                daily_data = df.groupby(date_col)[num_col].agg(['mean', 'sum', 'count'])
-                daily_data['mean'].plot(ax=ax, label='Average', linewidth=2)
-                ax.set_title(f'{num_col} Over Time')
-                ax.set_xlabel('Date')
-                ax.set_ylabel(num_col)
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            output_path = os.path.join(output_dir, 'time_series_analysis.png')
-            plt.savefig(output_path, dpi=150)
-            plt.close()
-            charts_created.append('time_series_analysis.png')
-    
+            daily_means = date['sums'] / date['counts'].replace(0, np.nan)
+            series = [(num_col, _downsample(daily_means[num_col]))
+                      for num_col in numeric_cols[:3]]
+            add_chart('time_series', 'time_series_analysis.png', series=series)
+
     # Distribution plots for numeric columns
-    if numeric_cols:
-        n_cols = min(4, len(numeric_cols))
-        fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-        axes = axes.flatten()
-        
-        for idx, col in enumerate(numeric_cols[:4]):
-            axes[idx].hist(df[col].dropna(), bins=30, edgecolor='black', alpha=0.7)
-            axes[idx].set_title(f'Distribution of {col}')
-            axes[idx].set_xlabel(col)
-            axes[idx].set_ylabel('Frequency')
-            axes[idx].grid(True, alpha=0.3)
-        
-        # Hide unused subplots
-        for idx in range(len(numeric_cols[:4]), 4):
-            axes[idx].set_visible(False)
-        
-        plt.tight_layout()
-        output_path = os.path.join(output_dir, 'distributions.png')
-        plt.savefig(output_path, dpi=150)
-        plt.close()
-        charts_created.append('distributions.png')
-    
-    # Categorical distributions
+    if numeric_cols and 'distributions' in selected_charts:
+        histograms = []
+        for col in numeric_cols[:4]:
+            values = numeric[col].dropna().to_numpy()
+            counts, edges = np.histogram(values, bins=HIST_BINS)
+            histograms.append((col, counts, edges))
+        add_chart('distributions', 'distributions.png', histograms=histograms)
+
+    # Categorical distributions (the date column is charted as parsed dates)
     if categorical_cols:
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        axes = axes.flatten()
-        
-        for idx, col in enumerate(categorical_cols[:4]):
-            value_counts = df[col].value_counts().head(10)
-            axes[idx].barh(range(len(value_counts)), value_counts.values)
-            axes[idx].set_yticks(range(len(value_counts)))
-            axes[idx].set_yticklabels(value_counts.index)
-            axes[idx].set_title(f'Top Values in {col}')
-            axes[idx].set_xlabel('Count')
-            axes[idx].grid(True, alpha=0.3, axis='x')
-        
-        # Hide unused subplots
-        for idx in range(len(categorical_cols[:4]), 4):
-            axes[idx].set_visible(False)
-        
-        plt.tight_layout()
-        output_path = os.path.join(output_dir, 'categorical_distributions.png')
-        plt.savefig(output_path, dpi=150)
-        plt.close()
-        charts_created.append('categorical_distributions.png')
-    
+        value_counts = []
+        for col in categorical_cols[:4]:
+            if date is not None and col == date['column']:
+                value_counts.append((col, _top_counts(date['value_counts'])))
+            else:
+                value_counts.append((col, _top_counts(stats['value_counts'][col])))
+        add_chart('categorical', 'categorical_distributions.png',
+                  value_counts=value_counts)
+
+    # Render charts once all statistics are in place
+    ordered_specs = [chart_specs[kind] for kind in CHART_TYPES if kind in chart_specs]
+    charts_created = render_charts(ordered_specs, max_workers=max_workers)
+
     # Summary of visualizations
     if charts_created:
         summary.append(f"\n📊 VISUALIZATIONS CREATED:")
         for chart in charts_created:
             summary.append(f"  ✓ {chart}")
-    
+
     summary.append("\n" + "=" * 60)
     summary.append("✅ COMPREHENSIVE ANALYSIS COMPLETE")
     summary.append("=" * 60)
-    
-    return "\n".join(summary)
 
+    return "\n".join(summary), charts_created
 
-if __name__ == "__main__":
-    # Test with sample data
-    import sys
-    if len(sys.argv) > 1:
-        file_path = sys.argv[1]
+
+def file_fingerprint(file_path, block_size=FINGERPRINT_BLOCK):
+    """
+    Fingerprint a file by size, mtime and hashes of its head and tail blocks.
+
+    Returns:
+        dict: Fingerprint, including whether the file ends with a newline
+    """
+    st = os.stat(file_path)
+    with open(file_path, 'rb') as f:
+        head = f.read(block_size)
+        f.seek(max(0, st.st_size - block_size))
+        tail = f.read(block_size)
+    return {
+        'size': st.st_size,
+        'mtime_ns': st.st_mtime_ns,
+        'head': hashlib.sha1(head).hexdigest(),
+        'tail': hashlib.sha1(tail).hexdigest(),
+        'ends_with_newline': tail.endswith(b'\n'),
+    }
+
+
+def _is_append_of(file_path, old, block_size=FINGERPRINT_BLOCK):
+    """Check whether the file is ``old`` with rows appended after its last line."""
+    size = os.path.getsize(file_path)
+    if size <= old['size'] or not old['ends_with_newline']:
+        return False
+    with open(file_path, 'rb') as f:
+        head = f.read(min(block_size, old['size']))
+        f.seek(max(0, old['size'] - block_size))
+        tail = f.read(min(block_size, old['size']))
+    return (hashlib.sha1(head).hexdigest() == old['head']
+            and hashlib.sha1(tail).hexdigest() == old['tail'])
+
+
+def _read_appended_rows(file_path, offset):
+    """Parse only the rows written after ``offset``, reusing the header line."""
+    with open(file_path, 'rb') as f:
+        header = f.readline()
+        f.seek(offset)
+        appended = f.read()
+    return pd.read_csv(io.BytesIO(header + appended))
+
+
+def _cache_path(output_dir, file_path, selected_charts):
+    key = json.dumps([os.path.abspath(file_path), sorted(selected_charts)])
+    name = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + '.pkl'
+    return os.path.join(output_dir, CACHE_DIR_NAME, name)
+
+
+def _load_cache(path):
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return entry if entry.get('version') == CACHE_VERSION else None
+
+
+def _chart_hashes(output_dir, charts):
+    """Content hashes of rendered chart files, None for a missing file."""
+    hashes = {}
+    for chart in charts:
+        try:
+            with open(os.path.join(output_dir, chart), 'rb') as f:
+                hashes[chart] = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            hashes[chart] = None
+    return hashes
+
+
+def _save_cache(path, entry):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def summarize_csv(file_path, output_dir=None, charts=None, max_workers=None,
+                  use_cache=True):
+    """
+    Comprehensively analyzes a CSV file and generates multiple visualizations.
+
+    Statistics are computed first; each chart is then described by a small
+    specification and rendered concurrently in a process pool.
+
+    Results are cached in ``<output_dir>/.csv_summary_cache`` keyed by the
+    file's fingerprint (size, mtime, head/tail block hashes) and the options.
+    An unchanged file reuses the cached summary and charts, re-rendering the
+    charts if their files were removed or overwritten since; a file that only
+    had rows appended parses just the new rows and merges their statistics
+    into the cached ones.
+
+    Args:
+        file_path (str): Path to the CSV file
+        output_dir (str, optional): Directory to save visualizations.
+                                   Defaults to current directory.
+        charts (str or list, optional): Charts to render - any of 'heatmap',
+                                       'time_series', 'distributions',
+                                       'categorical', or 'all'/'none'.
+                                       Defaults to all relevant charts.
+        max_workers (int, optional): Chart rendering processes.
+                                    Defaults to one per chart (up to CPU count).
+        use_cache (bool, optional): Reuse and update the artifact cache.
+                                   Defaults to True.
+
+    Returns:
+        str: Formatted comprehensive analysis of the dataset
+    """
+    selected_charts = _resolve_charts(charts)
+
+    # Set up output directory
+    if output_dir is None:
+        output_dir = os.getcwd()
     else:
-        file_path = "resources/sample.csv"
-    
-    print(summarize_csv(file_path))
+        os.makedirs(output_dir, exist_ok=True)
+
+    if not use_cache:
+        stats = compute_stats(pd.read_csv(file_path))
+        return build_report(stats, output_dir, selected_charts, max_workers)[0]
+
+    cache_path = _cache_path(output_dir, file_path, selected_charts)
+    entry = _load_cache(cache_path)
+    fingerprint = file_fingerprint(file_path)
+
+    stats = None
+    if entry is not None:
+        if entry['fingerprint'] == fingerprint:
+            # Chart file names are shared by every input in the output directory,
+            # so the charts must still be the ones rendered for this entry
+            if _chart_hashes(output_dir, entry['charts']) == entry['chart_hashes']:
+                return entry['summary']
+            # Charts were removed or overwritten - re-render them from the cached statistics
+            stats = entry['stats']
+        elif _is_append_of(file_path, entry['fingerprint']):
+            appended = _read_appended_rows(file_path, entry['fingerprint']['size'])
+            try:
+                stats = merge_stats(entry['stats'], compute_stats(appended))
+            except IncompatibleAppend:
+                stats = None
+
+    if stats is None:
+        stats = compute_stats(pd.read_csv(file_path))
+
+    summary, charts_created = build_report(stats, output_dir, selected_charts, max_workers)
+    _save_cache(cache_path, {
+        'version': CACHE_VERSION,
+        'fingerprint': fingerprint,
+        'stats': stats,
+        'summary': summary,
+        'charts': charts_created,
+        'chart_hashes': _chart_hashes(output_dir, charts_created),
+    })
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a CSV file")
+    parser.add_argument("file_path", nargs="?", default="resources/sample.csv",
+                        help="CSV file to analyze (default: resources/sample.csv)")
+    parser.add_argument("--output-dir", help="Directory for chart images")
+    chart_group = parser.add_mutually_exclusive_group()
+    chart_group.add_argument("--charts",
+                             help="Comma-separated charts to render: "
+                                  f"{', '.join(CHART_TYPES)} (default: all)")
+    chart_group.add_argument("--no-charts", action="store_true",
+                             help="Skip chart rendering entirely")
+    parser.add_argument("--workers", type=int,
+                        help="Chart rendering processes (default: one per chart)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the summary artifact cache")
+    args = parser.parse_args()
 
+    charts = 'none' if args.no_charts else args.charts
+    print(summarize_csv(args.file_path, output_dir=args.output_dir,
+                        charts=charts, max_workers=args.workers,
+                        use_cache=not args.no_cache))
@@ -0,0 +1,255 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import analyze
+from analyze import (
+    CHART_TYPES, IncompatibleAppend, _downsample, _is_append_of, _resolve_charts, compute_stats,
+    file_fingerprint, merge_stats, summarize_csv
+)
+
+SCRIPT = Path(__file__).resolve().parent / "analyze.py"
+SAMPLE = SCRIPT.parent / "resources" / "sample.csv"
+
+
+def assert_stats_equal(test, merged, full):
+    test.assertEqual(merged['n_rows'], full['n_rows'])
+    test.assertEqual(merged['columns'], full['columns'])
+    test.assertEqual(merged['dtypes'].astype(str).to_dict(), full['dtypes'].astype(str).to_dict())
+    pd.testing.assert_series_equal(merged['null_counts'], full['null_counts'], check_dtype=False)
+    pd.testing.assert_frame_equal(merged['numeric'], full['numeric'])
+    test.assertEqual(list(merged['value_counts']), list(full['value_counts']))
+    for col, counts in full['value_counts'].items():
+        test.assertEqual(merged['value_counts'][col].to_dict(), counts.to_dict())
+    merged_date, full_date = merged['date'], full['date']
+    test.assertEqual(merged_date['column'], full_date['column'])
+    test.assertEqual((merged_date['min'], merged_date['max']), (full_date['min'], full_date['max']))
+    test.assertEqual(merged_date['value_counts'].to_dict(), full_date['value_counts'].to_dict())
+    pd.testing.assert_frame_equal(merged_date['sums'], full_date['sums'], check_dtype=False)
+    pd.testing.assert_frame_equal(merged_date['counts'], full_date['counts'], check_dtype=False)
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestCharts(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.out = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def pngs(self):
+        return sorted(p.name for p in self.out.glob("*.png"))
+
+    def test_downsample_caps_points_and_keeps_extremes(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=10_007)
+        values[3] = np.nan
+        values[4_321], values[9_998] = 50.0, -50.0
+        series = pd.Series(values, index=pd.date_range("2024-01-01", periods=len(values), freq="h"))
+
+        for max_points in (100, 999, 5000):
+            thinned = _downsample(series, max_points)
+            self.assertLessEqual(len(thinned), max_points)
+            self.assertGreater(len(thinned), max_points // 2)
+            self.assertTrue(thinned.index.is_monotonic_increasing)
+            self.assertEqual(thinned.index[0], series.index[0])
+            self.assertEqual(thinned.index[-1], series.index[-1])
+            self.assertEqual((thinned.min(), thinned.max()), (-50.0, 50.0))
+
+        short = series.iloc[:100]
+        self.assertIs(_downsample(short, 100), short)
+        missing = _downsample(pd.Series([np.nan] * 50), 10)
+        self.assertLessEqual(len(missing), 10)
+        self.assertEqual((missing.index[0], missing.index[-1]), (0, 49))
+
+    def test_selector_renders_only_requested_charts(self):
+        self.assertEqual(_resolve_charts(None), set(CHART_TYPES))
+        self.assertEqual(_resolve_charts("all"), set(CHART_TYPES))
+        self.assertEqual(_resolve_charts("none"), set())
+        self.assertEqual(_resolve_charts(" heatmap, categorical ,"), {"heatmap", "categorical"})
+        with self.assertRaisesRegex(ValueError, "Unknown chart type\\(s\\): pie"):
+            _resolve_charts(["heatmap", "pie"])
+
+        summary = summarize_csv(str(SAMPLE), output_dir=str(self.out), charts="heatmap,categorical",
+                                use_cache=False)
+        self.assertEqual(self.pngs(), ["categorical_distributions.png", "correlation_heatmap.png"])
+        self.assertIn("✓ correlation_heatmap.png", summary)
+        self.assertNotIn("✓ distributions.png", summary)
+
+        summarize_csv(str(SAMPLE), output_dir=str(self.out), use_cache=False)
+        self.assertEqual(self.pngs(), ["categorical_distributions.png", "correlation_heatmap.png",
+                                       "distributions.png", "time_series_analysis.png"])
+
+    def test_no_charts_flag_writes_no_images(self):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT), str(SAMPLE), "--output-dir", str(self.out), "--no-charts"],
+            capture_output=True, text=True, check=True,
+        )
+        self.assertIn("COMPREHENSIVE ANALYSIS COMPLETE", result.stdout)
+        self.assertNotIn("VISUALIZATIONS CREATED", result.stdout)
+        self.assertEqual(self.pngs(), [])
+
+
+class TestMergeStats(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv(SAMPLE)
+
+    def test_merged_stats_equal_full_recompute(self):
+        head, tail = self.df.iloc[:12], self.df.iloc[12:]
+        merged = merge_stats(compute_stats(head), compute_stats(tail.reset_index(drop=True)))
+        assert_stats_equal(self, merged, compute_stats(self.df))
+
+    def test_numeric_widening_is_allowed(self):
+        tail = self.df.iloc[12:].copy()
+        tail['quantity'] = tail['quantity'].astype(float)
+        merged = merge_stats(compute_stats(self.df.iloc[:12]), compute_stats(tail))
+        self.assertEqual(merged['dtypes']['quantity'], 'float64')
+
+    def test_incompatible_appends_are_rejected(self):
+        old = compute_stats(self.df.iloc[:12])
+        with self.assertRaisesRegex(IncompatibleAppend, "Column layout changed"):
+            merge_stats(old, compute_stats(self.df.iloc[12:].drop(columns='region')))
+
+        tail = self.df.iloc[12:].copy()
+        tail['quantity'] = tail['quantity'].astype(str)
+        with self.assertRaisesRegex(IncompatibleAppend, "Column 'quantity' changed type"):
+            merge_stats(old, compute_stats(tail))
+
+
+class TestSummaryCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.csv = self.root / "data.csv"
+        self.out = self.root / "out"
+        lines = [line for line in SAMPLE.read_text().splitlines(keepends=True) if line.strip()]
+        self.header, self.rows = lines[0], lines[1:]
+        self.csv.write_text(self.header + "".join(self.rows[:12]))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def summarize(self, **kwargs):
+        """Summarize the test file, returning (summary, rows parsed per compute_stats call)"""
+        kwargs.setdefault('charts', 'none')
+        with mock.patch.object(analyze, 'compute_stats', wraps=analyze.compute_stats) as compute:
+            summary = summarize_csv(str(self.csv), output_dir=str(self.out), **kwargs)
+        return summary, [len(call.args[0]) for call in compute.call_args_list]
+
+    def rewrite(self, text):
+        """Replace the file contents, making sure the mtime moves"""
+        mtime_ns = self.csv.stat().st_mtime_ns
+        self.csv.write_text(text)
+        os.utime(self.csv, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+    def test_unchanged_file_reuses_the_summary(self):
+        first, parsed = self.summarize()
+        self.assertEqual(parsed, [12])
+        self.assertEqual(len(os.listdir(self.out / analyze.CACHE_DIR_NAME)), 1)
+
+        second, parsed = self.summarize()
+        self.assertEqual(second, first)
+        self.assertEqual(parsed, [])
+
+    def test_append_parses_only_new_rows_and_matches_full_recompute(self):
+        self.summarize()
+        with open(self.csv, 'a') as f:
+            f.write("".join(self.rows[12:]))
+
+        summary, parsed = self.summarize()
+        self.assertEqual(parsed, [len(self.rows) - 12])
+        self.assertEqual(summary, self.summarize(use_cache=False)[0])
+        self.assertIn(f"Rows: {len(self.rows)}", summary)
+
+    def test_same_size_edit_invalidates_the_cache(self):
+        self.summarize()
+        old = file_fingerprint(self.csv)
+        edited = self.csv.read_text().replace("129.99", "129.98")
+        self.assertEqual(len(edited), old['size'])
+
+        self.rewrite(edited)
+        self.assertFalse(_is_append_of(self.csv, old))
+        summary, parsed = self.summarize()
+        self.assertEqual(parsed, [12])
+        self.assertEqual(summary, self.summarize(use_cache=False)[0])
+
+    def test_rewritten_head_or_tail_is_not_an_append(self):
+        self.summarize()
+        old = file_fingerprint(self.csv, block_size=16)
+        text = self.csv.read_text()
+        extra = "".join(self.rows[12:])
+
+        self.rewrite(text + extra)
+        self.assertTrue(_is_append_of(self.csv, old, block_size=16))
+        self.rewrite(text.replace("product", "produkt") + extra)
+        self.assertFalse(_is_append_of(self.csv, old, block_size=16))
+        self.rewrite(text[:-2] + "0\n" + extra)
+        self.assertFalse(_is_append_of(self.csv, old, block_size=16))
+
+        # A full recompute, not a merge over the stale statistics
+        summary, parsed = self.summarize()
+        self.assertEqual(parsed, [len(self.rows)])
+        self.assertEqual(summary, self.summarize(use_cache=False)[0])
+
+    def test_changed_options_invalidate_the_cache(self):
+        self.summarize()
+        _, parsed = self.summarize(charts='categorical')
+        self.assertEqual(parsed, [12])
+        self.assertTrue((self.out / "categorical_distributions.png").exists())
+        self.assertEqual(len(os.listdir(self.out / analyze.CACHE_DIR_NAME)), 2)
+
+        # Removing a cached chart re-renders it from the cached statistics
+        os.remove(self.out / "categorical_distributions.png")
+        _, parsed = self.summarize(charts='categorical', max_workers=1)
+        self.assertEqual(parsed, [])
+        self.assertTrue((self.out / "categorical_distributions.png").exists())
+
+    def test_charts_overwritten_by_another_input_are_rerendered(self):
+        other = self.root / "other.csv"
+        other.write_text(self.header + "".join(self.rows[12:]))
+        charts = "categorical,distributions"
+
+        def chart_hashes():
+            return analyze._chart_hashes(self.out, ["categorical_distributions.png", "distributions.png"])
+
+        first, _ = self.summarize(charts=charts, max_workers=1)
+        hashes_a = chart_hashes()
+        summarize_csv(str(other), output_dir=str(self.out), charts=charts, max_workers=1)
+        hashes_b = chart_hashes()
+        self.assertNotEqual(hashes_a, hashes_b)
+
+        # a.csv again: the cached statistics are reused, but its charts are drawn again
+        summary, parsed = self.summarize(charts=charts, max_workers=1)
+        self.assertEqual(summary, first)
+        self.assertEqual(parsed, [])
+        self.assertEqual(chart_hashes(), hashes_a)
+
+        # Now the charts on disk match the cache entry again
+        with mock.patch.object(analyze, 'render_charts') as render:
+            self.summarize(charts=charts, max_workers=1)
+        render.assert_not_called()
+
+    def test_incompatible_append_falls_back_to_full_recompute(self):
+        self.summarize()
+        with open(self.csv, 'a') as f:
+            f.write("2024-02-20,Widget A,many,1.00,C009,West\n")
+
+        summary, parsed = self.summarize()
+        self.assertEqual(parsed, [1, 13])
+        self.assertEqual(summary, self.summarize(use_cache=False)[0])
+
+    def test_no_cache_leaves_no_artifacts(self):
+        self.summarize(use_cache=False)
+        self.assertFalse((self.out / analyze.CACHE_DIR_NAME).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Citation Numbering Benchmark
+Times rendering a report's inline [cite:<id>] markers, comparing the previous
+list.index() lookup per marker with CitationManager's id -> number index
+
+Usage:
+    python benchmark_citations.py [--citations 10000] [--sources 1000]
+"""
+
+import argparse
+import io
+import json
+import random
+import time
+
+from citation_manager import CITE_MARKER_RE, CitationManager
+
+
+def make_sources(count: int) -> str:
+    """JSON Lines stream of synthetic sources"""
+    return "\n".join(
+        json.dumps({"url": f"https://example.org/paper/{n}", "title": f"Paper {n}",
+                    "authors": [f"Author {n}"], "publication_date": "2024"})
+        for n in range(count)
+    )
+
+
+def make_report(ids, citations: int, rng: random.Random) -> str:
+    """Prose with one inline marker every dozen words"""
+    words = "results were consistent across cohorts and methods".split()
+    parts = []
+    for _ in range(citations):
+        parts.append(" ".join(rng.choice(words) for _ in range(12)))
+        parts.append(f"[cite:{rng.choice(ids)}].")
+    return " ".join(parts)
+
+
+def render_with_list_index(manager: CitationManager, text: str) -> str:
+    """The previous approach: a linear scan of the citation order per marker"""
+    def number(m):
+        try:
+            return f"[{manager.citation_order.index(m.group(1)) + 1}]"
+        except ValueError:
+            return "[?]"
+    return CITE_MARKER_RE.sub(number, text)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark citation numbering')
+    parser.add_argument('--citations', type=int, default=10_000, help='Inline markers in the report (default: 10000)')
+    parser.add_argument('--sources', type=int, default=1_000, help='Distinct sources (default: 1000)')
+    args = parser.parse_args()
+
+    manager = CitationManager()
+    elapsed, ids = timed(manager.add_sources, io.StringIO(make_sources(args.sources)))
+    print(f"add_sources: {args.sources} sources from JSON Lines in {elapsed * 1000:.1f} ms")
+
+    report = make_report(ids, args.citations, random.Random(0))
+    print(f"Report: {args.citations} inline citations over {args.sources} sources")
+
+    old_elapsed, old = timed(render_with_list_index, manager, report)
+    new_elapsed, new = timed(manager.render_inline, report)
+    agrees = "" if old == new else "  (DIFFERENT RESULTS)"
+    print(f"  {'list.index per marker':<24} {old_elapsed * 1000:9.1f} ms")
+    print(f"  {'render_inline':<24} {new_elapsed * 1000:9.1f} ms{agrees}")
+
+    elapsed, _ = timed(manager.write_bibliography, io.StringIO())
+    print(f"write_bibliography: {args.sources} entries in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
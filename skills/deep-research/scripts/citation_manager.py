@@ -2,13 +2,24 @@
 """
 Citation Management System
 Tracks sources, generates citations, and maintains bibliography
+
+Citation numbers come from an id -> number index, so looking one up costs the same
+for the 1st source as for the 1000th, and render_inline() replaces every
+[cite:<id>] marker in a report with one regex pass.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, TextIO
 from datetime import datetime
 from urllib.parse import urlparse
 import hashlib
+import json
+import re
+
+# Inline marker for a source in a draft report, e.g. "[cite:1a2b3c4d]"
+CITE_MARKER_RE = re.compile(r'\[cite:([^\]\s]+)\]')
+
+SOURCE_FIELDS = {'url', 'title', 'authors', 'publication_date', 'source_type', 'doi'}
 
 
 @dataclass
@@ -54,6 +65,8 @@ class CitationManager:
     def __init__(self):
         self.citations: Dict[str, Citation] = {}
         self.citation_order: List[str] = []
+        # citation id -> 1-based position in citation_order
+        self.citation_numbers: Dict[str, int] = {}
 
     def add_source(
         self,
@@ -80,41 +93,65 @@ class CitationManager:
             )
             self.citations[citation_id] = citation
             self.citation_order.append(citation_id)
+            self.citation_numbers[citation_id] = len(self.citation_order)
 
         # Increment citation count
         self.citations[citation_id].citation_count += 1
 
         return citation_id
 
+    def add_sources(self, stream: TextIO) -> List[str]:
+        """
+        Add sources from a JSON array or JSON Lines stream of objects with the
+        add_source() fields; returns their citation IDs in order
+        """
+        ids = []
+        for line_no, record in _read_source_records(stream):
+            if not isinstance(record, dict) or 'url' not in record or 'title' not in record:
+                raise ValueError(f"Source {line_no}: expected an object with 'url' and 'title'")
+            unknown = record.keys() - SOURCE_FIELDS
+            if unknown:
+                raise ValueError(f"Source {line_no}: unknown fields {sorted(unknown)}")
+            ids.append(self.add_source(**record))
+        return ids
+
     def get_citation_number(self, citation_id: str) -> Optional[int]:
         """Get the citation number for a given ID"""
-        try:
-            return self.citation_order.index(citation_id) + 1
-        except ValueError:
-            return None
+        return self.citation_numbers.get(citation_id)
 
     def get_inline_citation(self, citation_id: str) -> str:
         """Get inline citation marker [n]"""
         num = self.get_citation_number(citation_id)
         return f"[{num}]" if num else "[?]"
 
+    def render_inline(self, text: str) -> str:
+        """Replace every [cite:<id>] marker in text with its inline citation [n]"""
+        return CITE_MARKER_RE.sub(lambda m: self.get_inline_citation(m.group(1)), text)
+
     def generate_bibliography(self, style: str = "markdown") -> str:
         """Generate full bibliography"""
-        if style == "markdown":
-            lines = ["## Bibliography\n"]
-            for i, citation_id in enumerate(self.citation_order, 1):
-                citation = self.citations[citation_id]
-                lines.append(citation.to_markdown(i))
-            return "\n".join(lines)
-
-        elif style == "apa":
-            lines = ["## Bibliography\n"]
-            for i, citation_id in enumerate(self.citation_order, 1):
-                citation = self.citations[citation_id]
-                lines.append(citation.to_apa(i))
-            return "\n".join(lines)
-
-        return "Unsupported citation style"
+        if style not in ("markdown", "apa"):
+            return "Unsupported citation style"
+
+        lines = ["## Bibliography\n"]
+        lines.extend(self._bibliography_entries(style))
+        return "\n".join(lines)
+
+    def write_bibliography(self, out: TextIO, style: str = "markdown"):
+        """Write the bibliography to out one entry at a time, as generate_bibliography() formats it"""
+        if style not in ("markdown", "apa"):
+            out.write("Unsupported citation style")
+            return
+
+        out.write("## Bibliography\n")
+        for entry in self._bibliography_entries(style):
+            out.write("\n")
+            out.write(entry)
+
+    def _bibliography_entries(self, style: str) -> Iterator[str]:
+        for i, citation_id in enumerate(self.citation_order, 1):
+            citation = self.citations[citation_id]
+            yield citation.to_apa(i) if style == "apa" else citation.to_markdown(i)
 
     def get_statistics(self) -> Dict[str, any]:
         """Get citation statistics"""
@@ -150,7 +187,25 @@ class CitationManager:
     def export_to_file(self, filepath: str, style: str = "markdown"):
         """Export bibliography to file"""
         with open(filepath, 'w') as f:
-            f.write(self.generate_bibliography(style))
+            self.write_bibliography(f, style)
+
+
+def _read_source_records(stream: TextIO) -> Iterator[tuple]:
+    """(position, record) for each object in a JSON array or JSON Lines stream"""
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        if line.lstrip().startswith('['):
+            # A JSON array has to be parsed whole
+            records = json.loads(line + stream.read())
+            if not isinstance(records, list):
+                raise ValueError("Expected a JSON array of sources")
+            yield from enumerate(records, 1)
+            return
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Source {line_no}: invalid JSON ({e.msg})") from e
 
 
 # Example usage
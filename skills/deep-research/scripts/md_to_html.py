@@ -4,10 +4,24 @@ Markdown to HTML converter for research reports
 Properly converts markdown sections to HTML while preserving structure and formatting
 """
 
+import argparse
+import io
 import re
-from typing import Tuple
+import sys
+from collections import deque
+from typing import Iterable, Iterator, List, TextIO, Tuple
 from pathlib import Path
 
+BIBLIOGRAPHY_MARKER = '## Bibliography'
+EXECUTIVE_SUMMARY_TITLE = '<h2 class="section-title">Executive Summary</h2>'
+EXECUTIVE_SUMMARY_DIV = '<div class="executive-summary">'
+SECTION_DIV = '<div class="section">'
+
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+ITALIC_RE = re.compile(r'\*(.+?)\*')
+CODE_RE = re.compile(r'`(.+?)`')
+ORDERED_ITEM_RE = re.compile(r'^\d+\.\s')
+
 
 def convert_markdown_to_html(markdown_text: str) -> Tuple[str, str]:
     """
@@ -19,100 +33,101 @@ def convert_markdown_to_html(markdown_text: str) -> Tuple[str, str]:
     Returns:
         Tuple of (content_html, bibliography_html)
     """
-    # Split content and bibliography
-    parts = markdown_text.split('## Bibliography')
-    content_md = parts[0]
-    bibliography_md = parts[1] if len(parts) > 1 else ""
-
-    # Convert content (everything except bibliography)
-    content_html = _convert_content_section(content_md)
-
-    # Convert bibliography separately
-    bibliography_html = _convert_bibliography_section(bibliography_md)
-
-    return content_html, bibliography_html
-
+    content_out, bibliography_out = io.StringIO(), io.StringIO()
+    convert_markdown_stream(io.StringIO(markdown_text), content_out, bibliography_out)
+    return content_out.getvalue(), bibliography_out.getvalue()
 
-def _convert_content_section(markdown: str) -> str:
-    """Convert main content sections to HTML"""
-    html = markdown
-
-    # Remove title and front matter (first ## heading is handled separately)
-    lines = html.split('\n')
-    processed_lines = []
-    skip_until_first_section = True
 
-    for line in lines:
-        # Skip everything until we hit "## Executive Summary" or first major section
-        if skip_until_first_section:
-            if line.startswith('## ') and not line.startswith('### '):
-                skip_until_first_section = False
-                processed_lines.append(line)
-            continue
-        processed_lines.append(line)
+def convert_markdown_stream(lines: Iterable[str], content_out: TextIO, bibliography_out: TextIO):
+    """
+    Convert a markdown report read line by line, writing HTML as it goes
 
-    html = '\n'.join(processed_lines)
+    The content is converted in a single pass, one line at a time. The bibliography
+    (the text after '## Bibliography', up to any second such heading) is written
+    once it is complete, since its entries may span lines.
 
-    # Convert headers
-    # ## Section Title → <div class="section"><h2 class="section-title">Section Title</h2></div>
-    html = re.sub(
-        r'^## (.+)$',
-        r'<div class="section"><h2 class="section-title">\1</h2>',
-        html,
-        flags=re.MULTILINE
-    )
+    Args:
+        lines: Markdown lines with their line endings, e.g. an open file
+        content_out: Receives the HTML of all sections except the bibliography
+        bibliography_out: Receives the bibliography HTML
+    """
+    bibliography_parts: List[str] = []
+
+    def content_lines() -> Iterator[str]:
+        in_bibliography = False
+        ends_with_newline = True
+        for raw in lines:
+            ends_with_newline = raw.endswith('\n')
+            if in_bibliography:
+                marker = raw.find(BIBLIOGRAPHY_MARKER)
+                if marker != -1:
+                    bibliography_parts.append(raw[:marker])
+                    return
+                bibliography_parts.append(raw)
+                continue
 
-    # ### Subsection → <h3 class="subsection-title">Subsection</h3>
-    html = re.sub(
-        r'^### (.+)$',
-        r'<h3 class="subsection-title">\1</h3>',
-        html,
-        flags=re.MULTILINE
-    )
+            marker = raw.find(BIBLIOGRAPHY_MARKER)
+            if marker != -1:
+                yield raw[:marker]
+                rest = raw[marker + len(BIBLIOGRAPHY_MARKER):]
+                second = rest.find(BIBLIOGRAPHY_MARKER)
+                if second != -1:
+                    bibliography_parts.append(rest[:second])
+                    return
+                bibliography_parts.append(rest)
+                in_bibliography = True
+                continue
+            yield raw[:-1] if ends_with_newline else raw
 
-    # #### Subsubsection → <h4 class="subsubsection-title">Title</h4>
-    html = re.sub(
-        r'^#### (.+)$',
-        r'<h4 class="subsubsection-title">\1</h4>',
-        html,
-        flags=re.MULTILINE
-    )
+        # Like str.split('\n'), text ending in a newline has a final empty line
+        if ends_with_newline and not in_bibliography:
+            yield ''
 
-    # Convert **bold** text
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
+    first = True
+    for line in _convert_content_section(content_lines()):
+        content_out.write(line if first else '\n' + line)
+        first = False
 
-    # Convert *italic* text
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
+    bibliography_out.write(_convert_bibliography_section(''.join(bibliography_parts)))
 
-    # Convert inline code `code`
-    html = re.sub(r'`(.+?)`', r'<code>\1</code>', html)
 
-    # Convert unordered lists
+def _convert_content_section(lines: Iterable[str]) -> Iterator[str]:
+    """Convert main content sections to HTML, one line at a time"""
+    # Each stage consumes and produces lines
+    html = _convert_headings_and_inline(_skip_front_matter(lines))
     html = _convert_lists(html)
-
-    # Convert tables
     html = _convert_tables(html)
-
-    # Convert paragraphs (wrap non-HTML lines in <p> tags)
     html = _convert_paragraphs(html)
+    return _close_sections(html)
 
-    # Close all open sections
-    html = _close_sections(html)
 
-    # Wrap executive summary if present
-    html = html.replace(
-        '<h2 class="section-title">Executive Summary</h2>',
-        '<div class="executive-summary"><h2 class="section-title">Executive Summary</h2>'
-    )
-    if '<div class="executive-summary">' in html:
-        # Close executive summary at the next section
-        html = html.replace(
-            '</h2>\n<div class="section">',
-            '</h2></div>\n<div class="section">',
-            1
-        )
+def _skip_front_matter(lines: Iterable[str]) -> Iterator[str]:
+    """Skip the title and front matter up to the first ## heading"""
+    lines = iter(lines)
+    for line in lines:
+        if line.startswith('## '):
+            yield line
+            break
+    yield from lines
 
-    return html
+
+def _convert_headings_and_inline(lines: Iterable[str]) -> Iterator[str]:
+    """Convert headings, **bold**, *italic* and `code`"""
+    for line in lines:
+        if line.startswith('## ') and len(line) > 3:
+            # ## Section Title → <div class="section"><h2 class="section-title">Section Title</h2></div>
+            line = f'{SECTION_DIV}<h2 class="section-title">{line[3:]}</h2>'
+        elif line.startswith('### ') and len(line) > 4:
+            line = f'<h3 class="subsection-title">{line[4:]}</h3>'
+        elif line.startswith('#### ') and len(line) > 5:
+            line = f'<h4 class="subsubsection-title">{line[5:]}</h4>'
+
+        if '*' in line:
+            line = BOLD_RE.sub(r'<strong>\1</strong>', line)
+            line = ITALIC_RE.sub(r'<em>\1</em>', line)
+        if '`' in line:
+            line = CODE_RE.sub(r'<code>\1</code>', line)
+        yield line
 
 
 def _convert_bibliography_section(markdown: str) -> str:
@@ -139,37 +154,43 @@ def _convert_bibliography_section(markdown: str) -> str:
     return html
 
 
-def _convert_lists(html: str) -> str:
+def _convert_lists(lines: Iterable[str]) -> Iterator[str]:
     """Convert markdown lists to HTML lists"""
-    lines = html.split('\n')
-    result = []
+    # The last ten output lines: the closing tag depends on whether they include
+    # a <ul>, and a continuation line extends the final one, so it is held back
+    result = deque(maxlen=10)
+    held = 0
     in_list = False
     list_level = 0
 
-    for i, line in enumerate(lines):
+    for line in lines:
         stripped = line.strip()
 
         # Check for unordered list item
         if stripped.startswith('- ') or stripped.startswith('* '):
             if not in_list:
                 result.append('<ul>')
+                held += 1
                 in_list = True
                 list_level = len(line) - len(line.lstrip())
 
             # Get the content after the marker
             content = stripped[2:]
             result.append(f'<li>{content}</li>')
+            held += 1
 
         # Check for ordered list item
-        elif re.match(r'^\d+\.\s', stripped):
+        elif ORDERED_ITEM_RE.match(stripped):
             if not in_list:
                 result.append('<ol>')
+                held += 1
                 in_list = True
                 list_level = len(line) - len(line.lstrip())
 
             # Get the content after the number and period
-            content = re.sub(r'^\d+\.\s', '', stripped)
+            content = ORDERED_ITEM_RE.sub('', stripped)
             result.append(f'<li>{content}</li>')
+            held += 1
 
         else:
             # Not a list item
@@ -183,63 +204,65 @@ def _convert_lists(html: str) -> str:
                     continue
                 else:
                     # End of list
-                    result.append('</ul>' if '<ul>' in '\n'.join(result[-10:]) else '</ol>')
+                    result.append('</ul>' if '<ul>' in '\n'.join(result) else '</ol>')
+                    held += 1
                     in_list = False
                     list_level = 0
 
             result.append(line)
+            held += 1
+
+        if held > 1:
+            yield from list(result)[-held:-1]
+            held = 1
 
     # Close any remaining open list
     if in_list:
-        result.append('</ul>' if '<ul>' in '\n'.join(result[-10:]) else '</ol>')
+        result.append('</ul>' if '<ul>' in '\n'.join(result) else '</ol>')
+        held += 1
 
-    return '\n'.join(result)
+    if held:
+        yield from list(result)[-held:]
 
 
-def _convert_tables(html: str) -> str:
+def _convert_tables(lines: Iterable[str]) -> Iterator[str]:
     """Convert markdown tables to HTML tables"""
-    lines = html.split('\n')
-    result = []
     in_table = False
 
-    for i, line in enumerate(lines):
+    for line in lines:
         if '|' in line and line.strip().startswith('|'):
             if not in_table:
-                result.append('<table>')
+                yield '<table>'
                 in_table = True
                 # This is the header row
                 cells = [cell.strip() for cell in line.split('|')[1:-1]]
-                result.append('<thead><tr>')
+                yield '<thead><tr>'
                 for cell in cells:
-                    result.append(f'<th>{cell}</th>')
-                result.append('</tr></thead>')
-                result.append('<tbody>')
+                    yield f'<th>{cell}</th>'
+                yield '</tr></thead>'
+                yield '<tbody>'
             elif '---' in line:
                 # Skip separator row
                 continue
             else:
                 # Data row
                 cells = [cell.strip() for cell in line.split('|')[1:-1]]
-                result.append('<tr>')
+                yield '<tr>'
                 for cell in cells:
-                    result.append(f'<td>{cell}</td>')
-                result.append('</tr>')
+                    yield f'<td>{cell}</td>'
+                yield '</tr>'
         else:
             if in_table:
-                result.append('</tbody></table>')
+                yield '</tbody></table>'
                 in_table = False
-            result.append(line)
+            yield line
 
     if in_table:
-        result.append('</tbody></table>')
-
-    return '\n'.join(result)
+        yield '</tbody></table>'
 
 
-def _convert_paragraphs(html: str) -> str:
+def _convert_paragraphs(lines: Iterable[str]) -> Iterator[str]:
     """Wrap non-HTML lines in paragraph tags"""
-    lines = html.split('\n')
-    result = []
     in_paragraph = False
 
     for line in lines:
@@ -248,9 +271,9 @@ def _convert_paragraphs(html: str) -> str:
         # Skip empty lines
         if not stripped:
             if in_paragraph:
-                result.append('</p>')
+                yield '</p>'
                 in_paragraph = False
-            result.append(line)
+            yield line
             continue
 
         # Skip lines that are already HTML tags
@@ -260,63 +283,72 @@ def _convert_paragraphs(html: str) -> str:
            '<ol' in stripped or '<li' in stripped or '<table' in stripped or \
            '</div>' in stripped or '</ul>' in stripped or '</ol>' in stripped:
             if in_paragraph:
-                result.append('</p>')
+                yield '</p>'
                 in_paragraph = False
-            result.append(line)
+            yield line
             continue
 
         # Regular text line - wrap in paragraph
         if not in_paragraph:
-            result.append('<p>' + line)
+            yield '<p>' + line
             in_paragraph = True
         else:
-            result.append(line)
+            yield line
 
     if in_paragraph:
-        result.append('</p>')
+        yield '</p>'
 
-    return '\n'.join(result)
 
+def _close_sections(lines: Iterable[str]) -> Iterator[str]:
+    """Close each section div before the next section starts, and the last one at the end
 
-def _close_sections(html: str) -> str:
-    """Close all open section divs"""
-    # Count open and closed divs
-    open_divs = html.count('<div class="section">')
-    closed_divs = html.count('</div>')
-
-    # Add closing divs for sections
-    # Each section should be closed before the next section starts
-    lines = html.split('\n')
-    result = []
+    The executive summary heading opens its own div inside its section, which is
+    closed together with that section.
+    """
     section_open = False
+    summaries_open = 0
 
-    for i, line in enumerate(lines):
-        if '<div class="section">' in line:
+    for line in lines:
+        if SECTION_DIV in line:
+            for _ in range(summaries_open):
+                yield '</div>'  # Close executive summary
+            summaries_open = 0
             if section_open:
-                result.append('</div>')  # Close previous section
+                yield '</div>'  # Close previous section
             section_open = True
-        result.append(line)
+        if EXECUTIVE_SUMMARY_TITLE in line:
+            summaries_open += line.count(EXECUTIVE_SUMMARY_TITLE)
+            line = line.replace(EXECUTIVE_SUMMARY_TITLE, EXECUTIVE_SUMMARY_DIV + EXECUTIVE_SUMMARY_TITLE)
+        yield line
 
     # Close final section if still open
+    for _ in range(summaries_open):
+        yield '</div>'
     if section_open:
-        result.append('</div>')
-
-    return '\n'.join(result)
+        yield '</div>'
 
 
 def main():
-    """Test the converter with a sample markdown file"""
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: python md_to_html.py <markdown_file>")
-        sys.exit(1)
-
-    md_file = Path(sys.argv[1])
+    """Convert a markdown report, writing HTML files or printing a preview"""
+    parser = argparse.ArgumentParser(description='Convert a markdown research report to HTML')
+    parser.add_argument('markdown_file', type=Path, help='Markdown report')
+    parser.add_argument('--content-out', type=Path, help='Write the content HTML ({{CONTENT}}) here')
+    parser.add_argument('--bibliography-out', type=Path, help='Write the bibliography HTML ({{BIBLIOGRAPHY}}) here')
+    args = parser.parse_args()
+
+    md_file = args.markdown_file
     if not md_file.exists():
         print(f"Error: File {md_file} not found")
         sys.exit(1)
 
+    if args.content_out and args.bibliography_out:
+        with open(md_file, encoding='utf-8') as src, \
+                open(args.content_out, 'w', encoding='utf-8') as content_out, \
+                open(args.bibliography_out, 'w', encoding='utf-8') as bibliography_out:
+            convert_markdown_stream(src, content_out, bibliography_out)
+        print(f"Wrote {args.content_out} and {args.bibliography_out}")
+        return
+
     markdown_text = md_file.read_text()
     content_html, bib_html = convert_markdown_to_html(markdown_text)
 
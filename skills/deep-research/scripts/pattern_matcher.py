@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Multi-Pattern Matcher
+Finds placeholder and truncation phrases in reports, shared by validate_report.py
+and verify_html.py
+
+Patterns are compiled once. Case-insensitive patterns are matched against a single
+lowercased copy of the text, so every phrase is found with a plain substring search
+and every regex keeps its literal prefix; both run at C speed, which beats combining
+everything into one alternation (CPython's regex engine cannot skip ahead through an
+alternation and tries every branch at every position).
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A phrase or regex to look for. Case-insensitive patterns are written in lowercase."""
+    label: str
+    pattern: str
+    regex: bool = False
+    ignore_case: bool = True
+
+
+@dataclass(frozen=True)
+class Hit:
+    """One occurrence of a pattern in the text"""
+    label: str
+    start: int
+    end: int
+    text: str
+
+
+class PatternMatcher:
+    """Find many phrases and regexes in a text, reporting every hit with its position"""
+
+    def __init__(self, patterns: Iterable[Pattern]):
+        self.patterns = list(patterns)
+        self._compiled = []
+        for p in self.patterns:
+            # Escapes like \D or \S are allowed in regexes; everything else must be lowercase
+            letters = re.sub(r'\\.', '', p.pattern) if p.regex else p.pattern
+            if p.ignore_case and letters != letters.lower():
+                raise ValueError(f"Case-insensitive pattern must be lowercase: {p.pattern!r}")
+            source = p.pattern if p.regex else re.escape(p.pattern)
+            self._compiled.append((
+                re.compile(source) if p.regex else None,
+                # Used when lowercasing changes the text's length and offsets
+                re.compile(source, re.IGNORECASE) if p.ignore_case else None,
+            ))
+
+    def find_all(self, text: str) -> List[Hit]:
+        """All occurrences of every pattern, ordered by position"""
+        folded = _fold(text)
+        hits = [hit for i in range(len(self.patterns)) for hit in self._finditer(i, text, folded)]
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return hits
+
+    def first_hits(self, text: str) -> Dict[str, Hit]:
+        """First occurrence of each label that occurs at all, in pattern order"""
+        folded = _fold(text)
+        found = {}
+        for i, p in enumerate(self.patterns):
+            if p.label not in found:
+                hit = next(self._finditer(i, text, folded), None)
+                if hit:
+                    found[p.label] = hit
+        return found
+
+    def first_hit(self, text: str) -> Optional[Hit]:
+        """First occurrence of the earliest-listed pattern that occurs, or None"""
+        folded = _fold(text)
+        for i in range(len(self.patterns)):
+            hit = next(self._finditer(i, text, folded), None)
+            if hit:
+                return hit
+        return None
+
+    def _finditer(self, index: int, text: str, folded: Optional[str]) -> Iterator[Hit]:
+        p = self.patterns[index]
+        compiled, fallback = self._compiled[index]
+        if p.ignore_case and folded is None:
+            compiled, haystack = fallback, text
+        else:
+            haystack = folded if p.ignore_case else text
+
+        if compiled:
+            for m in compiled.finditer(haystack):
+                yield Hit(p.label, m.start(), m.end(), text[m.start():m.end()])
+            return
+
+        start = haystack.find(p.pattern)
+        while start != -1:
+            end = start + len(p.pattern)
+            yield Hit(p.label, start, end, text[start:end])
+            start = haystack.find(p.pattern, end)
+
+
+def _fold(text: str) -> Optional[str]:
+    """Lowercased text, or None if lowercasing would shift character offsets"""
+    folded = text.lower()
+    return folded if len(folded) == len(text) else None
@@ -5,13 +5,16 @@ Orchestrates comprehensive research across multiple sources with verification an
 """
 
 import argparse
+import asyncio
 import json
+import os
 import sys
 import time
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
@@ -67,20 +70,9 @@ class ResearchState:
     metadata: Dict[str, Any]
 
     def save(self, filepath: Path):
-        """Save research state to file with retry logic"""
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                with open(filepath, 'w') as f:
-                    json.dump(self._serialize(), f, indent=2)
-                return  # Success
-            except (IOError, OSError) as e:
-                if attempt == max_retries - 1:
-                    # Final attempt failed
-                    raise IOError(f"Failed to save state after {max_retries} attempts: {e}")
-                # Wait with exponential backoff before retry
-                wait_time = (attempt + 1) * 0.5  # 0.5s, 1s, 1.5s
-                time.sleep(wait_time)
+        """Save a full snapshot of the research state atomically, with retry logic"""
+        text = json.dumps(self._serialize(), indent=2)
+        _with_retries(lambda: _write_atomic(Path(filepath), text), "save state")
 
     def _serialize(self) -> dict:
         """Convert to serializable dict"""
@@ -99,11 +91,25 @@ class ResearchState:
         }
 
     @classmethod
-    def load(cls, filepath: Path) -> 'ResearchState':
-        """Load research state from file"""
+    def load(cls, filepath: Path, phase: Optional[ResearchPhase] = None) -> 'ResearchState':
+        """
+        Load research state from a snapshot file or a checkpoint log (.jsonl)
+
+        Args:
+            filepath: File written by save() or CheckpointLog
+            phase: For checkpoint logs, the phase to restore (default: latest)
+        """
+        if Path(filepath).suffix == '.jsonl':
+            return CheckpointLog(filepath).load(phase)
+
         with open(filepath, 'r') as f:
             data = json.load(f)
 
+        return cls._deserialize(data)
+
+    @classmethod
+    def _deserialize(cls, data: dict) -> 'ResearchState':
+        """Build a state from its _serialize() form"""
         return cls(
             query=data['query'],
             mode=ResearchMode(data['mode']),
@@ -119,15 +125,309 @@ class ResearchState:
         )
 
 
+# How each state field is checkpointed: lists can grow and change item by item, the
+# report usually grows at the end, everything else is replaced whole when it changes
+LIST_FIELDS = ('sources', 'findings')
+DICT_FIELDS = ('scope', 'plan', 'synthesis', 'critique', 'metadata')
+SCALAR_FIELDS = ('query', 'mode', 'phase')
+
+
+class CheckpointLog:
+    """
+    Append-only JSON Lines log of a research session, one record per checkpoint
+
+    The first record holds the full state; each later one only what changed since the
+    previous checkpoint: fields replaced outright ("set"), list items changed in place
+    ("update"), and items or report text added at the end ("extend"). A record goes to
+    disk in a single fsynced write; a torn last line left by a crash is ignored when
+    loading and cut off before the next append.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._baseline: Optional[dict] = None  # _encode() of the last checkpointed state
+        self._next_seq = 0
+        self._valid_size = 0  # bytes of complete records in the file
+
+    def append(self, state: ResearchState) -> int:
+        """Checkpoint state, writing only what changed; returns the record's sequence number"""
+        if self._baseline is None and self.path.exists():
+            self._resume()
+
+        current = _encode(state)
+        record = {
+            'seq': self._next_seq,
+            'phase': state.phase.value,
+            'saved_at': datetime.now().isoformat(),
+        }
+        if self._baseline is None:
+            record['snapshot'] = state._serialize()
+        else:
+            record.update(_diff(self._baseline, current))
+
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        _with_retries(lambda: self._write(line), "append checkpoint")
+        self._baseline = current
+        self._next_seq += 1
+        return record['seq']
+
+    def checkpoints(self) -> List[Tuple[int, str, str]]:
+        """(seq, phase, saved_at) of every checkpoint in the log"""
+        records, _ = self._read()
+        return [(r['seq'], r['phase'], r['saved_at']) for r in records]
+
+    def load(self, phase: Optional[ResearchPhase] = None, seq: Optional[int] = None) -> ResearchState:
+        """State at the latest checkpoint, at checkpoint seq, or at the last checkpoint taken in phase"""
+        records, _ = self._read()
+        if not records:
+            raise ValueError(f"No checkpoints in {self.path}")
+        if seq is not None:
+            matching = [i for i, r in enumerate(records) if r['seq'] == seq]
+            if not matching:
+                raise ValueError(f"No checkpoint with seq {seq} in {self.path}")
+            records = records[:matching[0] + 1]
+        if phase is not None:
+            matching = [i for i, r in enumerate(records) if r['phase'] == phase.value]
+            if not matching:
+                raise ValueError(f"No checkpoint for phase '{phase.value}' in {self.path}")
+            records = records[:matching[-1] + 1]
+        return ResearchState._deserialize(_replay(records))
+
+    def _resume(self):
+        """Pick up an existing log so the next append is a delta against its latest state"""
+        records, self._valid_size = self._read()
+        if records:
+            self._baseline = _encode(ResearchState._deserialize(_replay(records)))
+            self._next_seq = records[-1]['seq'] + 1
+
+    def _read(self) -> Tuple[List[dict], int]:
+        """Complete records in the log, and the size in bytes they take up"""
+        records, size = [], 0
+        if not self.path.exists():
+            return records, size
+        with open(self.path, 'rb') as f:
+            lines = f.readlines()
+        for line_no, line in enumerate(lines, 1):
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError("incomplete record")
+                records.append(json.loads(line))
+            except ValueError as e:
+                if line_no < len(lines):
+                    raise ValueError(f"Corrupt checkpoint at {self.path}:{line_no}: {e}")
+                break  # Torn write from a crash; the previous checkpoint stands
+            size += len(line)
+        return records, size
+
+    def _write(self, line: bytes):
+        with open(self.path, 'ab') as f:
+            # Drop a torn record (or a failed earlier attempt) before appending
+            f.truncate(self._valid_size)
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._valid_size += len(line)
+
+
+def _encode(state: ResearchState) -> dict:
+    """State with its containers JSON-encoded, to compare against later checkpoints"""
+    encoded = {
+        'query': state.query,
+        'mode': state.mode.value,
+        'phase': state.phase.value,
+        'sources': [json.dumps(asdict(s)) for s in state.sources],
+        'findings': [json.dumps(f) for f in state.findings],
+        'report': state.report,
+    }
+    for name in DICT_FIELDS:
+        encoded[name] = json.dumps(getattr(state, name))
+    return encoded
+
+
+def _diff(old: dict, new: dict) -> dict:
+    """set/update/extend sections taking the encoded state old to new"""
+    replaced, updated, extended = {}, {}, {}
+    for name in SCALAR_FIELDS:
+        if new[name] != old[name]:
+            replaced[name] = new[name]
+    for name in DICT_FIELDS:
+        if new[name] != old[name]:
+            replaced[name] = json.loads(new[name])
+
+    for name in LIST_FIELDS:
+        before, after = old[name], new[name]
+        if len(after) < len(before):
+            replaced[name] = [json.loads(item) for item in after]
+            continue
+        changed = {str(i): json.loads(after[i]) for i in range(len(before)) if after[i] != before[i]}
+        if changed:
+            updated[name] = changed
+        if len(after) > len(before):
+            extended[name] = [json.loads(item) for item in after[len(before):]]
+
+    if new['report'] != old['report']:
+        if new['report'].startswith(old['report']):
+            extended['report'] = new['report'][len(old['report']):]
+        else:
+            replaced['report'] = new['report']
+
+    delta = {}
+    for key, section in [('set', replaced), ('update', updated), ('extend', extended)]:
+        if section:
+            delta[key] = section
+    return delta
+
+
+def _replay(records: List[dict]) -> dict:
+    """_serialize() form of the state after applying records in order"""
+    if 'snapshot' not in records[0]:
+        raise ValueError("Checkpoint log does not start with a snapshot")
+    data = records[0]['snapshot']
+    for record in records[1:]:
+        data.update(record.get('set', {}))
+        for name, items in record.get('update', {}).items():
+            for index, item in items.items():
+                data[name][int(index)] = item
+        for name, value in record.get('extend', {}).items():
+            if name == 'report':
+                data[name] += value
+            else:
+                data[name].extend(value)
+    return data
+
+
+def _write_atomic(path: Path, text: str):
+    """Write text to path via a temporary file and rename, so readers never see a partial file"""
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _with_retries(action: Callable[[], None], what: str):
+    """Run an I/O action, retrying with backoff"""
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            action()
+            return  # Success
+        except (IOError, OSError) as e:
+            if attempt == max_retries - 1:
+                # Final attempt failed
+                raise IOError(f"Failed to {what} after {max_retries} attempts: {e}")
+            # Wait with exponential backoff before retry
+            wait_time = (attempt + 1) * 0.5  # 0.5s, 1s, 1.5s
+            time.sleep(wait_time)
+
+
+# Runs one phase, or one sub-task of it: executor(phase, state, payload) -> result.
+# May be a plain function (run in a worker thread) or a coroutine function.
+PhaseExecutor = Callable[[ResearchPhase, ResearchState, Any], Any]
+
+
+@dataclass
+class Task:
+    """A node in a task graph: a plain or coroutine function and the tasks it waits for"""
+    name: str
+    run: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+
+
+async def run_task_graph(tasks: List[Task], max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run tasks as soon as their dependencies finish, at most max_concurrency at a time
+
+    Returns:
+        Each task's result by name
+
+    Raises:
+        ValueError: If names repeat, a dependency is unknown, or the graph has a cycle
+        Exception: The first error raised by a task; tasks still running are cancelled
+    """
+    by_name = {}
+    for task in tasks:
+        if task.name in by_name:
+            raise ValueError(f"Duplicate task: {task.name}")
+        by_name[task.name] = task
+    for task in tasks:
+        unknown = [dep for dep in task.depends_on if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Task {task.name} depends on unknown tasks: {unknown}")
+    _check_acyclic(tasks)
+
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    futures: Dict[str, asyncio.Future] = {}
+
+    async def run(task: Task):
+        for dep in task.depends_on:
+            await futures[dep]
+        if limit is None:
+            return await _call(task.run)
+        async with limit:
+            return await _call(task.run)
+
+    for task in tasks:
+        futures[task.name] = asyncio.ensure_future(run(task))
+    try:
+        results = await asyncio.gather(*futures.values())
+    except BaseException:
+        for future in futures.values():
+            future.cancel()
+        await asyncio.gather(*futures.values(), return_exceptions=True)
+        raise
+    return dict(zip(futures, results))
+
+
+def _check_acyclic(tasks: List[Task]):
+    """Raise ValueError if the dependencies form a cycle"""
+    waiting = {task.name: len(task.depends_on) for task in tasks}
+    dependents: Dict[str, List[str]] = {task.name: [] for task in tasks}
+    for task in tasks:
+        for dep in task.depends_on:
+            dependents[dep].append(task.name)
+    ready = [name for name, count in waiting.items() if count == 0]
+    while ready:
+        for name in dependents[ready.pop()]:
+            waiting[name] -= 1
+            if waiting[name] == 0:
+                ready.append(name)
+    cycle = sorted(name for name, count in waiting.items() if count)
+    if cycle:
+        raise ValueError(f"Task graph has a cycle through: {cycle}")
+
+
+async def _call(func: Callable[[], Any]) -> Any:
+    """Await a coroutine function, or run a plain one in a worker thread"""
+    if asyncio.iscoroutinefunction(func):
+        return await func()
+    return await asyncio.to_thread(func)
+
+
 class ResearchEngine:
     """Main research orchestration engine"""
 
-    def __init__(self, mode: ResearchMode = ResearchMode.STANDARD):
+    def __init__(
+        self,
+        mode: ResearchMode = ResearchMode.STANDARD,
+        executor: Optional[PhaseExecutor] = None,
+        max_concurrency: int = 4,
+        output_dir: Optional[Path] = None
+    ):
         self.mode = mode
         self.state: Optional[ResearchState] = None
+        self.checkpoints: Optional[CheckpointLog] = None
+        # Default: display each phase's instructions for GLM to carry out
+        self.executor: PhaseExecutor = executor or (lambda phase, state, payload: self.execute_phase(phase))
+        # The default executor ignores payloads, so its phases are never split into sub-tasks
+        self.fan_out = executor is not None
+        self.max_concurrency = max_concurrency
+        # Phase name -> executor result, or list of sub-task results
+        self.phase_results: Dict[str, Any] = {}
         # Use skill-relative path: {skill_path}/research_output
         skill_dir = Path(__file__).parent.parent
-        self.output_dir = skill_dir / "research_output"
+        self.output_dir = output_dir or skill_dir / "research_output"
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def initialize_research(self, query: str) -> ResearchState:
@@ -460,29 +760,78 @@ Save report to file with timestamp.
 
         return result
 
+    def get_phase_subtasks(self, phase: ResearchPhase) -> List[Any]:
+        """
+        Independent pieces of work a phase splits into, each passed to the executor as
+        its payload; an empty list runs the phase as a single task
+        """
+        if phase == ResearchPhase.RETRIEVE:
+            # One retrieval task per planned search query
+            return list(self.state.plan.get('search_queries') or [])
+        return []
+
+    def build_task_graph(self, phases: List[ResearchPhase]) -> List[Task]:
+        """One task per phase, each waiting for the phase before it"""
+        tasks = []
+        for phase in phases:
+            depends_on = [tasks[-1].name] if tasks else []
+            tasks.append(Task(phase.value, partial(self._run_phase, phase), depends_on))
+        return tasks
+
+    async def _run_phase(self, phase: ResearchPhase):
+        """Run a phase (fanning out its sub-tasks), then time and checkpoint it"""
+        self.state.phase = phase
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+        payloads = self.get_phase_subtasks(phase) if self.fan_out else []
+        if payloads:
+            subtasks = [
+                Task(f"{phase.value}[{i}]", partial(self.executor, phase, self.state, payload))
+                for i, payload in enumerate(payloads)
+            ]
+            results = await run_task_graph(subtasks, self.max_concurrency)
+            result = [results[task.name] for task in subtasks]
+        else:
+            result = await _call(partial(self.executor, phase, self.state, None))
+        self.phase_results[phase.value] = result
+
+        # Phases run one after another, so process CPU time over the phase is its own
+        self.state.metadata.setdefault('phase_timings', {})[phase.value] = {
+            'wall_seconds': round(time.perf_counter() - wall_start, 4),
+            'cpu_seconds': round(time.process_time() - cpu_start, 4),
+            'subtasks': len(payloads),
+        }
+
+        # Checkpoint state after each phase
+        self.checkpoints.append(self.state)
+        print(f"\n✓ Phase {phase.value} complete. State saved to: {self.checkpoints.path}\n")
+
     def run_pipeline(self, query: str) -> str:
         """Run complete research pipeline"""
+        return asyncio.run(self.run_pipeline_async(query))
+
+    async def run_pipeline_async(self, query: str) -> str:
+        """Run complete research pipeline from inside an event loop"""
         print(f"\n{'#'*80}")
         print(f"# DEEP RESEARCH ENGINE")
         print(f"# Query: {query}")
         print(f"# Mode: {self.mode.value}")
         print(f"{'#'*80}\n")
 
-        # Initialize research
-        self.initialize_research(query)
+        # Initialize research, unless continuing from a resumed state
+        if self.state is None:
+            self.initialize_research(query)
 
         # Determine phases based on mode
         phases = self._get_phases_for_mode()
 
-        # Execute each phase
-        for phase in phases:
-            self.state.phase = phase
-            result = self.execute_phase(phase)
+        # One checkpoint log per session; each phase appends what it changed
+        if self.checkpoints is None:
+            state_file = self.output_dir / f"research_state_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            self.checkpoints = CheckpointLog(state_file)
 
-            # Save state after each phase
-            state_file = self.output_dir / f"research_state_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            self.state.save(state_file)
-            print(f"\n✓ Phase {phase.value} complete. State saved to: {state_file}\n")
+        # Execute the phases, running independent sub-tasks concurrently
+        await run_task_graph(self.build_task_graph(phases))
 
         # Generate report path
         report_file = self.output_dir / f"research_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
@@ -548,17 +897,31 @@ Examples:
         help='Research depth mode (default: standard)'
     )
 
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=4,
+        help='Sub-tasks (e.g. retrieval queries) run at once within a phase (default: 4)'
+    )
+
     parser.add_argument(
         '--resume',
         type=str,
-        help='Resume from saved state file'
+        help='Resume from saved state file or checkpoint log (.jsonl)'
+    )
+
+    parser.add_argument(
+        '--resume-phase',
+        type=str,
+        choices=[p.value for p in ResearchPhase],
+        help='With a checkpoint log, resume from the state after this phase (default: latest)'
     )
 
     args = parser.parse_args()
 
     # Initialize engine
     mode = ResearchMode(args.mode)
-    engine = ResearchEngine(mode=mode)
+    engine = ResearchEngine(mode=mode, max_concurrency=args.max_concurrency)
 
     if args.resume:
         # Load previous state
@@ -566,7 +929,11 @@ Examples:
         if not state_file.exists():
             print(f"Error: State file not found: {state_file}", file=sys.stderr)
             sys.exit(1)
-        engine.state = ResearchState.load(state_file)
+        phase = ResearchPhase(args.resume_phase) if args.resume_phase else None
+        engine.state = ResearchState.load(state_file, phase)
+        if state_file.suffix == '.jsonl':
+            # Keep checkpointing into the same log
+            engine.checkpoints = CheckpointLog(state_file)
         print(f"Resumed research from: {state_file}")
 
     # Run pipeline
@@ -2,10 +2,15 @@
 """
 Source Credibility Evaluator
 Assesses source quality, credibility, and potential biases
+
+Domains are looked up in a trie of reversed labels, so a rule for 'wikipedia.org'
+also covers 'en.wikipedia.org' and 'nature.com/news' covers that path, in time
+proportional to the number of labels. Everything that depends only on the domain is
+memoized, and evaluate_batch() returns columns that sort and filter cheaply.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Iterable, List, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 from datetime import datetime, timedelta
 import re
@@ -23,6 +28,103 @@ class CredibilityScore:
     recommendation: str  # "high_trust", "moderate_trust", "low_trust", "verify"
 
 
+@dataclass
+class BatchScores:
+    """Credibility scores for many sources, one list per column"""
+    url: List[str]
+    domain: List[str]
+    overall_score: List[float]
+    domain_authority: List[float]
+    recency: List[float]
+    expertise: List[float]
+    bias_score: List[float]
+    factors: List[Dict[str, str]]
+    recommendation: List[str]
+
+    def __len__(self) -> int:
+        return len(self.url)
+
+    def row(self, index: int) -> CredibilityScore:
+        """The full score of one source"""
+        return CredibilityScore(
+            overall_score=self.overall_score[index],
+            domain_authority=self.domain_authority[index],
+            recency=self.recency[index],
+            expertise=self.expertise[index],
+            bias_score=self.bias_score[index],
+            factors=self.factors[index],
+            recommendation=self.recommendation[index]
+        )
+
+    def take(self, indices: Sequence[int]) -> 'BatchScores':
+        """The given rows, in the given order"""
+        return BatchScores(**{
+            f.name: [getattr(self, f.name)[i] for i in indices] for f in fields(self)
+        })
+
+    def sort_by(self, column: str = 'overall_score', descending: bool = True) -> 'BatchScores':
+        """Rows ordered by one column (stable, so ties keep their input order)"""
+        values = getattr(self, column)
+        return self.take(sorted(range(len(self)), key=values.__getitem__, reverse=descending))
+
+    def filter(self, column: str, predicate: Callable[[Any], bool]) -> 'BatchScores':
+        """Rows whose value in column satisfies predicate"""
+        return self.take([i for i, value in enumerate(getattr(self, column)) if predicate(value)])
+
+
+class DomainTrie:
+    """
+    Domain rules keyed by reversed labels: 'nature.com/news' is stored under
+    com -> nature -> /news. The most specific matching rule wins.
+    """
+
+    def __init__(self):
+        self._root: Dict[str, dict] = {}
+
+    def add(self, rule: str, value: Any):
+        host, _, path = rule.partition('/')
+        node = self._root
+        for label in reversed(host.split('.')):
+            node = node.setdefault(label, {})
+        for segment in filter(None, path.split('/')):
+            node = node.setdefault('/' + segment, {})
+        node[None] = value
+
+    def match_host(self, host: str) -> Tuple[Any, Optional[dict]]:
+        """
+        Value of the longest rule matching host or a parent domain of it, and the
+        node for host itself if path rules hang off it
+        """
+        node, value = self._root, None
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                return value, None
+            value = node.get(None, value)
+        has_paths = any(key is not None and key.startswith('/') for key in node)
+        return value, node if has_paths else None
+
+    @staticmethod
+    def match_path(node: dict, path: str, value: Any) -> Any:
+        """Value of the longest path rule under a match_host() node, else value"""
+        for segment in filter(None, path.split('/')):
+            node = node.get('/' + segment)
+            if node is None:
+                break
+            value = node.get(None, value)
+        return value
+
+
+class _DomainProfile(NamedTuple):
+    """Everything about a source's score that depends only on its domain"""
+    authority: float
+    path_rules: Optional[dict]  # trie node for domain-specific path rules
+    academic: bool    # expertise bonus
+    government: bool  # expertise bonus
+    documentation: bool  # expertise bonus
+    neutral: bool     # bias bonus
+
+
 class SourceEvaluator:
     """Evaluates source credibility and quality"""
 
@@ -65,8 +167,24 @@ class SourceEvaluator:
         'blogspot.com', 'wordpress.com', 'wix.com', 'substack.com'
     ]
 
+    SENSATIONAL_INDICATORS = [
+        '!', 'shocking', 'unbelievable', 'you won\'t believe',
+        'secret', 'they don\'t want you to know'
+    ]
+
+    BALANCED_INDICATORS = ['however', 'although', 'on the other hand', 'critics argue']
+
     def __init__(self):
-        pass
+        # Lower tiers first, so a domain listed twice keeps its higher tier
+        self._authority = DomainTrie()
+        for domains, score in [
+            (self.LOW_AUTHORITY_INDICATORS, 40.0),
+            (self.MODERATE_AUTHORITY_DOMAINS, 70.0),
+            (self.HIGH_AUTHORITY_DOMAINS, 90.0),
+        ]:
+            for domain in domains:
+                self._authority.add(domain, score)
+        self._profiles: Dict[str, _DomainProfile] = {}
 
     def evaluate_source(
         self,
@@ -78,20 +196,8 @@ class SourceEvaluator:
     ) -> CredibilityScore:
         """Evaluate source credibility"""
 
-        domain = self._extract_domain(url)
-
-        # Calculate component scores
-        domain_score = self._evaluate_domain_authority(domain)
-        recency_score = self._evaluate_recency(publication_date)
-        expertise_score = self._evaluate_expertise(domain, title, author)
-        bias_score = self._evaluate_bias(domain, title, content)
-
-        # Calculate overall score (weighted average)
-        overall = (
-            domain_score * 0.35 +
-            recency_score * 0.20 +
-            expertise_score * 0.25 +
-            bias_score * 0.20
+        domain, overall, domain_score, recency_score, expertise_score, bias_score = self._score(
+            url, title, content, publication_date, author, datetime.now()
         )
 
         # Determine factors
@@ -112,34 +218,97 @@ class SourceEvaluator:
             recommendation=recommendation
         )
 
-    def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL"""
+    def evaluate_batch(self, sources: Iterable[Mapping[str, Any]]) -> BatchScores:
+        """
+        Evaluate many sources at once
+
+        Args:
+            sources: Mappings of evaluate_source() arguments (url, title, and
+                optionally content, publication_date, author)
+
+        Returns:
+            Scores as columns, in input order
+        """
+        now = datetime.now()
+        columns = BatchScores([], [], [], [], [], [], [], [], [])
+        for source in sources:
+            domain, overall, domain_score, recency_score, expertise_score, bias_score = self._score(
+                source['url'], source['title'], source.get('content'),
+                source.get('publication_date'), source.get('author'), now
+            )
+            columns.url.append(source['url'])
+            columns.domain.append(domain)
+            columns.overall_score.append(round(overall, 2))
+            columns.domain_authority.append(round(domain_score, 2))
+            columns.recency.append(round(recency_score, 2))
+            columns.expertise.append(round(expertise_score, 2))
+            columns.bias_score.append(round(bias_score, 2))
+            columns.factors.append(self._identify_factors(
+                domain, domain_score, recency_score, expertise_score, bias_score
+            ))
+            columns.recommendation.append(self._generate_recommendation(overall))
+        return columns
+
+    def _score(
+        self,
+        url: str,
+        title: str,
+        content: Optional[str],
+        publication_date: Optional[str],
+        author: Optional[str],
+        now: datetime
+    ) -> Tuple[str, float, float, float, float, float]:
+        """Domain, overall score and component scores of one source"""
         parsed = urlparse(url)
-        domain = parsed.netloc.lower()
-        # Remove www prefix
-        domain = domain.replace('www.', '')
-        return domain
+        domain = parsed.netloc.lower().replace('www.', '')
 
-    def _evaluate_domain_authority(self, domain: str) -> float:
+        # Calculate component scores
+        domain_score = self._evaluate_domain_authority(domain, parsed.path)
+        recency_score = self._evaluate_recency(publication_date, now)
+        expertise_score = self._evaluate_expertise(domain, title, author)
+        bias_score = self._evaluate_bias(domain, title, content)
+
+        # Calculate overall score (weighted average)
+        overall = (
+            domain_score * 0.35 +
+            recency_score * 0.20 +
+            expertise_score * 0.25 +
+            bias_score * 0.20
+        )
+        return domain, overall, domain_score, recency_score, expertise_score, bias_score
+
+    def _domain_profile(self, domain: str) -> _DomainProfile:
+        """Domain-dependent parts of the score, computed once per domain"""
+        profile = self._profiles.get(domain)
+        if profile is None:
+            authority, path_rules = self._authority.match_host(domain)
+            profile = _DomainProfile(
+                # Unknown domain - moderate skepticism
+                authority=55.0 if authority is None else authority,
+                path_rules=path_rules,
+                academic=any(d in domain for d in ['arxiv', 'nature', 'science', 'ieee', 'acm']),
+                government='.gov' in domain or 'who.int' in domain,
+                documentation='docs.' in domain,
+                neutral=any(d in domain for d in ['arxiv', 'nature', 'science', 'ieee']),
+            )
+            self._profiles[domain] = profile
+        return profile
+
+    def _evaluate_domain_authority(self, domain: str, path: str = '') -> float:
         """Evaluate domain authority (0-100)"""
-        if domain in self.HIGH_AUTHORITY_DOMAINS:
-            return 90.0
-        elif domain in self.MODERATE_AUTHORITY_DOMAINS:
-            return 70.0
-        elif any(indicator in domain for indicator in self.LOW_AUTHORITY_INDICATORS):
-            return 40.0
-        else:
-            # Unknown domain - moderate skepticism
-            return 55.0
+        profile = self._domain_profile(domain)
+        if profile.path_rules is not None:
+            return DomainTrie.match_path(profile.path_rules, path, profile.authority)
+        return profile.authority
 
-    def _evaluate_recency(self, publication_date: Optional[str]) -> float:
+    def _evaluate_recency(self, publication_date: Optional[str], now: Optional[datetime] = None) -> float:
         """Evaluate information recency (0-100)"""
         if not publication_date:
             return 50.0  # Unknown date
 
         try:
             pub_date = datetime.fromisoformat(publication_date.replace('Z', '+00:00'))
-            age = datetime.now() - pub_date
+            age = (now or datetime.now()) - pub_date
 
             # Recency scoring
             if age < timedelta(days=90):  # < 3 months
@@ -164,17 +333,18 @@ class SourceEvaluator:
     ) -> float:
         """Evaluate source expertise (0-100)"""
         score = 50.0
+        profile = self._domain_profile(domain)
 
         # Academic/research domains get high expertise
-        if any(d in domain for d in ['arxiv', 'nature', 'science', 'ieee', 'acm']):
+        if profile.academic:
             score += 30
 
         # Government/official sources
-        if '.gov' in domain or 'who.int' in domain:
+        if profile.government:
             score += 25
 
         # Technical documentation
-        if 'docs.' in domain or 'documentation' in title.lower():
+        if profile.documentation or 'documentation' in title.lower():
             score += 20
 
         # Author credentials (if available)
@@ -194,23 +364,19 @@ class SourceEvaluator:
         score = 70.0  # Start neutral
 
         # Check for sensationalism in title
-        sensational_indicators = [
-            '!', 'shocking', 'unbelievable', 'you won\'t believe',
-            'secret', 'they don\'t want you to know'
-        ]
         title_lower = title.lower()
-        if any(indicator in title_lower for indicator in sensational_indicators):
+        if any(indicator in title_lower for indicator in self.SENSATIONAL_INDICATORS):
             score -= 20
 
         # Academic sources are typically less biased
-        if any(d in domain for d in ['arxiv', 'nature', 'science', 'ieee']):
+        if self._domain_profile(domain).neutral:
             score += 20
 
         # Check for balance in content (if available)
         if content:
             # Look for balanced language
-            balanced_indicators = ['however', 'although', 'on the other hand', 'critics argue']
-            if any(indicator in content.lower() for indicator in balanced_indicators):
+            content_lower = content.lower()
+            if any(indicator in content_lower for indicator in self.BALANCED_INDICATORS):
                 score += 10
 
         return min(max(score, 0), 100.0)
@@ -7,8 +7,130 @@ Ensures research reports meet quality standards before delivery
 import argparse
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional
+
+from pattern_matcher import Pattern, PatternMatcher
+
+CITATION_RE = re.compile(r'\[(\d+)\]')
+LINK_RE = re.compile(r'\[.*?\]\((\./.*?)\)')
+
+REQUIRED_SECTIONS = [
+    "Executive Summary",
+    "Introduction",
+    "Main Analysis",
+    "Synthesis",
+    "Limitations",
+    "Recommendations",
+    "Bibliography",
+    "Methodology"
+]
+
+# Recommended sections (warnings if missing, not errors)
+RECOMMENDED_SECTIONS = [
+    "Counterevidence Register",
+    "Claims-Evidence Table"
+]
+
+PLACEHOLDER_MATCHER = PatternMatcher(
+    Pattern(placeholder, placeholder, ignore_case=False)
+    for placeholder in [
+        'TBD', 'TODO', 'FIXME', 'XXX',
+        '[citation needed]', '[needs citation]',
+        '[placeholder]', '[TODO]', '[TBD]'
+    ]
+)
+
+# CRITICAL: Truncation placeholders in the bibliography (2025 CiteGuard enhancement)
+BIBLIOGRAPHY_TRUNCATION_MATCHER = PatternMatcher([
+    Pattern('Citation range (e.g., [8-75])', r'\[\d+-\d+\]', regex=True),
+    Pattern('Phrase "Additional citations"', r'additional.*citations', regex=True),
+    Pattern('Phrase "would be included"', 'would be included'),
+    Pattern('Pattern "[...continue"', '[...continue'),
+    Pattern('Pattern "[Continue with"', '[continue with'),
+    Pattern('Standalone "etc."', r'etc\.(?!\w)', regex=True),
+    Pattern('Phrase "and so on"', 'and so on'),
+])
+
+# Content truncation patterns (2025 Progressive Assembly enhancement)
+CONTENT_TRUNCATION_MATCHER = PatternMatcher([
+    Pattern('Phrase "Content continues"', 'content continues'),
+    Pattern('Phrase "Due to length"', 'due to length'),
+    Pattern('Phrase "would continue"', 'would continue'),
+    Pattern('Pattern "[Sections X-Y"', r'\[sections \d+-\d+', regex=True),
+    Pattern('Phrase "Additional sections"', 'additional sections'),
+    Pattern('Pattern "comprehensive...document that continues"',
+            r'comprehensive.*word document that continues', regex=True),
+])
+
+
+@dataclass
+class Section:
+    """A '##' heading and the lines up to the next heading of any level"""
+    title: str
+    line: int  # line number of the heading
+    end: int   # line number of the next heading, or one past the last line
+    level: int = 2  # number of '#'s in the heading
+
+
+class ReportModel:
+    """Everything the checks need, collected in a single pass over the report's lines"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lines = content.split('\n')
+        self.word_count = 0
+        self.sections: List[Section] = []
+        self.bibliography_section: Optional[Section] = None
+        # (number, line) of every [n] in the report
+        self.citations: List[Tuple[str, int]] = []
+        # (number, line) of the [n] that start a line in the bibliography
+        self.bibliography: List[Tuple[str, int]] = []
+        # (target, line) of every internal [text](./path) link
+        self.links: List[Tuple[str, int]] = []
+
+        in_bibliography = False
+        for line_no, line in enumerate(self.lines, 1):
+            self.word_count += len(line.split())
+
+            heading = line.lstrip()
+            if heading.startswith('##'):
+                if self.sections:
+                    self.sections[-1].end = line_no
+                title = heading.lstrip('#')
+                section = Section(title.strip(), line_no, len(self.lines) + 1, len(heading) - len(title))
+                self.sections.append(section)
+                if self.bibliography_section is None and 'bibliography' in section.title.lower():
+                    self.bibliography_section = section
+                in_bibliography = section is self.bibliography_section
+
+            if '[' in line:
+                for m in CITATION_RE.finditer(line):
+                    self.citations.append((m.group(1), line_no))
+                    if in_bibliography and m.start() == 0:
+                        self.bibliography.append((m.group(1), line_no))
+                if '](./' in line:
+                    for m in LINK_RE.finditer(line):
+                        self.links.append((m.group(1), line_no))
+
+    def section(self, name: str) -> Optional[Section]:
+        """First section whose heading contains name (case-insensitive)"""
+        name = name.lower()
+        for section in self.sections:
+            if name in section.title.lower():
+                return section
+        return None
+
+    def text(self, section: Section) -> str:
+        """Text of a section, without its heading line"""
+        return '\n'.join(self.lines[section.line:section.end - 1])
+
+    def line_of(self, offset: int, section: Optional[Section] = None) -> int:
+        """Line number of a character offset in the report, or in a section's text"""
+        if section:
+            return section.line + 1 + self.text(section).count('\n', 0, offset)
+        return self.content.count('\n', 0, offset) + 1
 
 
 class ReportValidator:
@@ -17,6 +139,7 @@ class ReportValidator:
     def __init__(self, report_path: Path):
         self.report_path = report_path
         self.content = self._read_report()
+        self.model = ReportModel(self.content)
         self.errors: List[str] = []
         self.warnings: List[str] = []
 
@@ -61,15 +184,13 @@ class ReportValidator:
 
     def _check_executive_summary(self) -> bool:
         """Check executive summary exists and is under 250 words"""
-        pattern = r'## Executive Summary(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
+        section = self.model.section("Executive Summary")
 
-        if not match:
+        if not section:
             self.errors.append("Missing 'Executive Summary' section")
             return False
 
-        summary = match.group(1).strip()
-        word_count = len(summary.split())
+        word_count = len(self.model.text(section).split())
 
         if word_count > 250:
             self.warnings.append(f"Executive summary too long: {word_count} words (should be ≤250)")
@@ -81,37 +202,14 @@ class ReportValidator:
 
     def _check_required_sections(self) -> bool:
         """Check all required sections are present"""
-        required = [
-            "Executive Summary",
-            "Introduction",
-            "Main Analysis",
-            "Synthesis",
-            "Limitations",
-            "Recommendations",
-            "Bibliography",
-            "Methodology"
-        ]
-
-        # Recommended sections (warnings if missing, not errors)
-        recommended = [
-            "Counterevidence Register",
-            "Claims-Evidence Table"
-        ]
-
-        missing = []
-        for section in required:
-            if not re.search(rf'##.*{section}', self.content, re.IGNORECASE):
-                missing.append(section)
+        missing = [s for s in REQUIRED_SECTIONS if not self.model.section(s)]
 
         if missing:
             self.errors.append(f"Missing sections: {', '.join(missing)}")
             return False
 
         # Check recommended sections (warnings only)
-        missing_recommended = []
-        for section in recommended:
-            if not re.search(rf'##.*{section}', self.content, re.IGNORECASE):
-                missing_recommended.append(section)
+        missing_recommended = [s for s in RECOMMENDED_SECTIONS if not self.model.section(s)]
 
         if missing_recommended:
             self.warnings.append(f"Missing recommended sections (for academic rigor): {', '.join(missing_recommended)}")
@@ -120,105 +218,83 @@ class ReportValidator:
 
     def _check_citations(self) -> bool:
         """Check citation format and presence"""
-        # Find all citation references [1], [2], etc.
-        citations = re.findall(r'\[(\d+)\]', self.content)
-
-        if not citations:
+        if not self.model.citations:
             self.errors.append("No citations found in report")
             return False
 
-        unique_citations = set(citations)
+        unique_citations = {num for num, _ in self.model.citations}
 
         if len(unique_citations) < 10:
             self.warnings.append(f"Only {len(unique_citations)} unique sources cited (recommended: ≥10)")
 
         # Check for consecutive citation numbers
-        citation_nums = sorted([int(c) for c in unique_citations])
-        if citation_nums:
-            max_citation = max(citation_nums)
-            expected = set(range(1, max_citation + 1))
-            missing = expected - set(citation_nums)
+        citation_nums = {int(c) for c in unique_citations}
+        missing = set(range(1, max(citation_nums) + 1)) - citation_nums
 
-            if missing:
-                self.warnings.append(f"Non-consecutive citation numbers, missing: {sorted(missing)}")
+        if missing:
+            self.warnings.append(f"Non-consecutive citation numbers, missing: {sorted(missing)}")
 
         return True
 
     def _check_bibliography(self) -> bool:
         """Check bibliography exists, matches citations, and has no truncation placeholders"""
-        pattern = r'## Bibliography(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
+        section = self.model.bibliography_section
 
-        if not match:
+        if not section:
             self.errors.append("Missing 'Bibliography' section")
             return False
 
-        bib_section = match.group(1)
-
-        # CRITICAL: Check for truncation placeholders (2025 CiteGuard enhancement)
-        truncation_patterns = [
-            (r'\[\d+-\d+\]', 'Citation range (e.g., [8-75])'),
-            (r'Additional.*citations', 'Phrase "Additional citations"'),
-            (r'would be included', 'Phrase "would be included"'),
-            (r'\[\.\.\.continue', 'Pattern "[...continue"'),
-            (r'\[Continue with', 'Pattern "[Continue with"'),
-            (r'etc\.(?!\w)', 'Standalone "etc."'),
-            (r'and so on', 'Phrase "and so on"'),
-        ]
+        bib_section = self.model.text(section)
 
-        for pattern_re, description in truncation_patterns:
-            if re.search(pattern_re, bib_section, re.IGNORECASE):
-                self.errors.append(f"⚠️ CRITICAL: Bibliography contains truncation placeholder: {description}")
-                self.errors.append(f"   This makes the report UNUSABLE - complete bibliography required")
-                return False
+        hit = BIBLIOGRAPHY_TRUNCATION_MATCHER.first_hit(bib_section)
+        if hit:
+            line = self.model.line_of(hit.start, section)
+            self.errors.append(f"⚠️ CRITICAL: Bibliography contains truncation placeholder: {hit.label} (line {line})")
+            self.errors.append(f"   This makes the report UNUSABLE - complete bibliography required")
+            return False
 
-        # Count bibliography entries [1], [2], etc.
-        bib_entries = re.findall(r'^\[(\d+)\]', bib_section, re.MULTILINE)
+        bib_entries = self.model.bibliography
 
         if not bib_entries:
             self.errors.append("Bibliography has no entries")
             return False
 
         # Check citation number continuity (no gaps)
-        bib_nums = sorted([int(n) for n in bib_entries])
-        if bib_nums:
-            expected = list(range(1, bib_nums[-1] + 1))
-            actual = bib_nums
-            missing = [n for n in expected if n not in actual]
-            if missing:
-                self.errors.append(f"Bibliography has gaps in numbering: missing {missing}")
-                return False
-
-        # Find citations in text
-        text_citations = set(re.findall(r'\[(\d+)\]', self.content))
-        bib_citations = set(bib_entries)
+        bib_nums = {int(num) for num, _ in bib_entries}
+        missing = sorted(set(range(1, max(bib_nums) + 1)) - bib_nums)
+        if missing:
+            self.errors.append(f"Bibliography has gaps in numbering: missing {missing}")
+            return False
+
+        # Line of the first occurrence of each citation in the text
+        text_citations: Dict[str, int] = {}
+        for num, line in self.model.citations:
+            text_citations.setdefault(num, line)
+        bib_citations = {num for num, _ in bib_entries}
 
         # Check all citations have bibliography entries
-        missing_in_bib = text_citations - bib_citations
+        missing_in_bib = sorted(set(text_citations) - bib_citations, key=int)
         if missing_in_bib:
-            self.errors.append(f"Citations missing from bibliography: {sorted(missing_in_bib)}")
+            details = ', '.join(
+                f"[{num}] (line {text_citations[num]})" for num in missing_in_bib
+            )
+            self.errors.append(f"Citations missing from bibliography: {details}")
             return False
 
         # Check for unused bibliography entries
-        unused = bib_citations - text_citations
+        unused = bib_citations - set(text_citations)
         if unused:
-            self.warnings.append(f"Unused bibliography entries: {sorted(unused)}")
+            self.warnings.append(f"Unused bibliography entries: {sorted(unused, key=int)}")
 
         return True
 
     def _check_placeholders(self) -> bool:
         """Check for placeholder text that shouldn't be in final report"""
-        placeholders = [
-            'TBD', 'TODO', 'FIXME', 'XXX',
-            '[citation needed]', '[needs citation]',
-            '[placeholder]', '[TODO]', '[TBD]'
+        found_placeholders = [
+            f"{label} (line {self.model.line_of(hit.start)})"
+            for label, hit in PLACEHOLDER_MATCHER.first_hits(self.content).items()
         ]
 
-        found_placeholders = []
-        for placeholder in placeholders:
-            if placeholder in self.content:
-                found_placeholders.append(placeholder)
-
         if found_placeholders:
             self.errors.append(f"Found placeholder text: {', '.join(found_placeholders)}")
             return False
@@ -227,26 +303,18 @@ class ReportValidator:
 
     def _check_content_truncation(self) -> bool:
         """Check for content truncation patterns (2025 Progressive Assembly enhancement)"""
-        truncation_patterns = [
-            (r'Content continues', 'Phrase "Content continues"'),
-            (r'Due to length', 'Phrase "Due to length"'),
-            (r'would continue', 'Phrase "would continue"'),
-            (r'\[Sections \d+-\d+', 'Pattern "[Sections X-Y"'),
-            (r'Additional sections', 'Phrase "Additional sections"'),
-            (r'comprehensive.*word document that continues', 'Pattern "comprehensive...document that continues"'),
-        ]
-
-        for pattern_re, description in truncation_patterns:
-            if re.search(pattern_re, self.content, re.IGNORECASE):
-                self.errors.append(f"⚠️ CRITICAL: Content truncation detected: {description}")
-                self.errors.append(f"   Report is INCOMPLETE and UNUSABLE - regenerate with progressive assembly")
-                return False
+        hit = CONTENT_TRUNCATION_MATCHER.first_hit(self.content)
+        if hit:
+            line = self.model.line_of(hit.start)
+            self.errors.append(f"⚠️ CRITICAL: Content truncation detected: {hit.label} (line {line})")
+            self.errors.append(f"   Report is INCOMPLETE and UNUSABLE - regenerate with progressive assembly")
+            return False
 
         return True
 
     def _check_word_count(self) -> bool:
         """Check overall report length"""
-        word_count = len(self.content.split())
+        word_count = self.model.word_count
 
         if word_count < 500:
             self.warnings.append(f"Report is very short: {word_count} words (consider expanding)")
@@ -256,16 +324,10 @@ class ReportValidator:
 
     def _check_source_count(self) -> bool:
         """Check minimum source count"""
-        pattern = r'## Bibliography(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
-
-        if not match:
+        if not self.model.bibliography_section:
             return True  # Already caught in bibliography check
 
-        bib_section = match.group(1)
-        bib_entries = re.findall(r'^\[(\d+)\]', bib_section, re.MULTILINE)
-
-        source_count = len(set(bib_entries))
+        source_count = len({num for num, _ in self.model.bibliography})
 
         if source_count < 10:
             self.warnings.append(f"Only {source_count} sources (recommended: ≥10)")
@@ -274,17 +336,16 @@ class ReportValidator:
 
     def _check_broken_references(self) -> bool:
         """Check for broken internal references"""
-        # Find all markdown links [text](./path)
-        internal_links = re.findall(r'\[.*?\]\((\.\/.*?)\)', self.content)
-
         broken = []
-        for link in internal_links:
+        checked: Dict[str, bool] = {}
+        for link, line in self.model.links:
             # Remove anchor if present
             link_path = link.split('#')[0]
-            full_path = self.report_path.parent / link_path
+            if link_path not in checked:
+                checked[link_path] = (self.report_path.parent / link_path).exists()
 
-            if not full_path.exists():
-                broken.append(link)
+            if not checked[link_path]:
+                broken.append(f"{link} (line {line})")
 
         if broken:
             self.errors.append(f"Broken internal links: {', '.join(broken)}")
@@ -18,6 +18,8 @@ Enhanced in 2025 with:
 Usage:
     python verify_citations.py --report [path]
     python verify_citations.py --report [path] --strict  # Fail on any unverified
+    python verify_citations.py --report [path] --workers 16 --host-interval 0.2
+    python verify_citations.py --report [path] --offline  # Use cached results only
 
 Does NOT require API keys - uses free DOI resolver and heuristics.
 """
@@ -25,35 +27,396 @@ Does NOT require API keys - uses free DOI resolver and heuristics.
 import sys
 import argparse
 import re
+import threading
+import base64
+import hashlib
+import http.client
+import sqlite3
+import urllib.request
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
-from urllib import request, error
-from urllib.parse import quote
+from typing import List, Dict, Tuple, Optional
+from urllib.parse import quote, unquote, urljoin, urlsplit
 import json
 import time
 
+DOI_RESOLVER = "https://doi.org"
+USER_AGENT = 'Mozilla/5.0 (Research Citation Verifier)'
+MAX_REDIRECTS = 5
+
+DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'deep-research' / 'citation_cache.sqlite3'
+DOI_TTL = 30 * 86400        # DOI metadata rarely changes
+URL_TTL = 7 * 86400         # Reachable URLs are re-checked weekly
+NEGATIVE_TTL = 86400        # 404/410 results are re-checked daily
+DOI_NOT_FOUND = 'DOI not found (404)'
+NOT_CACHED_OFFLINE = 'Not in cache (offline mode)'
+
+# Bibliography parsing patterns, compiled once
+BIBLIOGRAPHY_SECTION_RE = re.compile(r'## Bibliography(.*?)(?=##|\Z)', re.DOTALL | re.IGNORECASE)
+ENTRY_START_RE = re.compile(r'^\[(\d+)\]\s+(.+)$')
+YEAR_RE = re.compile(r'\((\d{4})\)')
+TITLE_RE = re.compile(r'"([^"]+)"')
+DOI_RE = re.compile(r'doi\.org/(10\.\S+)')
+URL_RE = re.compile(r'https?://[^\s\)]+')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# Hallucination detection patterns (2025 CiteGuard enhancement)
+SUSPICIOUS_PATTERNS = [
+    # Generic academic-sounding but fake patterns
+    (re.compile(r'^(A |An |The )?(Study|Analysis|Review|Survey|Investigation) (of|on|into)', re.IGNORECASE),
+     "Generic academic title pattern"),
+    (re.compile(r'^(Recent|Current|Modern|Contemporary) (Advances|Developments|Trends) in', re.IGNORECASE),
+     "Generic 'advances' title pattern"),
+    # Too perfect, templated titles
+    (re.compile(r'^[A-Z][a-z]+ [A-Z][a-z]+: A (Comprehensive|Complete|Systematic) (Review|Analysis|Guide)$', re.IGNORECASE),
+     "Too perfect, templated structure"),
+]
+GENERIC_WORDS = ('overview', 'introduction', 'guide', 'handbook', 'manual')
+PLACEHOLDER_WORDS = ('tbd', 'todo', 'placeholder', 'example')
+MODERN_AI_WORDS = ('ai', 'llm', 'gpt', 'transformer')
+
+# Near-duplicate detection: MinHash signatures bucketed by LSH bands, then
+# confirmed with exact Jaccard similarity on the title token sets
+MINHASH_PERMUTATIONS = 32
+LSH_BANDS = 8
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MIN_TOKENS_FOR_NEAR_DUPLICATE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_MINHASH_PARAMS = [
+    (int.from_bytes(hashlib.blake2b(f'a{i}'.encode(), digest_size=8).digest(), 'big') % _MERSENNE_PRIME | 1,
+     int.from_bytes(hashlib.blake2b(f'b{i}'.encode(), digest_size=8).digest(), 'big') % _MERSENNE_PRIME)
+    for i in range(MINHASH_PERMUTATIONS)
+]
+
+
+@lru_cache(maxsize=4096)
+def normalize_title(title: str) -> frozenset:
+    """Lowercase, strip punctuation and split a title into a token set"""
+    return frozenset(NON_WORD_RE.sub(' ', title.lower()).split())
+
+
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def minhash_signature(tokens: frozenset) -> Tuple[int, ...]:
+    """MinHash signature of a token set (one minimum per permutation)"""
+    hashes = [_token_hash(t) for t in tokens]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _MINHASH_PARAMS
+    )
+
+
+def jaccard(tokens1: frozenset, tokens2: frozenset) -> float:
+    if not tokens1 or not tokens2:
+        return 0.0
+    return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
+
+def find_duplicate_citations(entries: List[Dict],
+                             threshold: float = NEAR_DUPLICATE_THRESHOLD) -> Dict[str, List[str]]:
+    """
+    Flag repeated and near-duplicate bibliography entries in near-linear time.
+
+    Exact duplicates are found by hashing DOI, URL and normalized title;
+    near-duplicate titles are found by MinHash/LSH candidate generation
+    followed by an exact Jaccard check, so only likely pairs are compared.
+
+    Returns a mapping of citation number -> list of issues.
+    """
+    issues: Dict[str, List[str]] = {}
+    flagged = set()
+
+    def flag(later: Dict, earlier: Dict, reason: str):
+        pair = (earlier['num'], later['num'])
+        if pair in flagged:
+            return
+        flagged.add(pair)
+        issues.setdefault(later['num'], []).append(f"{reason} [{earlier['num']}]")
+
+    # Exact duplicates by identifier
+    for key, reason in (('doi', 'Same DOI as'), ('url', 'Same URL as')):
+        first_seen: Dict[str, Dict] = {}
+        for entry in entries:
+            value = entry.get(key)
+            if not value:
+                continue
+            value = value.lower().rstrip('/.')
+            if value in first_seen:
+                flag(entry, first_seen[value], reason)
+            else:
+                first_seen[value] = entry
+
+    # Exact and near-duplicate titles
+    first_title: Dict[frozenset, Dict] = {}
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[Tuple[Dict, frozenset]]] = {}
+    rows = MINHASH_PERMUTATIONS // LSH_BANDS
+
+    for entry in entries:
+        tokens = entry.get('title_tokens')
+        if tokens is None:
+            tokens = normalize_title(entry['title']) if entry.get('title') else frozenset()
+        if not tokens:
+            continue
+
+        if tokens in first_title:
+            flag(entry, first_title[tokens], 'Duplicate title of')
+            continue
+        first_title[tokens] = entry
+
+        if len(tokens) < MIN_TOKENS_FOR_NEAR_DUPLICATE:
+            continue
+
+        signature = minhash_signature(tokens)
+        candidates = {}
+        for band in range(LSH_BANDS):
+            bucket = buckets.setdefault((band, signature[band * rows:(band + 1) * rows]), [])
+            for other, other_tokens in bucket:
+                candidates[other['num']] = (other, other_tokens)
+            bucket.append((entry, tokens))
+
+        for other, other_tokens in candidates.values():
+            similarity = jaccard(tokens, other_tokens)
+            if similarity >= threshold:
+                flag(entry, other, f'Near-duplicate title ({similarity:.0%} similar) of')
+
+    return issues
+
+
+class VerificationCache:
+    """
+    On-disk SQLite cache of DOI metadata and URL reachability.
+
+    Shared across runs (and safe for concurrent runs via WAL mode). Each
+    entry has an expiry; lookups ignore expired entries unless allow_stale
+    is set, which offline mode uses to rely on whatever is cached.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' kind TEXT NOT NULL,'
+            ' key TEXT NOT NULL,'
+            ' ok INTEGER NOT NULL,'
+            ' payload TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' PRIMARY KEY (kind, key))'
+        )
+        self._conn.commit()
+
+    def get(self, kind: str, key: str, allow_stale: bool = False) -> Optional[Tuple[bool, object]]:
+        """Return (ok, payload) for a cached result, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT ok, payload, expires_at FROM entries WHERE kind = ? AND key = ?',
+                (kind, key)
+            ).fetchone()
+        if row is None:
+            return None
+        ok, payload, expires_at = row
+        if not allow_stale and expires_at < time.time():
+            return None
+        return bool(ok), json.loads(payload)
+
+    def put(self, kind: str, key: str, ok: bool, payload: object, ttl: float):
+        """Store a result that stays fresh for ttl seconds"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (kind, key, ok, payload, expires_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (kind, key, int(ok), json.dumps(payload), time.time() + ttl)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class HostRateLimiter:
+    """Enforce a minimum interval between request starts to the same host"""
+
+    def __init__(self, min_interval: float = 0.2):
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str):
+        """Block until a request to host may start"""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class HTTPConnectionPool:
+    """
+    Thread-safe keep-alive connection pool keyed by (scheme, host, port).
+
+    Idle connections are reused across requests to the same host, so
+    verifying many DOIs pays for the TLS handshake with doi.org once per
+    worker instead of once per citation. Redirects are followed.
+
+    Proxies are honored like urllib does: by default they come from the
+    environment (HTTP_PROXY/HTTPS_PROXY, bypassed for hosts in NO_PROXY).
+    HTTPS requests are tunneled through the proxy with CONNECT; plain HTTP
+    requests are sent to the proxy with the absolute URL.
+    """
+
+    def __init__(self, timeout: float = 10, rate_limiter: Optional[HostRateLimiter] = None,
+                 proxies: Optional[Dict[str, str]] = None):
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or HostRateLimiter(0)
+        # Scheme -> proxy URL, plus 'no' for the bypass list, as from urllib.request.getproxies()
+        self._env_proxies = proxies is None
+        self.proxies = urllib.request.getproxies() if proxies is None else proxies
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[str]:
+        """Proxy URL to reach host through, or None to connect directly"""
+        proxy = self.proxies.get(scheme)
+        if not proxy:
+            return None
+        if self._env_proxies:
+            bypass = urllib.request.proxy_bypass(host)
+        else:
+            bypass = urllib.request.proxy_bypass_environment(host, self.proxies)
+        if bypass:
+            return None
+        return proxy if '://' in proxy else 'http://' + proxy
+
+    def _acquire(self, key: Tuple[str, str, int], proxy: Optional[str] = None) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        if proxy is None:
+            return conn_class(host, port, timeout=self.timeout)
+
+        proxy_parts = urlsplit(proxy)
+        proxy_port = proxy_parts.port or (443 if proxy_parts.scheme == 'https' else 80)
+        conn = conn_class(proxy_parts.hostname, proxy_port, timeout=self.timeout)
+        if scheme == 'https':
+            conn.set_tunnel(host, port, headers=self._proxy_headers(proxy))
+        return conn
+
+    @staticmethod
+    def _proxy_headers(proxy: Optional[str]) -> Dict[str, str]:
+        """Proxy-Authorization header for credentials in the proxy URL"""
+        parts = urlsplit(proxy) if proxy else None
+        if parts is None or parts.username is None:
+            return {}
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        return {'Proxy-Authorization': 'Basic ' + base64.b64encode(credentials.encode()).decode('ascii')}
+
+    def _release(self, key: Tuple[str, str, int], conn: http.client.HTTPConnection):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """
+        Perform a request, following redirects.
+        Returns (status, body). Raises OSError/http.client.HTTPException on
+        connection failures.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ('http', 'https'):
+                raise ValueError(f"unsupported URL scheme: {parts.scheme or '(none)'}")
+            port = parts.port or (443 if scheme == 'https' else 80)
+            key = (scheme, parts.hostname or '', port)
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+            request_headers = dict(headers or {})
+
+            proxy = self._proxy_for(scheme, key[1])
+            if proxy is not None and scheme == 'http':
+                # A plain HTTP proxy takes the absolute URL
+                path = f"http://{parts.netloc.rpartition('@')[2]}{path}"
+                request_headers.update(self._proxy_headers(proxy))
+
+            self.rate_limiter.wait(key[1])
+            status, location, body = self._send(key, method, path, request_headers, proxy)
+
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                if status == 303 and method != 'HEAD':
+                    method = 'GET'
+                continue
+            return status, body
+
+        raise http.client.HTTPException(f"too many redirects (>{MAX_REDIRECTS})")
+
+    def _send(self, key, method, path, headers, proxy=None) -> Tuple[int, Optional[str], bytes]:
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection in that case.
+        for attempt in range(2):
+            conn = self._acquire(key, proxy)
+            try:
+                conn.request(method, path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(key, conn)
+            return response.status, response.getheader('Location'), body
+        raise http.client.HTTPException("connection failed")
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
 class CitationVerifier:
     """Verify citations in research report"""
 
-    def __init__(self, report_path: Path, strict_mode: bool = False):
+    def __init__(self, report_path: Path, strict_mode: bool = False,
+                 max_workers: int = 8, host_interval: float = 0.2,
+                 doi_resolver: str = DOI_RESOLVER, timeout: float = 10,
+                 cache: Optional[VerificationCache] = None, offline: bool = False):
         self.report_path = report_path
         self.strict_mode = strict_mode
         self.content = self._read_report()
         self.suspicious = []
         self.verified = []
         self.errors = []
-
-        # Hallucination detection patterns (2025 CiteGuard enhancement)
-        self.suspicious_patterns = [
-            # Generic academic-sounding but fake patterns
-            (r'^(A |An |The )?(Study|Analysis|Review|Survey|Investigation) (of|on|into)',
-             "Generic academic title pattern"),
-            (r'^(Recent|Current|Modern|Contemporary) (Advances|Developments|Trends) in',
-             "Generic 'advances' title pattern"),
-            # Too perfect, templated titles
-            (r'^[A-Z][a-z]+ [A-Z][a-z]+: A (Comprehensive|Complete|Systematic) (Review|Analysis|Guide)$',
-             "Too perfect, templated structure"),
-        ]
+        self.max_workers = max_workers
+        self.doi_resolver = doi_resolver.rstrip('/')
+        self.http = HTTPConnectionPool(timeout=timeout, rate_limiter=HostRateLimiter(host_interval))
+        self._print_lock = threading.Lock()
+        self.cache = cache
+        self.offline = offline
+        self.suspicious_patterns = SUSPICIOUS_PATTERNS
+        self._bibliography: Optional[List[Dict]] = None
 
     def _read_report(self) -> str:
         """Read report file"""
@@ -65,9 +428,17 @@ class CitationVerifier:
             sys.exit(1)
 
     def extract_bibliography(self) -> List[Dict]:
-        """Extract bibliography entries from report"""
-        pattern = r'## Bibliography(.*?)(?=##|\Z)'
-        match = re.search(pattern, self.content, re.DOTALL | re.IGNORECASE)
+        """
+        Extract bibliography entries from report.
+
+        The report is scanned once; later calls return the parsed entries.
+        Each entry carries its lowercased title and normalized token set so
+        the per-entry checks don't recompute them.
+        """
+        if self._bibliography is not None:
+            return self._bibliography
+
+        match = BIBLIOGRAPHY_SECTION_RE.search(self.content)
 
         if not match:
             self.errors.append("No Bibliography section found")
@@ -86,7 +457,7 @@ class CitationVerifier:
                 continue
 
             # Check if starts with citation number [N]
-            match_num = re.match(r'^\[(\d+)\]\s+(.+)$', line)
+            match_num = ENTRY_START_RE.match(line)
             if match_num:
                 if current_entry:
                     entries.append(current_entry)
@@ -95,18 +466,21 @@ class CitationVerifier:
                 rest = match_num.group(2)
 
                 # Try to parse: Author (Year). "Title". Venue. URL
-                year_match = re.search(r'\((\d{4})\)', rest)
-                title_match = re.search(r'"([^"]+)"', rest)
-                doi_match = re.search(r'doi\.org/(10\.\S+)', rest)
-                url_match = re.search(r'https?://[^\s\)]+', rest)
+                year_match = YEAR_RE.search(rest)
+                title_match = TITLE_RE.search(rest)
+                doi_match = DOI_RE.search(rest)
+                url_match = URL_RE.search(rest)
+                title = title_match.group(1) if title_match else None
 
                 current_entry = {
                     'num': num,
                     'raw': rest,
                     'year': year_match.group(1) if year_match else None,
-                    'title': title_match.group(1) if title_match else None,
+                    'title': title,
                     'doi': doi_match.group(1) if doi_match else None,
-                    'url': url_match.group(0) if url_match else None
+                    'url': url_match.group(0) if url_match else None,
+                    'title_lower': title.lower() if title else '',
+                    'title_tokens': normalize_title(title) if title else frozenset()
                 }
             elif current_entry:
                 # Multi-line entry, append to raw
@@ -115,63 +489,99 @@ class CitationVerifier:
         if current_entry:
             entries.append(current_entry)
 
+        self._bibliography = entries
         return entries
 
     def verify_doi(self, doi: str) -> Tuple[bool, Dict]:
         """
-        Verify DOI exists and get metadata.
+        Verify DOI exists and get metadata, consulting the cache first.
         Returns (success, metadata_dict)
         """
         if not doi:
             return False, {}
 
+        if self.cache:
+            cached = self.cache.get('doi', doi, allow_stale=self.offline)
+            if cached is not None:
+                return cached
+        if self.offline:
+            return False, {'error': NOT_CACHED_OFFLINE}
+
+        success, metadata = self._fetch_doi(doi)
+
+        if self.cache:
+            if success:
+                self.cache.put('doi', doi, True, metadata, DOI_TTL)
+            elif metadata.get('error') == DOI_NOT_FOUND:
+                self.cache.put('doi', doi, False, metadata, NEGATIVE_TTL)
+
+        return success, metadata
+
+    def _fetch_doi(self, doi: str) -> Tuple[bool, Dict]:
+        """Resolve a DOI over the network"""
         try:
             # Use content negotiation to get JSON metadata
-            url = f"https://doi.org/{quote(doi)}"
-            req = request.Request(url)
-            req.add_header('Accept', 'application/vnd.citationstyles.csl+json')
-
-            with request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode('utf-8'))
-
-                return True, {
-                    'title': data.get('title', ''),
-                    'year': data.get('issued', {}).get('date-parts', [[None]])[0][0],
-                    'authors': [
-                        f"{a.get('family', '')} {a.get('given', '')}"
-                        for a in data.get('author', [])
-                    ],
-                    'venue': data.get('container-title', '')
-                }
-        except error.HTTPError as e:
-            if e.code == 404:
-                return False, {'error': 'DOI not found (404)'}
-            return False, {'error': f'HTTP {e.code}'}
+            url = f"{self.doi_resolver}/{quote(doi)}"
+            status, body = self.http.request('GET', url, {
+                'Accept': 'application/vnd.citationstyles.csl+json',
+                'User-Agent': USER_AGENT,
+            })
+            if status == 404:
+                return False, {'error': DOI_NOT_FOUND}
+            if status != 200:
+                return False, {'error': f'HTTP {status}'}
+
+            data = json.loads(body.decode('utf-8'))
+
+            return True, {
+                'title': data.get('title', ''),
+                'year': data.get('issued', {}).get('date-parts', [[None]])[0][0],
+                'authors': [
+                    f"{a.get('family', '')} {a.get('given', '')}"
+                    for a in data.get('author', [])
+                ],
+                'venue': data.get('container-title', '')
+            }
         except Exception as e:
             return False, {'error': str(e)}
 
     def verify_url(self, url: str) -> Tuple[bool, str]:
         """
-        Verify URL is accessible (2025 CiteGuard enhancement).
+        Verify URL is accessible (2025 CiteGuard enhancement), consulting the
+        cache first.
         Returns (accessible, status_message)
         """
         if not url:
             return False, "No URL"
 
+        if self.cache:
+            cached = self.cache.get('url', url, allow_stale=self.offline)
+            if cached is not None:
+                return cached
+        if self.offline:
+            return False, NOT_CACHED_OFFLINE
+
+        accessible, message = self._fetch_url(url)
+
+        if self.cache:
+            if accessible:
+                self.cache.put('url', url, True, message, URL_TTL)
+            elif message in ('HTTP 404', 'HTTP 410'):
+                self.cache.put('url', url, False, message, NEGATIVE_TTL)
+
+        return accessible, message
+
+    def _fetch_url(self, url: str) -> Tuple[bool, str]:
+        """Check URL reachability over the network"""
         try:
             # HEAD request to check accessibility without downloading
-            req = request.Request(url, method='HEAD')
-            req.add_header('User-Agent', 'Mozilla/5.0 (Research Citation Verifier)')
-
-            with request.urlopen(req, timeout=10) as response:
-                if response.status == 200:
-                    return True, "URL accessible"
-                else:
-                    return False, f"HTTP {response.status}"
-        except error.HTTPError as e:
-            return False, f"HTTP {e.code}"
-        except error.URLError as e:
-            return False, f"URL error: {e.reason}"
+            status, _ = self.http.request('HEAD', url, {'User-Agent': USER_AGENT})
+            if status == 200:
+                return True, "URL accessible"
+            else:
+                return False, f"HTTP {status}"
+        except (OSError, ValueError) as e:
+            return False, f"URL error: {e}"
         except Exception as e:
             return False, f"Connection error: {str(e)[:50]}"
 
@@ -186,18 +596,19 @@ class CitationVerifier:
         if not title:
             return issues
 
+        title_lower = entry.get('title_lower') or title.lower()
+
         # Check against suspicious patterns
         for pattern, description in self.suspicious_patterns:
-            if re.match(pattern, title, re.IGNORECASE):
+            if pattern.match(title):
                 issues.append(f"Suspicious title pattern: {description}")
 
         # Check for overly generic titles
-        generic_words = ['overview', 'introduction', 'guide', 'handbook', 'manual']
-        if any(word in title.lower() for word in generic_words) and len(title.split()) < 5:
+        if any(word in title_lower for word in GENERIC_WORDS) and len(title.split()) < 5:
             issues.append("Very generic short title")
 
         # Check for placeholder-like titles
-        if any(x in title.lower() for x in ['tbd', 'todo', 'placeholder', 'example']):
+        if any(x in title_lower for x in PLACEHOLDER_WORDS):
             issues.append("Placeholder text in title")
 
         # Check for inconsistent metadata
@@ -210,7 +621,7 @@ class CitationVerifier:
             if year > 2025:
                 issues.append(f"Future year: {year}")
             # Very old with modern phrasing is suspicious
-            if year < 2000 and any(word in title.lower() for word in ['ai', 'llm', 'gpt', 'transformer']):
+            if year < 2000 and any(word in title_lower for word in MODERN_AI_WORDS):
                 issues.append(f"Anachronistic: pre-2000 ({year}) citation mentioning modern AI terms")
 
         return issues
@@ -223,22 +634,7 @@ class CitationVerifier:
         if not title1 or not title2:
             return 0.0
 
-        # Normalize: lowercase, remove punctuation, split
-        def normalize(s):
-            s = s.lower()
-            s = re.sub(r'[^\w\s]', ' ', s)
-            return set(s.split())
-
-        words1 = normalize(title1)
-        words2 = normalize(title2)
-
-        if not words1 or not words2:
-            return 0.0
-
-        overlap = len(words1 & words2)
-        total = len(words1 | words2)
-
-        return overlap / total if total > 0 else 0.0
+        return jaccard(normalize_title(title1), normalize_title(title2))
 
     def verify_entry(self, entry: Dict) -> Dict:
         """Verify a single bibliography entry (Enhanced 2025 with CiteGuard)"""
@@ -249,6 +645,8 @@ class CitationVerifier:
             'metadata': {},
             'verification_methods': []
         }
+        # Progress lines are buffered so concurrent entries don't interleave
+        log = []
 
         # STEP 1: Run hallucination detection (CiteGuard 2025)
         hallucination_issues = self.detect_hallucination_patterns(entry)
@@ -258,13 +656,12 @@ class CitationVerifier:
 
         # STEP 2: Has DOI?
         if entry['doi']:
-            print(f"  [{entry['num']}] Checking DOI {entry['doi']}...", end=' ')
             success, metadata = self.verify_doi(entry['doi'])
 
             if success:
                 result['metadata'] = metadata
                 result['status'] = 'verified'
-                print("")
+                log.append(f"  [{entry['num']}] Checking DOI {entry['doi']}... ✓")
 
                 # Check title similarity if we have both
                 if entry['title'] and metadata.get('title'):
@@ -288,7 +685,7 @@ class CitationVerifier:
                         result['status'] = 'suspicious'
 
             else:
-                print(f"✗ {metadata.get('error', 'Failed')}")
+                log.append(f"  [{entry['num']}] Checking DOI {entry['doi']}... ✗ {metadata.get('error', 'Failed')}")
                 result['status'] = 'unverified'
                 result['issues'].append(f"DOI resolution failed: {metadata.get('error', 'unknown')}")
 
@@ -300,7 +697,7 @@ class CitationVerifier:
                 # Upgrade status if URL verifies
                 if result['status'] in ['unknown', 'no_doi', 'unverified']:
                     result['status'] = 'url_verified'
-                print(f"  [{entry['num']}] URL accessible ✓")
+                log.append(f"  [{entry['num']}] URL accessible ✓")
             else:
                 result['issues'].append(f"URL check failed: {url_status}")
 
@@ -310,10 +707,19 @@ class CitationVerifier:
                 result['issues'].append("No DOI or URL - cannot verify")
             result['status'] = 'suspicious'
 
+        if log:
+            with self._print_lock:
+                print('\n'.join(log), flush=True)
+
         return result
 
     def verify_all(self):
-        """Verify all bibliography entries"""
+        """
+        Verify all bibliography entries concurrently.
+
+        Entries are checked by a thread pool; politeness is enforced per host
+        by the rate limiter rather than by sleeping between entries.
+        """
         print(f"\n{'='*60}")
         print(f"CITATION VERIFICATION: {self.report_path.name}")
         print(f"{'='*60}\n")
@@ -326,13 +732,18 @@ class CitationVerifier:
 
         print(f"Found {len(entries)} citations\n")
 
-        results = []
-        for entry in entries:
-            result = self.verify_entry(entry)
-            results.append(result)
-
-            # Rate limiting
-            time.sleep(0.5)
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                results = list(executor.map(self.verify_entry, entries))
+        finally:
+            self.http.close()
+
+        # Repeated or near-duplicate citations across the whole bibliography
+        duplicates = find_duplicate_citations(entries)
+        for result in results:
+            if result['num'] in duplicates:
+                result['issues'].extend(duplicates[result['num']])
+                result['status'] = 'suspicious'
 
         # Summarize
         print(f"\n{'='*60}")
@@ -395,8 +806,9 @@ def main():
 Examples:
   python verify_citations.py --report report.md
 
-Note: Requires internet connection to check DOIs.
+Note: Requires internet connection to check DOIs (unless --offline).
 Uses free DOI resolver - no API key needed.
+Results are cached on disk and reused across runs.
         """
     )
 
@@ -413,6 +825,39 @@ Uses free DOI resolver - no API key needed.
         help='Strict mode: fail on any unverified or suspicious citations'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of citations verified concurrently (default: 8)'
+    )
+
+    parser.add_argument(
+        '--host-interval',
+        type=float,
+        default=0.2,
+        help='Minimum seconds between requests to the same host (default: 0.2)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        type=str,
+        default=str(DEFAULT_CACHE_PATH),
+        help=f'SQLite cache of DOI/URL results shared across runs (default: {DEFAULT_CACHE_PATH})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the verification cache'
+    )
+
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Use cached results only; make no network requests'
+    )
+
     args = parser.parse_args()
     report_path = Path(args.report)
 
@@ -420,8 +865,20 @@ Uses free DOI resolver - no API key needed.
         print(f"ERROR: Report file not found: {report_path}")
         sys.exit(1)
 
-    verifier = CitationVerifier(report_path, strict_mode=args.strict)
-    passed = verifier.verify_all()
+    if args.offline and args.no_cache:
+        print("ERROR: --offline relies on the cache and cannot be combined with --no-cache")
+        sys.exit(1)
+
+    cache = None if args.no_cache else VerificationCache(Path(args.cache))
+    verifier = CitationVerifier(report_path, strict_mode=args.strict,
+                                max_workers=args.workers,
+                                host_interval=args.host_interval,
+                                cache=cache, offline=args.offline)
+    try:
+        passed = verifier.verify_all()
+    finally:
+        if cache:
+            cache.close()
 
     sys.exit(0 if passed else 1)
 
@@ -2,12 +2,104 @@
 """
 HTML Report Verification Script
 Validates that HTML reports are properly generated with all sections from MD
+
+The HTML is parsed once; every check reads the facts collected by that pass, and the
+markdown side reuses validate_report's ReportModel. Pass --dir to verify every
+report.html / report.md pair in a folder concurrently with one summary.
 """
 
 import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Set, Tuple
+
+from pattern_matcher import Pattern, PatternMatcher
+from validate_report import CITATION_RE, ReportModel
+
+PLACEHOLDER_MATCHER = PatternMatcher(
+    Pattern(placeholder, placeholder, ignore_case=False)
+    for placeholder in [
+        '{{TITLE}}', '{{DATE}}', '{{CONTENT}}', '{{BIBLIOGRAPHY}}',
+        '{{METRICS_DASHBOARD}}', '{{SOURCE_COUNT}}', 'TODO', 'TBD',
+        'PLACEHOLDER', 'FIXME'
+    ]
+)
+
+# Common emoji patterns
+EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+",
+    flags=re.UNICODE
+)
+
+
+class HTMLReportParser(HTMLParser):
+    """Collects everything the checks need from the HTML in a single incremental parse"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags: Set[str] = set()
+        self.classes: Set[str] = set()
+        self.section_titles: List[str] = []
+        # [n] citations in the text before the bibliography element
+        self.content_citations: Set[str] = set()
+        self.placeholder_sections = 0
+        self.divs_opened = 0
+        self.divs_closed = 0
+        self.stray_div_closes = 0  # </div> with no open <div> to close
+        # For each open div: whether it is a section div still holding nothing but text, and that text
+        self._divs: List[Tuple[bool, List[str]]] = []
+        self._title: Optional[List[str]] = None
+        self._in_bibliography = False
+
+    @property
+    def unclosed_divs(self) -> int:
+        return len(self._divs)
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        classes = (dict(attrs).get('class') or '').split()
+        self.classes.update(classes)
+        if 'bibliography' in classes:
+            self._in_bibliography = True
+        if self._divs and self._divs[-1][0]:
+            self._divs[-1] = (False, [])
+        if tag == 'div':
+            self.divs_opened += 1
+            self._divs.append(('section' in classes, []))
+        elif tag == 'h2' and 'section-title' in classes:
+            self._title = []
+
+    def handle_endtag(self, tag):
+        if tag == 'div':
+            self.divs_closed += 1
+            if not self._divs:
+                self.stray_div_closes += 1
+                return
+            only_text, text = self._divs.pop()
+            # <div class="section">#</div>: a heading the converter failed to handle
+            if only_text and ''.join(text) == '#':
+                self.placeholder_sections += 1
+        elif tag == 'h2' and self._title is not None:
+            self.section_titles.append(''.join(self._title).strip())
+            self._title = None
+
+    def handle_data(self, data):
+        if self._divs and self._divs[-1][0]:
+            self._divs[-1][1].append(data)
+        if self._title is not None:
+            self._title.append(data)
+        if not self._in_bibliography and '[' in data:
+            self.content_citations.update(CITATION_RE.findall(data))
 
 
 class HTMLVerifier:
@@ -33,6 +125,15 @@ class HTMLVerifier:
         print(f"HTML File: {self.html_path}")
         print(f"MD File: {self.md_path}\n")
 
+        success = self.run_checks()
+
+        # Report results
+        self._print_results()
+
+        return success
+
+    def run_checks(self) -> bool:
+        """Run all checks without printing, collecting self.errors and self.warnings"""
         # Read files
         try:
             html_content = self.html_path.read_text()
@@ -41,33 +142,30 @@ class HTMLVerifier:
             self.errors.append(f"Failed to read files: {e}")
             return False
 
+        html = HTMLReportParser()
+        html.feed(html_content)
+        html.close()
+        md = ReportModel(md_content)
+
         # Run checks
-        self._check_sections(html_content, md_content)
+        self._check_sections(html, md)
         self._check_no_placeholders(html_content)
         self._check_no_emojis(html_content)
-        self._check_structure(html_content)
-        self._check_citations(html_content, md_content)
-        self._check_bibliography(html_content, md_content)
-
-        # Report results
-        self._print_results()
+        self._check_structure(html)
+        self._check_citations(html, md)
+        self._check_bibliography(html, md)
 
         return len(self.errors) == 0
 
-    def _check_sections(self, html: str, md: str):
+    def _check_sections(self, html: HTMLReportParser, md: ReportModel):
         """Verify all markdown sections are present in HTML"""
-        # Extract section headings from markdown
-        md_sections = re.findall(r'^## (.+)$', md, re.MULTILINE)
-
-        # Extract sections from HTML
-        html_sections = re.findall(r'<h2 class="section-title">(.+?)</h2>', html)
+        md_sections = [section.title for section in md.sections if section.level == 2]
+        html_sections = html.section_titles
 
         # Check if we have placeholder sections like <div class="section">#</div>
-        placeholder_sections = re.findall(r'<div class="section">#</div>', html)
-
-        if placeholder_sections:
+        if html.placeholder_sections:
             self.errors.append(
-                f"Found {len(placeholder_sections)} placeholder sections (empty '#' divs) - content not converted properly"
+                f"Found {html.placeholder_sections} placeholder sections (empty '#' divs) - content not converted properly"
             )
 
         # Compare section counts
@@ -80,78 +178,59 @@ class HTMLVerifier:
                 self.errors.append(f"Missing sections in HTML: {missing}")
 
         # Verify Executive Summary is present
-        if "Executive Summary" in md and "Executive Summary" not in html:
+        if md.section("Executive Summary") and not (
+            'executive-summary' in html.classes
+            or any("Executive Summary" in title for title in html_sections)
+        ):
             self.errors.append("Executive Summary missing from HTML")
 
     def _check_no_placeholders(self, html: str):
         """Check for common placeholders that shouldn't be in final report"""
-        placeholders = [
-            '{{TITLE}}', '{{DATE}}', '{{CONTENT}}', '{{BIBLIOGRAPHY}}',
-            '{{METRICS_DASHBOARD}}', '{{SOURCE_COUNT}}', 'TODO', 'TBD',
-            'PLACEHOLDER', 'FIXME'
-        ]
-
-        found = []
-        for placeholder in placeholders:
-            if placeholder in html:
-                found.append(placeholder)
+        found = list(PLACEHOLDER_MATCHER.first_hits(html))
 
         if found:
             self.errors.append(f"Found unreplaced placeholders: {', '.join(found)}")
 
     def _check_no_emojis(self, html: str):
         """Verify no emojis are present in HTML"""
-        # Common emoji patterns
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE
-        )
-
-        emojis = emoji_pattern.findall(html)
+        emojis = EMOJI_RE.findall(html)
         if emojis:
             unique_emojis = set(emojis)
             self.errors.append(f"Found {len(emojis)} emojis in HTML (should be none): {unique_emojis}")
 
-    def _check_structure(self, html: str):
+    def _check_structure(self, html: HTMLReportParser):
         """Verify HTML has proper structure"""
-        required_elements = [
-            ('<html', 'HTML tag'),
-            ('<head', 'head tag'),
-            ('<body', 'body tag'),
-            ('<title>', 'title tag'),
-            ('class="header"', 'header section'),
-            ('class="content"', 'content section'),
-            ('class="bibliography"', 'bibliography section'),
+        required_tags = [
+            ('html', 'HTML tag'),
+            ('head', 'head tag'),
+            ('body', 'body tag'),
+            ('title', 'title tag'),
+        ]
+        required_classes = [
+            ('header', 'header section'),
+            ('content', 'content section'),
+            ('bibliography', 'bibliography section'),
         ]
 
-        for element, name in required_elements:
-            if element not in html:
+        for tag, name in required_tags:
+            if tag not in html.tags:
+                self.errors.append(f"Missing {name} in HTML")
+        for css_class, name in required_classes:
+            if css_class not in html.classes:
                 self.errors.append(f"Missing {name} in HTML")
 
-        # Check for unclosed tags (basic check)
-        open_divs = html.count('<div')
-        close_divs = html.count('</div>')
-
-        if abs(open_divs - close_divs) > 2:  # Allow small discrepancy
+        # Divs are matched up as they are parsed, so any imbalance is real
+        if html.unclosed_divs or html.stray_div_closes:
             self.warnings.append(
-                f"Possible unclosed divs: {open_divs} opening tags, {close_divs} closing tags"
+                f"Unbalanced divs: {html.divs_opened} opening tags, {html.divs_closed} closing tags "
+                f"({html.unclosed_divs} never closed, {html.stray_div_closes} closing nothing)"
             )
 
-    def _check_citations(self, html: str, md: str):
+    def _check_citations(self, html: HTMLReportParser, md: ReportModel):
         """Verify citations are present"""
-        # Extract citations from markdown
-        md_citations = set(re.findall(r'\[(\d+)\]', md))
-
-        # Extract citations from HTML (excluding bibliography)
-        html_content = html.split('class="bibliography"')[0] if 'class="bibliography"' in html else html
-        html_citations = set(re.findall(r'\[(\d+)\]', html_content))
+        md_citations = {num for num, _ in md.citations}
+        # Citations in the HTML content (excluding bibliography)
+        html_citations = html.content_citations
 
         if len(md_citations) > 0 and len(html_citations) == 0:
             self.errors.append("No citations found in HTML content (but present in MD)")
@@ -161,12 +240,12 @@ class HTMLVerifier:
                 f"Fewer citations in HTML ({len(html_citations)}) than MD ({len(md_citations)})"
             )
 
-    def _check_bibliography(self, html: str, md: str):
+    def _check_bibliography(self, html: HTMLReportParser, md: ReportModel):
         """Verify bibliography is present and formatted"""
-        if '## Bibliography' in md:
-            if 'class="bibliography"' not in html:
+        if md.bibliography_section:
+            if 'bibliography' not in html.classes:
                 self.errors.append("Bibliography section missing from HTML")
-            elif 'class="bib-entry"' not in html:
+            elif 'bib-entry' not in html.classes:
                 self.warnings.append("Bibliography present but entries not properly formatted")
 
     def _print_results(self):
@@ -194,14 +273,86 @@ class HTMLVerifier:
         print(f"{'-'*60}\n")
 
 
+def find_report_pairs(directory: Path) -> Tuple[List[Tuple[Path, Path]], List[Path]]:
+    """Pair each .html report with the .md of the same name; also returns the unpaired .html files"""
+    pairs, unpaired = [], []
+    for html_path in sorted(directory.glob('*.html')):
+        md_path = html_path.with_suffix('.md')
+        if md_path.exists():
+            pairs.append((html_path, md_path))
+        else:
+            unpaired.append(html_path)
+    return pairs, unpaired
+
+
+def _verify_pair(pair: Tuple[Path, Path]) -> Tuple[Path, List[str], List[str]]:
+    verifier = HTMLVerifier(*pair)
+    verifier.run_checks()
+    return pair[0], verifier.errors, verifier.warnings
+
+
+def verify_directory(directory: Path, workers: Optional[int] = None) -> bool:
+    """
+    Verify every report pair in a directory concurrently and print one summary
+
+    Returns:
+        True if every pair passes, False otherwise
+    """
+    pairs, unpaired = find_report_pairs(directory)
+    if not pairs:
+        print(f"No .html/.md report pairs found in {directory}")
+        return False
+
+    # Parsing is CPU-bound, so spread the pairs over processes rather than threads
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pairs)))
+    if workers == 1:
+        results = [_verify_pair(pair) for pair in pairs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_verify_pair, pairs))
+
+    print(f"\n{'='*60}")
+    print(f"HTML REPORT VERIFICATION: {directory}")
+    print(f"{'='*60}\n")
+
+    failed = 0
+    for html_path, errors, warnings in results:
+        failed += bool(errors)
+        status = "❌" if errors else "⚠️ " if warnings else "✅"
+        print(f"{status} {html_path.name}: {len(errors)} errors, {len(warnings)} warnings")
+        for error in errors:
+            print(f"    error: {error}")
+        for warning in warnings:
+            print(f"    warning: {warning}")
+    for html_path in unpaired:
+        print(f"   {html_path.name}: skipped, no matching .md")
+
+    print(f"\n{'-'*60}")
+    print(f"{len(results) - failed}/{len(results)} reports passed")
+    print(f"{'-'*60}\n")
+
+    return failed == 0
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Verify HTML research report')
-    parser.add_argument('--html', type=Path, required=True, help='Path to HTML report')
-    parser.add_argument('--md', type=Path, required=True, help='Path to markdown report')
+    parser.add_argument('--html', type=Path, help='Path to HTML report')
+    parser.add_argument('--md', type=Path, help='Path to markdown report')
+    parser.add_argument('--dir', type=Path, help='Verify every report.html/report.md pair in a directory')
+    parser.add_argument('--workers', type=int, help='Parallel workers for --dir (default: CPU count)')
 
     args = parser.parse_args()
 
+    if args.dir:
+        if not args.dir.is_dir():
+            print(f"Error: Directory not found: {args.dir}")
+            return 1
+        return 0 if verify_directory(args.dir, args.workers) else 1
+
+    if not args.html or not args.md:
+        parser.error('--html and --md are required unless --dir is given')
+
     if not args.html.exists():
         print(f"Error: HTML file not found: {args.html}")
         return 1
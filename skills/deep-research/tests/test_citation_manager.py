@@ -0,0 +1,67 @@
+import io
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from citation_manager import CitationManager
+
+SOURCES = [
+    {"url": "https://example.org/a", "title": "First", "authors": ["Smith, J."], "publication_date": "2024"},
+    {"url": "https://example.org/b", "title": "Second", "source_type": "academic"},
+    {"url": "https://example.org/a", "title": "First again"},
+]
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestCitationManager(unittest.TestCase):
+
+    def test_add_sources_from_json_lines_and_arrays(self):
+        jsonl, array = CitationManager(), CitationManager()
+        ids = jsonl.add_sources(io.StringIO("\n".join(json.dumps(s) for s in SOURCES) + "\n\n"))
+        self.assertEqual(array.add_sources(io.StringIO("\n" + json.dumps(SOURCES, indent=2))), ids)
+
+        self.assertEqual(ids[0], ids[2])
+        self.assertEqual([jsonl.get_citation_number(i) for i in ids], [1, 2, 1])
+        self.assertEqual(jsonl.citations[ids[0]].citation_count, 2)
+        self.assertIsNone(jsonl.get_citation_number("missing"))
+
+    def test_add_sources_rejects_bad_records(self):
+        manager = CitationManager()
+        with self.assertRaisesRegex(ValueError, "Source 2: expected an object"):
+            manager.add_sources(io.StringIO('{"url": "u", "title": "t"}\n{"url": "v"}'))
+        with self.assertRaisesRegex(ValueError, r"Source 1: unknown fields \['year'\]"):
+            manager.add_sources(io.StringIO('[{"url": "u", "title": "t", "year": 2024}]'))
+        with self.assertRaisesRegex(ValueError, "Source 1: invalid JSON"):
+            manager.add_sources(io.StringIO('{"url": '))
+
+    def test_render_inline_replaces_every_marker(self):
+        manager = CitationManager()
+        a, b = manager.add_sources(io.StringIO(json.dumps(SOURCES[:2])))
+        self.assertEqual(
+            manager.render_inline(f"One [cite:{b}], two [cite:{a}][cite:{b}] and [cite:nope]. [1] stays."),
+            "One [2], two [1][2] and [?]. [1] stays."
+        )
+
+    def test_write_bibliography_matches_generate(self):
+        manager = CitationManager()
+        manager.add_sources(io.StringIO(json.dumps(SOURCES)))
+        for style in ("markdown", "apa", "mla"):
+            out = io.StringIO()
+            manager.write_bibliography(out, style)
+            self.assertEqual(out.getvalue(), manager.generate_bibliography(style))
+
+        self.assertTrue(manager.generate_bibliography().startswith(
+            "## Bibliography\n\n[1] [First](https://example.org/a)"
+        ))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bibliography.md"
+            manager.export_to_file(str(path), "apa")
+            self.assertEqual(path.read_text(), manager.generate_bibliography("apa"))
+
+
+if __name__ == "__main__":
+    unittest.main()
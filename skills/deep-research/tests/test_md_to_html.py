@@ -0,0 +1,69 @@
+import io
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from md_to_html import convert_markdown_stream, convert_markdown_to_html
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestMarkdownToHTML(unittest.TestCase):
+
+    def test_blocks_and_inline_formatting(self):
+        content, bibliography = convert_markdown_to_html(
+            "# Title\n"
+            "front matter\n"
+            "## Executive Summary\n"
+            "Key **finding** [1].\n"
+            "## Analysis\n"
+            "- first *point*\n"
+            "  continued\n"
+            "- second\n"
+            "\n"
+            "| A | B |\n"
+            "|---|---|\n"
+            "| 1 | `x` |\n"
+            "## Bibliography\n"
+            "[1] Source - https://example.org/a\n"
+        )
+
+        self.assertEqual(content.split("\n"), [
+            '<div class="section"><div class="executive-summary"><h2 class="section-title">Executive Summary</h2>',
+            '<p>Key <strong>finding</strong> [1].',
+            '</p>',
+            '</div>',
+            '</div>',
+            '<div class="section"><h2 class="section-title">Analysis</h2>',
+            '<ul>',
+            '<li>first <em>point</em> continued</li>',
+            '<li>second</li>',
+            '</ul>',
+            '',
+            '<table>', '<thead><tr>', '<th>A</th>', '<th>B</th>', '</tr></thead>', '<tbody>',
+            '<tr>', '<td>1</td>', '<td><code>x</code></td>', '</tr>',
+            '</tbody></table>',
+            '',
+            '</div>',
+        ])
+        self.assertEqual(
+            bibliography,
+            '<div class="bibliography-content">\n<div class="bib-entry"><span class="bib-number">[1]</span> '
+            '<a href="https://example.org/a" target="_blank">Source</a></div>\n</div>'
+        )
+
+    def test_streaming_matches_string_conversion(self):
+        for fixture in sorted(FIXTURES.glob("*.md")):
+            content_out, bibliography_out = io.StringIO(), io.StringIO()
+            with open(fixture, encoding="utf-8") as src:
+                convert_markdown_stream(src, content_out, bibliography_out)
+
+            expected = convert_markdown_to_html(fixture.read_text(encoding="utf-8"))
+            self.assertEqual((content_out.getvalue(), bibliography_out.getvalue()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
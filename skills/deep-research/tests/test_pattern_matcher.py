@@ -0,0 +1,48 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from pattern_matcher import Hit, Pattern, PatternMatcher
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestPatternMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = PatternMatcher([
+            Pattern("todo", "TODO", ignore_case=False),
+            Pattern("[todo]", "[TODO]", ignore_case=False),
+            Pattern("due to length", "due to length"),
+            Pattern("range", r"\[\d+-\d+\]", regex=True),
+        ])
+
+    def test_finds_every_hit_with_positions(self):
+        text = "Due to length [TODO]\nSee [3-9] and due to LENGTH. todo"
+        self.assertEqual(self.matcher.find_all(text), [
+            Hit("due to length", 0, 13, "Due to length"),
+            Hit("[todo]", 14, 20, "[TODO]"),
+            Hit("todo", 15, 19, "TODO"),
+            Hit("range", 25, 30, "[3-9]"),
+            Hit("due to length", 35, 48, "due to LENGTH"),
+        ])
+
+    def test_first_hits_follow_pattern_order(self):
+        hits = self.matcher.first_hits("[1-2] then TODO")
+        self.assertEqual(list(hits), ["todo", "range"])
+        self.assertEqual(self.matcher.first_hit("[1-2] then TODO").label, "todo")
+        self.assertIsNone(self.matcher.first_hit("nothing to see"))
+
+    def test_offsets_survive_text_that_changes_length_when_lowercased(self):
+        text = "İİ Due To Length"
+        self.assertEqual(self.matcher.first_hit(text), Hit("due to length", 3, 16, "Due To Length"))
+
+    def test_case_insensitive_patterns_must_be_lowercase(self):
+        with self.assertRaises(ValueError):
+            PatternMatcher([Pattern("bad", "Due to length")])
+        PatternMatcher([Pattern("escapes", r"\S+ etc\.", regex=True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,290 @@
+import asyncio
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from research_engine import (
+    CheckpointLog, ResearchEngine, ResearchMode, ResearchPhase, ResearchState, Source, Task, run_task_graph
+)
+
+
+def make_state() -> ResearchState:
+    return ResearchState(
+        query="q", mode=ResearchMode.DEEP, phase=ResearchPhase.SCOPE,
+        scope={}, plan={}, sources=[], findings=[], synthesis={}, critique={},
+        report="", metadata={'version': '1.0'}
+    )
+
+
+def source(n: int) -> Source:
+    return Source(url=f"https://example.org/{n}", title=f"Source {n}", snippet="...", retrieved_at="2025-01-01")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestCheckpointLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "state.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def records(self):
+        return [json.loads(line) for line in self.path.read_text().splitlines()]
+
+    def run_session(self, log: CheckpointLog) -> dict:
+        """Checkpoint a few phases, returning the expected state after each"""
+        state, expected = make_state(), {}
+
+        state.scope = {'in_scope': ['a']}
+        log.append(state)
+        expected[ResearchPhase.SCOPE] = json.loads(json.dumps(state._serialize()))
+
+        state.phase = ResearchPhase.RETRIEVE
+        state.sources = [source(n) for n in range(3)]
+        state.findings.append({'claim': 'x'})
+        log.append(state)
+        expected[ResearchPhase.RETRIEVE] = json.loads(json.dumps(state._serialize()))
+
+        state.phase = ResearchPhase.TRIANGULATE
+        state.sources[1].verification_status = "verified"
+        state.sources.append(source(3))
+        state.report = "# Report\n"
+        log.append(state)
+
+        state.phase = ResearchPhase.PACKAGE
+        state.report += "## Bibliography\n"
+        state.findings = []
+        log.append(state)
+        expected[ResearchPhase.PACKAGE] = state._serialize()
+        return expected
+
+    def test_appends_only_deltas(self):
+        self.run_session(CheckpointLog(self.path))
+        records = self.records()
+
+        self.assertEqual([r['seq'] for r in records], [0, 1, 2, 3])
+        self.assertIn('snapshot', records[0])
+        self.assertEqual(records[1]['set'], {'phase': 'retrieve'})
+        self.assertEqual(len(records[1]['extend']['sources']), 3)
+        self.assertEqual(records[2]['update'], {'sources': {'1': records[2]['update']['sources']['1']}})
+        self.assertEqual(records[2]['update']['sources']['1']['verification_status'], 'verified')
+        self.assertEqual(records[2]['extend']['report'], "# Report\n")
+        self.assertEqual(records[3]['set'], {'phase': 'package', 'findings': []})
+        self.assertEqual(records[3]['extend'], {'report': "## Bibliography\n"})
+
+    def test_loads_latest_or_any_phase(self):
+        expected = self.run_session(CheckpointLog(self.path))
+
+        self.assertEqual(ResearchState.load(self.path)._serialize(), expected[ResearchPhase.PACKAGE])
+        for phase in (ResearchPhase.SCOPE, ResearchPhase.RETRIEVE):
+            self.assertEqual(ResearchState.load(self.path, phase)._serialize(), expected[phase])
+        with self.assertRaisesRegex(ValueError, "No checkpoint for phase 'critique'"):
+            CheckpointLog(self.path).load(ResearchPhase.CRITIQUE)
+        self.assertEqual(
+            [phase for _, phase, _ in CheckpointLog(self.path).checkpoints()],
+            ['scope', 'retrieve', 'triangulate', 'package']
+        )
+
+    def test_torn_write_is_ignored_and_replaced(self):
+        expected = self.run_session(CheckpointLog(self.path))
+        with open(self.path, 'a') as f:
+            f.write('{"seq": 4, "phase": "refi')
+
+        self.assertEqual(ResearchState.load(self.path)._serialize(), expected[ResearchPhase.PACKAGE])
+
+        # A new writer on the same log resumes from the last complete checkpoint
+        state = ResearchState.load(self.path)
+        state.phase = ResearchPhase.REFINE
+        state.critique = {'gaps': ['y']}
+        self.assertEqual(CheckpointLog(self.path).append(state), 4)
+        self.assertEqual(self.records()[-1]['set'], {'phase': 'refine', 'critique': {'gaps': ['y']}})
+        self.assertEqual(ResearchState.load(self.path)._serialize(), state._serialize())
+
+        lines = self.path.read_text().splitlines()
+        lines[1] = lines[1][:10]
+        self.path.write_text("\n".join(lines) + "\n")
+        with self.assertRaisesRegex(ValueError, "Corrupt checkpoint at .*:2"):
+            ResearchState.load(self.path)
+
+    def test_snapshot_save_replaces_file_atomically(self):
+        path = Path(self.tmp.name) / "state.json"
+        state = make_state()
+        state.sources = [source(1)]
+        state.save(path)
+        state.report = "done"
+        state.save(path)
+
+        self.assertEqual(ResearchState.load(path), state)
+        self.assertEqual([p.name for p in Path(self.tmp.name).iterdir()], ["state.json"])
+
+
+class TestTaskGraph(unittest.TestCase):
+
+    def test_runs_after_dependencies_within_the_limit(self):
+        order, running, peak = [], 0, 0
+
+        def task(name):
+            async def run():
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                order.append(name)
+                running -= 1
+                return name.upper()
+            return run
+
+        tasks = [Task("a", task("a"))]
+        tasks += [Task(f"b{i}", task(f"b{i}"), ["a"]) for i in range(5)]
+        tasks.append(Task("c", task("c"), [f"b{i}" for i in range(5)]))
+
+        results = asyncio.run(run_task_graph(tasks, max_concurrency=2))
+        self.assertEqual(results["c"], "C")
+        self.assertEqual(order[0], "a")
+        self.assertEqual(order[-1], "c")
+        self.assertEqual(peak, 2)
+
+    def test_rejects_bad_graphs(self):
+        noop = lambda: None
+        for tasks, message in [
+            ([Task("a", noop), Task("a", noop)], "Duplicate task: a"),
+            ([Task("a", noop, ["x"])], r"unknown tasks: \['x'\]"),
+            ([Task("a", noop, ["b"]), Task("b", noop, ["a"]), Task("c", noop)], r"cycle through: \['a', 'b'\]"),
+        ]:
+            with self.assertRaisesRegex(ValueError, message):
+                asyncio.run(run_task_graph(tasks))
+
+    def test_first_error_cancels_the_rest(self):
+        finished = []
+
+        async def slow():
+            await asyncio.sleep(1)
+            finished.append("slow")
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaisesRegex(RuntimeError, "boom"):
+            asyncio.run(run_task_graph([Task("slow", slow), Task("fail", fail), Task("after", slow, ["fail"])]))
+        self.assertEqual(finished, [])
+
+
+class TestResearchEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_engine(self, executor, max_concurrency):
+        engine = ResearchEngine(
+            ResearchMode.STANDARD, executor=executor, max_concurrency=max_concurrency, output_dir=Path(self.tmp.name)
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.run_pipeline("q")
+        return engine
+
+    def test_retrieval_subtasks_run_concurrently(self):
+        lock, running, peak = threading.Lock(), 0, 0
+
+        def executor(phase, state, payload):
+            nonlocal running, peak
+            if phase == ResearchPhase.PLAN:
+                state.plan['search_queries'] = [f"query {i}" for i in range(6)]
+            elif phase == ResearchPhase.RETRIEVE:
+                with lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.05)
+                with lock:
+                    running -= 1
+                    state.sources.append(source(int(payload.split()[1])))
+            return f"{phase.value}:{payload}"
+
+        engine = self.run_engine(executor, max_concurrency=3)
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(engine.phase_results['retrieve'], [f"retrieve:query {i}" for i in range(6)])
+        self.assertEqual(engine.phase_results['package'], "package:None")
+        self.assertEqual(len(engine.state.sources), 6)
+
+        timings = engine.state.metadata['phase_timings']
+        self.assertEqual(list(timings), ['scope', 'plan', 'retrieve', 'triangulate', 'synthesize', 'package'])
+        self.assertEqual(timings['retrieve']['subtasks'], 6)
+        self.assertGreaterEqual(timings['retrieve']['wall_seconds'], 0.1)
+        self.assertLess(timings['retrieve']['wall_seconds'], 0.25)  # 0.3s if run one at a time
+        self.assertGreaterEqual(timings['scope']['cpu_seconds'], 0)
+
+        # Every phase was checkpointed, timings included
+        saved = ResearchState.load(engine.checkpoints.path)
+        self.assertEqual(saved.metadata['phase_timings'], timings)
+        self.assertEqual(len(engine.checkpoints.checkpoints()), 6)
+
+    def test_resumed_run_keeps_checkpointed_state(self):
+        def executor(phase, state, payload):
+            if phase == ResearchPhase.RETRIEVE:
+                state.sources.append(source(1))
+                state.report = "# Draft\n"
+
+        first = self.run_engine(executor, max_concurrency=1)
+        log = first.checkpoints.path
+        retrieved = ResearchState.load(log, ResearchPhase.RETRIEVE)
+        self.assertEqual(len(retrieved.sources), 1)
+
+        # Run again over the same log, starting from its latest state
+        second = ResearchEngine(ResearchMode.STANDARD, executor=lambda *args: None, output_dir=Path(self.tmp.name))
+        second.state = ResearchState.load(log)
+        second.checkpoints = CheckpointLog(log)
+        with contextlib.redirect_stdout(io.StringIO()):
+            second.run_pipeline("q")
+
+        self.assertEqual(len(CheckpointLog(log).checkpoints()), 12)
+        self.assertEqual(len(ResearchState.load(log, ResearchPhase.RETRIEVE).sources), 1)
+        self.assertEqual(ResearchState.load(log).report, "# Draft\n")
+
+        # Checkpoints of the first run stay reachable by sequence number
+        self.assertEqual(CheckpointLog(log).load(seq=2), retrieved)
+        self.assertEqual(len(CheckpointLog(log).load(seq=1).sources), 0)
+        with self.assertRaisesRegex(ValueError, "No checkpoint with seq 12"):
+            CheckpointLog(log).load(seq=12)
+
+    def test_default_executor_shows_each_phase_once(self):
+        engine = ResearchEngine(ResearchMode.STANDARD, output_dir=Path(self.tmp.name))
+        engine.initialize_research("q")
+        engine.state.plan['search_queries'] = ["a", "b", "c"]
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            engine.run_pipeline("q")
+
+        self.assertEqual(out.getvalue().count("PHASE RETRIEVE: Starting..."), 1)
+        self.assertEqual(out.getvalue().count(engine.get_phase_instructions(ResearchPhase.RETRIEVE)), 1)
+        self.assertEqual(engine.phase_results['retrieve']['status'], 'instructions_displayed')
+        self.assertEqual(engine.state.metadata['phase_timings']['retrieve']['subtasks'], 0)
+
+    def test_coroutine_executors(self):
+        seen = []
+
+        async def executor(phase, state, payload):
+            if phase == ResearchPhase.SCOPE:
+                state.plan['search_queries'] = ["a", "b"]
+            await asyncio.sleep(0)
+            seen.append((phase.value, payload))
+
+        self.run_engine(executor, max_concurrency=1)
+        self.assertEqual(seen[:4], [("scope", None), ("plan", None), ("retrieve", "a"), ("retrieve", "b")])
+        self.assertEqual(seen[-1], ("package", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from source_evaluator import DomainTrie, SourceEvaluator
+
+SOURCES = [
+    {'url': 'https://www.nature.com/articles/s41586', 'title': 'Quantum error correction',
+     'publication_date': '2015-01-01'},
+    {'url': 'https://someblog.wordpress.com/post', 'title': 'SHOCKING discovery!'},
+    {'url': 'https://en.wikipedia.org/wiki/Qubit', 'title': 'Qubit'},
+    {'url': 'https://docs.python.org/3/library/asyncio.html', 'title': 'asyncio',
+     'content': 'However, see the caveats.', 'author': 'Dr. Smith'},
+    {'url': 'https://example.com/about', 'title': 'About us'},
+]
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestDomainTrie(unittest.TestCase):
+
+    def test_most_specific_rule_wins(self):
+        trie = DomainTrie()
+        trie.add('example.com', 'site')
+        trie.add('blog.example.com', 'blog')
+        trie.add('example.com/news', 'news')
+        trie.add('example.com/news/opinion', 'opinion')
+
+        self.assertEqual(trie.match_host('org'), (None, None))
+        self.assertEqual(trie.match_host('a.b.blog.example.com'), ('blog', None))
+        self.assertEqual(trie.match_host('badexample.com'), (None, None))
+
+        value, node = trie.match_host('example.com')
+        self.assertEqual(value, 'site')
+        self.assertEqual(DomainTrie.match_path(node, '/news/2024/story', value), 'news')
+        self.assertEqual(DomainTrie.match_path(node, '/news/opinion/', value), 'opinion')
+        self.assertEqual(DomainTrie.match_path(node, '/newsletter', value), 'site')
+
+
+class TestSourceEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = SourceEvaluator()
+
+    def test_domain_authority_covers_subdomains_and_paths(self):
+        authority = self.evaluator._evaluate_domain_authority
+        self.assertEqual(authority('nature.com'), 90.0)
+        self.assertEqual(authority('en.wikipedia.org'), 70.0)
+        self.assertEqual(authority('someblog.wordpress.com'), 40.0)
+        self.assertEqual(authority('pubmed.ncbi.nlm.nih.gov'), 90.0)
+        self.assertEqual(authority('wikipedia.org.example.net'), 55.0)
+
+    def test_batch_matches_single_evaluation(self):
+        batch = self.evaluator.evaluate_batch(SOURCES)
+        self.assertEqual(len(batch), len(SOURCES))
+        self.assertEqual(batch.domain, [
+            'nature.com', 'someblog.wordpress.com', 'en.wikipedia.org', 'docs.python.org', 'example.com'
+        ])
+        for i, source in enumerate(SOURCES):
+            self.assertEqual(batch.row(i), self.evaluator.evaluate_source(**source))
+
+    def test_columns_sort_and_filter(self):
+        batch = self.evaluator.evaluate_batch(SOURCES)
+
+        ranked = batch.sort_by('overall_score')
+        self.assertEqual(ranked.overall_score, sorted(batch.overall_score, reverse=True))
+        self.assertEqual(ranked.url[-1], 'https://someblog.wordpress.com/post')
+        self.assertEqual(ranked.row(0), batch.row(batch.url.index(ranked.url[0])))
+
+        trusted = batch.filter('domain_authority', lambda score: score >= 70)
+        self.assertEqual(trusted.domain, ['nature.com', 'en.wikipedia.org', 'docs.python.org'])
+        self.assertEqual(len(batch.filter('recommendation', lambda r: r == 'nonexistent')), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
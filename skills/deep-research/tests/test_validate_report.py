@@ -0,0 +1,69 @@
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from validate_report import ReportModel, ReportValidator
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestReportModel(unittest.TestCase):
+
+    def test_sections_citations_and_bibliography(self):
+        model = ReportModel(
+            "# Report\n"
+            "## Executive Summary\n"
+            "Findings [1] and [2].\n"
+            "### Detail\n"
+            "More [2], see [appendix](./appendix.md#a).\n"
+            "## Bibliography\n"
+            "[1] First source\n"
+            "[2] Second source\n"
+        )
+
+        self.assertEqual([(s.title, s.line, s.end) for s in model.sections],
+                         [("Executive Summary", 2, 4), ("Detail", 4, 6), ("Bibliography", 6, 10)])
+        self.assertEqual(model.text(model.section("executive summary")), "Findings [1] and [2].")
+        self.assertEqual(model.citations, [("1", 3), ("2", 3), ("2", 5), ("1", 7), ("2", 8)])
+        self.assertEqual(model.bibliography, [("1", 7), ("2", 8)])
+        self.assertEqual(model.links, [("./appendix.md#a", 5)])
+        self.assertEqual(model.word_count, 23)
+
+
+class TestReportValidator(unittest.TestCase):
+
+    def validate(self, path):
+        validator = ReportValidator(path)
+        with redirect_stdout(io.StringIO()):
+            passed = validator.validate()
+        return passed, validator
+
+    def test_fixtures(self):
+        passed, _ = self.validate(FIXTURES / "valid_report.md")
+        self.assertTrue(passed)
+
+        passed, validator = self.validate(FIXTURES / "invalid_report.md")
+        self.assertFalse(passed)
+        self.assertIn("Missing 'Bibliography' section", validator.errors)
+        self.assertIn("Found placeholder text: TBD (line 7), TODO (line 27)", validator.errors)
+
+    def test_errors_report_line_numbers(self):
+        content = (FIXTURES / "valid_report.md").read_text(encoding="utf-8")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = Path(tmpdir) / "report.md"
+            report.write_text(content + "\nSee [notes](./notes.md).\n", encoding="utf-8")
+            passed, validator = self.validate(report)
+
+        line = content.count("\n") + 2
+        self.assertFalse(passed)
+        self.assertEqual(validator.errors, [f"Broken internal links: ./notes.md (line {line})"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,279 @@
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from verify_citations import (
+    CitationVerifier, HTTPConnectionPool, VerificationCache, NOT_CACHED_OFFLINE, find_duplicate_citations
+)
+
+
+DOI_METADATA = {
+    "10.1000/good": {
+        "title": "Deep Learning for Protein Folding",
+        "issued": {"date-parts": [[2021]]},
+        "author": [{"family": "Smith", "given": "Jane"}],
+        "container-title": "Nature",
+    },
+}
+
+
+def distinct_title(n: int) -> str:
+    """A five-word title sharing no word with any other n"""
+    def word(k):
+        letters = ""
+        while True:
+            k, r = divmod(k, 26)
+            letters += chr(ord("a") + r)
+            if not k:
+                return ("qu" + letters).capitalize()
+    return " ".join(word(n * 5 + k) for k in range(5))
+
+
+# Forty distinct papers, so none is flagged as a duplicate of another
+DOI_METADATA.update({
+    f"10.1000/paper{n}": dict(DOI_METADATA["10.1000/good"], title=distinct_title(n))
+    for n in range(1, 41)
+})
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves DOI metadata under /doi/ and reachability under /page/"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+        if self.path.startswith("/doi/"):
+            doi = self.path[len("/doi/"):].replace("%2F", "/")
+            if doi in DOI_METADATA:
+                self._send(200, json.dumps(DOI_METADATA[doi]).encode("utf-8"))
+            else:
+                self._send(404)
+        else:
+            self._send(404)
+
+    def do_HEAD(self):
+        if self.path == "/page/ok":
+            self._send(200)
+        elif self.path == "/page/moved":
+            self._send(301, headers={"Location": "/page/ok"})
+        else:
+            self._send(404)
+
+    def log_message(self, *args):
+        pass
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestConcurrentVerification(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = 0
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def make_verifier(self, bibliography, **kwargs):
+        report = Path(self.tmpdir.name) / "report.md"
+        report.write_text("# Report\n\n## Bibliography\n\n" + "\n".join(bibliography) + "\n",
+                          encoding="utf-8")
+        kwargs.setdefault("host_interval", 0)
+        return CitationVerifier(report, doi_resolver=f"{self.base}/doi", **kwargs)
+
+    def run_quietly(self, verifier):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            passed = verifier.verify_all()
+        return passed, out.getvalue()
+
+    def test_doi_and_url_statuses(self):
+        verifier = self.make_verifier([
+            '[1] Smith (2021). "Deep Learning for Protein Folding". Nature. https://doi.org/10.1000/good',
+            '[2] Doe (2020). "Missing Paper Title Here". Journal. https://doi.org/10.1000/missing',
+            f'[3] Roe (2019). "Web Resource About Widgets". Site. {self.base}/page/moved',
+        ])
+        results = {}
+        for entry in verifier.extract_bibliography():
+            results[entry["num"]] = verifier.verify_entry(entry)
+
+        self.assertEqual(results["1"]["status"], "verified")
+        self.assertEqual(results["1"]["metadata"]["year"], 2021)
+        self.assertEqual(results["2"]["status"], "unverified")
+        self.assertIn("DOI resolution failed: DOI not found (404)", results["2"]["issues"])
+        self.assertEqual(results["3"]["status"], "url_verified")
+
+    def test_progress_lines_are_whole(self):
+        verifier = self.make_verifier([
+            '[1] Smith (2021). "Deep Learning for Protein Folding". Nature. https://doi.org/10.1000/good',
+            '[2] Doe (2020). "Missing Paper Title Here". Journal. https://doi.org/10.1000/missing',
+        ], max_workers=2)
+        _, output = self.run_quietly(verifier)
+        lines = output.splitlines()
+
+        self.assertIn("  [1] Checking DOI 10.1000/good... ✓", lines)
+        self.assertIn("  [2] Checking DOI 10.1000/missing... ✗ DOI not found (404)", lines)
+        self.assertEqual(output.count("Checking DOI"), 2)
+
+    def test_connections_are_reused(self):
+        entries = [
+            f'[{i}] Smith (2021). "{distinct_title(i)}". Nature. https://doi.org/10.1000/paper{i}'
+            for i in range(1, 41)
+        ]
+        verifier = self.make_verifier(entries, max_workers=4)
+        passed, output = self.run_quietly(verifier)
+
+        self.assertTrue(passed)
+        self.assertIn("DOI Verified: 40/40", output)
+        self.assertEqual(self.server.requests, 40)
+        self.assertLessEqual(self.server.connections, 4)
+
+    def test_per_host_rate_limit(self):
+        entries = [
+            f'[{i}] Smith (2021). "Deep Learning for Protein Folding". Nature. https://doi.org/10.1000/good'
+            for i in range(1, 6)
+        ]
+        verifier = self.make_verifier(entries, max_workers=5, host_interval=0.05)
+        start = time.monotonic()
+        self.run_quietly(verifier)
+        # Five requests to one host need at least four intervals
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+
+    def test_cache_serves_repeat_lookups_and_offline_mode(self):
+        cache = VerificationCache(Path(self.tmpdir.name) / "cache.sqlite3")
+        self.addCleanup(cache.close)
+        verifier = self.make_verifier([], cache=cache)
+
+        self.assertTrue(verifier.verify_doi("10.1000/good")[0])
+        self.assertFalse(verifier.verify_doi("10.1000/missing")[0])
+        self.assertTrue(verifier.verify_doi("10.1000/good")[0])
+        self.assertFalse(verifier.verify_doi("10.1000/missing")[0])
+        # The 404 is negatively cached, so only the first two lookups hit the network
+        self.assertEqual(self.server.requests, 2)
+
+        offline = self.make_verifier([], cache=cache, offline=True)
+        success, metadata = offline.verify_doi("10.1000/good")
+        self.assertTrue(success)
+        self.assertEqual(metadata["title"], "Deep Learning for Protein Folding")
+        self.assertEqual(offline.verify_doi("10.1000/other"), (False, {"error": NOT_CACHED_OFFLINE}))
+        self.assertEqual(offline.verify_url(f"{self.base}/page/ok"), (False, NOT_CACHED_OFFLINE))
+        self.assertEqual(self.server.requests, 2)
+
+
+class ProxyStubHandler(StubHandler):
+    """A plain HTTP proxy in front of the stub: records and serves absolute-URL requests"""
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        if self.path.startswith("http://"):
+            self.server.proxied.append((self.path, self.headers.get("Proxy-Authorization")))
+            parts = urlsplit(self.path)
+            self.path = parts.path + ("?" + parts.query if parts.query else "")
+        return True
+
+
+class TestProxySupport(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ProxyStubHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.requests = 0
+        self.server.proxied = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.proxy = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_http_requests_go_through_the_proxy(self):
+        pool = HTTPConnectionPool(proxies={"http": self.proxy.replace("http://", "http://user:pa%20ss@")})
+        self.addCleanup(pool.close)
+
+        status, body = pool.request("GET", "http://doi.example.invalid/doi/10.1000%2Fgood")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["title"], "Deep Learning for Protein Folding")
+        self.assertEqual(pool.request("HEAD", "http://site.example.invalid/page/moved")[0], 200)
+        self.assertEqual([path for path, _ in self.server.proxied], [
+            "http://doi.example.invalid/doi/10.1000%2Fgood",
+            "http://site.example.invalid/page/moved",
+            "http://site.example.invalid/page/ok",
+        ])
+        self.assertEqual(self.server.proxied[0][1], "Basic dXNlcjpwYSBzcw==")
+
+    def test_no_proxy_hosts_and_https_tunnels(self):
+        pool = HTTPConnectionPool(proxies={"http": self.proxy, "https": self.proxy, "no": "127.0.0.1,.internal"})
+        self.addCleanup(pool.close)
+
+        # The stub itself is on the bypass list, so this request goes to it directly
+        self.assertEqual(pool.request("HEAD", f"{self.proxy}/page/ok")[0], 200)
+        self.assertEqual(self.server.proxied, [])
+        self.assertIsNone(pool._proxy_for("https", "docs.internal"))
+
+        # HTTPS is tunneled with CONNECT through the proxy
+        conn = pool._acquire(("https", "doi.org", 443), pool._proxy_for("https", "doi.org"))
+        self.assertEqual((conn.host, conn.port), ("127.0.0.1", self.server.server_address[1]))
+        self.assertEqual((conn._tunnel_host, conn._tunnel_port), ("doi.org", 443))
+        self.assertIsNone(HTTPConnectionPool(proxies={})._proxy_for("https", "doi.org"))
+
+
+class TestDuplicateDetection(unittest.TestCase):
+
+    def entry(self, num, title, doi=None, url=None):
+        return {"num": num, "title": title, "doi": doi, "url": url}
+
+    def test_flags_repeated_and_near_duplicate_citations(self):
+        entries = [
+            self.entry("1", "Scaling Laws for Neural Language Models", doi="10.1/a"),
+            self.entry("2", "Attention Is All You Need", doi="10.1/A"),
+            self.entry("3", "Scaling laws for neural language models."),
+            self.entry("4", "Scaling Laws for Neural Language Models Revisited"),
+            self.entry("5", "Protein Structure Prediction at Scale"),
+        ]
+        issues = find_duplicate_citations(entries)
+
+        self.assertEqual(issues["2"], ["Same DOI as [1]"])
+        self.assertEqual(issues["3"], ["Duplicate title of [1]"])
+        self.assertTrue(issues["4"][0].startswith("Near-duplicate title"))
+        self.assertNotIn("1", issues)
+        self.assertNotIn("5", issues)
+
+
+if __name__ == "__main__":
+    unittest.main()
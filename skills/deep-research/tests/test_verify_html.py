@@ -0,0 +1,139 @@
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from md_to_html import convert_markdown_to_html
+from verify_html import HTMLReportParser, HTMLVerifier, find_report_pairs, verify_directory
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>Report</title></head>
+<body><div class="container">
+<div class="header"><h1>Report</h1></div>
+<div class="content">
+{content}
+<div class="bibliography"><div class="section-title">Bibliography</div>
+<div class="bib-entry">[1] Source</div><div class="bib-entry">[2] Other</div>
+</div>
+</div>
+</div></body></html>
+"""
+
+CONTENT = (
+    '<div class="section"><h2 class="section-title">Executive Summary</h2><p>Finding [1].</p></div>\n'
+    '<div class="section"><h2 class="section-title">Analysis</h2><p>More <b>[2]</b>.</p></div>'
+)
+
+MARKDOWN = "# Report\n## Executive Summary\nFinding [1].\n## Analysis\nMore [2].\n### Detail\n## Bibliography\n[1] Source\n[2] Other\n"
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestHTMLReportParser(unittest.TestCase):
+
+    def parse(self, html):
+        parser = HTMLReportParser()
+        # Fed in small pieces to exercise the incremental parser
+        for i in range(0, len(html), 7):
+            parser.feed(html[i:i + 7])
+        parser.close()
+        return parser
+
+    def test_collects_structure_in_one_pass(self):
+        parser = self.parse(PAGE.format(content=CONTENT))
+        self.assertEqual(parser.section_titles, ["Executive Summary", "Analysis"])
+        self.assertEqual(parser.content_citations, {"1", "2"})
+        self.assertTrue({"html", "head", "body", "title"} <= parser.tags)
+        self.assertTrue({"header", "content", "bibliography", "bib-entry"} <= parser.classes)
+        self.assertEqual((parser.divs_opened, parser.divs_closed), (9, 9))
+        self.assertEqual((parser.unclosed_divs, parser.stray_div_closes), (0, 0))
+
+    def test_div_balance_is_exact(self):
+        parser = self.parse('<div><div class="x">a</div></div></div><div><p>"</div>"</p>')
+        self.assertEqual((parser.divs_opened, parser.divs_closed), (3, 4))
+        self.assertEqual((parser.unclosed_divs, parser.stray_div_closes), (0, 1))
+
+        parser = self.parse('<div class="section"><div class="executive-summary"><h2>t</h2></div>')
+        self.assertEqual((parser.unclosed_divs, parser.stray_div_closes), (1, 0))
+
+    def test_placeholder_sections(self):
+        parser = self.parse(
+            '<div class="section">#</div><div class="section"> # </div>'
+            '<div class="section"><span>#</span></div><div class="other">#</div>'
+        )
+        self.assertEqual(parser.placeholder_sections, 1)
+
+
+class TestHTMLVerifier(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_pair(self, name, content, markdown=MARKDOWN):
+        html_path, md_path = self.dir / f"{name}.html", self.dir / f"{name}.md"
+        html_path.write_text(PAGE.format(content=content))
+        md_path.write_text(markdown)
+        return html_path, md_path
+
+    def run_checks(self, content, markdown=MARKDOWN):
+        verifier = HTMLVerifier(*self.write_pair("report", content, markdown))
+        passed = verifier.run_checks()
+        return passed, verifier.errors, verifier.warnings
+
+    def test_valid_report_passes(self):
+        self.assertEqual(self.run_checks(CONTENT), (True, [], []))
+
+    def test_reports_missing_sections_placeholders_and_citations(self):
+        passed, errors, warnings = self.run_checks(
+            '<div class="section">#</div><div class="section">#</div><p>TODO</p>',
+            MARKDOWN.replace("## Analysis", "## Analysis\n## Risks\n## Outlook"),
+        )
+        self.assertFalse(passed)
+        self.assertEqual(errors[0], "Found 2 placeholder sections (empty '#' divs) - content not converted properly")
+        self.assertEqual(errors[1], "Section count mismatch: MD has 5 sections, HTML has only 0 + bibliography")
+        self.assertIn("Executive Summary missing from HTML", errors)
+        self.assertIn("Found unreplaced placeholders: TODO", errors)
+        self.assertIn("No citations found in HTML content (but present in MD)", errors)
+        self.assertEqual(warnings, ["Fewer citations in HTML (0) than MD (2)"])
+
+    def test_unbalanced_divs_are_a_warning(self):
+        passed, errors, warnings = self.run_checks(CONTENT + "<div>")
+        self.assertTrue(passed)
+        self.assertEqual(warnings, [
+            "Unbalanced divs: 10 opening tags, 9 closing tags (1 never closed, 0 closing nothing)"
+        ])
+
+    def test_converted_report_has_balanced_divs(self):
+        content, _ = convert_markdown_to_html(MARKDOWN)
+        self.assertIn('<div class="executive-summary">', content)
+        self.assertEqual(self.run_checks(content), (True, [], []))
+
+    def test_verifies_a_directory_with_one_summary(self):
+        self.write_pair("good", CONTENT)
+        self.write_pair("bad", CONTENT.replace("Finding", "TBD"))
+        (self.dir / "orphan.html").write_text(PAGE.format(content=CONTENT))
+
+        pairs, unpaired = find_report_pairs(self.dir)
+        self.assertEqual([html.name for html, _ in pairs], ["bad.html", "good.html"])
+        self.assertEqual([html.name for html in unpaired], ["orphan.html"])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(verify_directory(self.dir, workers=2))
+        summary = output.getvalue()
+        self.assertIn("bad.html: 1 errors, 0 warnings", summary)
+        self.assertIn("error: Found unreplaced placeholders: TBD", summary)
+        self.assertIn("good.html: 0 errors, 0 warnings", summary)
+        self.assertIn("orphan.html: skipped, no matching .md", summary)
+        self.assertIn("1/2 reports passed", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
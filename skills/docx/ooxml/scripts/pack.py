@@ -2,12 +2,20 @@
 """
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
+Members that are unchanged from the original file (never extracted by
+unpack.py --lazy, or extracted and left untouched) are copied as stored,
+without decompressing and recompressing them (or through the public zipfile
+API if this Python's zipfile lacks the internals that needs). The original file
+is the one recorded by unpack.py, or the one given with --source.
+
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--source <original_file>]
 """
 
 import argparse
+import contextlib
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
@@ -15,17 +23,52 @@ import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+try:
+    from .unpack import (
+        MANIFEST_NAME,
+        file_crc32,
+        load_manifest,
+        source_unchanged,
+        unextracted_members,
+    )
+except ImportError:
+    from unpack import (
+        MANIFEST_NAME,
+        file_crc32,
+        load_manifest,
+        source_unchanged,
+        unextracted_members,
+    )
+
+# Offsets of the name and extra field lengths in a zip local file header
+_FH_FILENAME_LENGTH = 10
+_FH_EXTRA_FIELD_LENGTH = 11
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# zipfile internals that copy_raw_member relies on. They are not public API, so
+# members are copied through ZipFile.open() instead if any of them is missing.
+_RAW_COPY_MODULE_ATTRIBUTES = ("structFileHeader", "sizeFileHeader", "stringFileHeader")
+_RAW_COPY_ZIPFILE_ATTRIBUTES = ("fp", "_writecheck", "_didModify", "start_dir", "filelist", "NameToInfo")
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--source",
+        help="Original Office file to copy unchanged members from "
+        "(default: the file recorded by unpack.py)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            source=args.source,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +85,18 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, source=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Members that are unchanged from the original package are copied with their
+    existing compressed bytes; only new and edited files are condensed and deflated.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        source: Original Office file to copy unchanged members from. Defaults to
+            the file recorded by unpack.py in the directory's manifest.
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +109,179 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    manifest = load_manifest(input_dir)
+    if manifest and not source_unchanged(manifest, manifest["source"]):
+        if unextracted_members(input_dir, manifest):
+            raise ValueError(
+                f"{manifest['source']} changed since it was unpacked; "
+                "the parts that were never extracted cannot be packed"
+            )
+        manifest = None
+    unextracted = set(unextracted_members(input_dir, manifest))
+    if source is None and manifest:
+        source = manifest["source"]
+    # CRCs recorded at unpack time only describe the manifest's own source
+    extracted = {}
+    if manifest and Path(source).resolve() == Path(manifest["source"]):
+        extracted = manifest["extracted"]
+    elif unextracted:
+        raise ValueError(
+            f"{input_dir} was lazily unpacked from {manifest['source']}; "
+            "pack it with that file as the source"
+        )
+
+    files = {
+        f.relative_to(input_dir).as_posix(): f
+        for f in sorted(input_dir.rglob("*"))
+        if f.is_file() and f.name != MANIFEST_NAME
+    }
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        source_zip = stack.enter_context(zipfile.ZipFile(source)) if source else None
+        zf = stack.enter_context(zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED))
+
+        # Keep the original member order, then add new files
+        names = list(manifest["members"]) if manifest else []
+        if source_zip and not manifest:
+            names = source_zip.namelist()
+        known = set(names)
+        order = [n for n in names if n in files or n in unextracted]
+        order += [n for n in files if n not in known]
+
+        for name in order:
+            info = _source_info(source_zip, name)
+            if name not in files:
+                copy_member(source_zip, info, zf)
+            elif info and _is_unchanged(files[name], name, info, extracted):
+                copy_member(source_zip, info, zf)
+            elif name.endswith((".xml", ".rels")):
+                zf.writestr(_zip_info(files[name], name), condensed_xml(files[name]))
+            else:
+                zf.write(files[name], name)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def _source_info(source_zip, name):
+    if source_zip is None:
+        return None
+    try:
+        return source_zip.getinfo(name)
+    except KeyError:
+        return None
+
+
+def _is_unchanged(path, name, info, extracted):
+    """Whether a file on disk still holds what the original package stores for it.
+
+    Parts recorded by unpack.py are compared with their CRC as extracted (XML parts
+    are pretty-printed on disk, so they cannot be compared with the stored bytes).
+    Other non-XML files are compared with the stored member's size and CRC.
+    """
+    size = path.stat().st_size
+    record = extracted.get(name)
+    if record is not None:
+        return record["size"] == size and record.get("crc") == file_crc32(path)
+    if name.endswith((".xml", ".rels")):
+        return False
+    return info.file_size == size and info.CRC == file_crc32(path)
+
+
+def _zip_info(path, name):
+    zinfo = zipfile.ZipInfo.from_file(path, name)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    return zinfo
+
+
+def raw_copy_supported(source_zip, dest_zip):
+    """Whether this zipfile version has the internals copy_raw_member needs."""
+    return (
+        all(hasattr(zipfile, name) for name in _RAW_COPY_MODULE_ATTRIBUTES)
+        and hasattr(zipfile.ZipInfo, "FileHeader")
+        and hasattr(source_zip, "fp")
+        and all(hasattr(dest_zip, name) for name in _RAW_COPY_ZIPFILE_ATTRIBUTES)
+        and not getattr(dest_zip, "_writing", False)
+    )
+
+
+def copy_member(source_zip, info, dest_zip):
+    """Copy a member into dest_zip, as stored when possible."""
+    if raw_copy_supported(source_zip, dest_zip):
+        copy_raw_member(source_zip, info, dest_zip)
+    else:
+        copy_member_decompressed(source_zip, info, dest_zip)
+
+
+def _copied_info(info):
+    """ZipInfo for writing a copy of a source member."""
+    new_info = zipfile.ZipInfo(info.filename, info.date_time)
+    new_info.compress_type = info.compress_type
+    new_info.file_size = info.file_size
+    new_info.external_attr = info.external_attr
+    new_info.create_system = info.create_system
+    return new_info
+
+
+def copy_member_decompressed(source_zip, info, dest_zip):
+    """Copy a member through the public zipfile API, recompressing it with the same method."""
+    new_info = _copied_info(info)
+    with source_zip.open(info) as src, dest_zip.open(new_info, "w") as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+
+def copy_raw_member(source_zip, info, dest_zip):
+    """Copy a member into dest_zip as stored in source_zip, without recompressing it.
+
+    The compressed bytes are streamed from the source file and the member keeps its
+    compression method, CRC and sizes.
+    """
+    if info.flag_bits & 0x1:
+        raise ValueError(f"Cannot copy encrypted member {info.filename}")
+
+    source_fp = source_zip.fp
+    source_fp.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, source_fp.read(zipfile.sizeFileHeader))
+    if header[0] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    data_offset = (
+        info.header_offset
+        + zipfile.sizeFileHeader
+        + header[_FH_FILENAME_LENGTH]
+        + header[_FH_EXTRA_FIELD_LENGTH]
+    )
+
+    new_info = _copied_info(info)
+    new_info.CRC = info.CRC
+    new_info.compress_size = info.compress_size
+    # Keep the UTF-8 name flag; sizes and CRC go in the local header, not a data descriptor
+    new_info.flag_bits = info.flag_bits & 0x800
+
+    # Same bookkeeping as ZipFile.open(..., "w") followed by close()
+    dest_fp = dest_zip.fp
+    dest_zip._writecheck(new_info)
+    dest_zip._didModify = True
+    new_info.header_offset = dest_fp.tell()
+    dest_fp.write(new_info.FileHeader())
+    source_fp.seek(data_offset)
+    remaining = info.compress_size
+    while remaining:
+        chunk = source_fp.read(min(_COPY_CHUNK_SIZE, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        dest_fp.write(chunk)
+        remaining -= len(chunk)
+    dest_zip.start_dir = dest_fp.tell()
+    dest_zip.filelist.append(new_info)
+    dest_zip.NameToInfo[new_info.filename] = new_info
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -132,6 +327,15 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
+    condensed = condensed_xml(xml_file)
+
+    # Write back the condensed XML
+    with open(xml_file, "wb") as f:
+        f.write(condensed)
+
+
+def condensed_xml(xml_file):
+    """Return the XML with whitespace-only text and comments removed."""
     with open(xml_file, "r", encoding="utf-8") as f:
         dom = defusedxml.minidom.parse(f)
 
@@ -150,9 +354,7 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
 
 
 if __name__ == "__main__":
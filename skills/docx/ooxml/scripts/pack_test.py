@@ -0,0 +1,103 @@
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import pack
+from pack import pack_document
+from unpack import MANIFEST_NAME, unpack_document
+from unpack_test import make_package
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestRawPassthrough(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.source = make_package(self.root / "source.docx")
+        self.unpacked = self.root / "unpacked"
+        unpack_document(self.source, self.unpacked)
+        document = self.unpacked / "word/document.xml"
+        document.write_text(
+            document.read_text(encoding="utf-8").replace("Hello", "Goodbye"),
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assert_copied_as_stored(self, output, names):
+        with zipfile.ZipFile(self.source) as original, zipfile.ZipFile(output) as packed:
+            self.assertIsNone(packed.testzip())
+            for name in names:
+                before, after = original.getinfo(name), packed.getinfo(name)
+                self.assertEqual(after.compress_type, before.compress_type, name)
+                self.assertEqual(after.compress_size, before.compress_size, name)
+                self.assertEqual(packed.read(name), original.read(name), name)
+            self.assertIn(b"Goodbye", packed.read("word/document.xml"))
+
+    def test_untouched_parts_are_copied_as_stored(self):
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output)
+
+        self.assert_copied_as_stored(output, ["word/styles.xml", "word/media/image1.png"])
+        with zipfile.ZipFile(self.source) as original, zipfile.ZipFile(output) as packed:
+            self.assertEqual(packed.namelist(), original.namelist())
+
+    def test_edited_binary_part_is_recompressed(self):
+        image = self.unpacked / "word/media/image1.png"
+        image.write_bytes(b"\x00" * 1024)
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output)
+
+        with zipfile.ZipFile(output) as packed:
+            info = packed.getinfo("word/media/image1.png")
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(packed.read("word/media/image1.png"), b"\x00" * 1024)
+
+    def test_explicit_source_without_manifest(self):
+        (self.unpacked / MANIFEST_NAME).unlink()
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output, source=self.source)
+
+        # Without the manifest only non-XML members can be matched to the source
+        self.assert_copied_as_stored(output, ["word/media/image1.png"])
+
+    def test_new_files_are_added(self):
+        shutil.copy(self.unpacked / "word/styles.xml", self.unpacked / "word/extra.xml")
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output)
+
+        with zipfile.ZipFile(output) as packed:
+            self.assertEqual(packed.namelist()[-1], "word/extra.xml")
+
+    def test_both_copy_paths_produce_valid_archives(self):
+        for raw in (True, False):
+            with self.subTest(raw=raw):
+                output = self.root / f"output_{raw}.docx"
+                with mock.patch.object(pack, "raw_copy_supported", return_value=raw) as supported:
+                    pack_document(self.unpacked, output)
+                self.assertTrue(supported.called)
+
+                with zipfile.ZipFile(self.source) as original, zipfile.ZipFile(output) as packed:
+                    self.assertIsNone(packed.testzip())
+                    self.assertEqual(packed.namelist(), original.namelist())
+                    for name in ("word/styles.xml", "word/media/image1.png"):
+                        self.assertEqual(packed.read(name), original.read(name), name)
+                        self.assertEqual(
+                            packed.getinfo(name).compress_type,
+                            original.getinfo(name).compress_type,
+                            name,
+                        )
+
+    def test_raw_copy_is_supported_here(self):
+        with zipfile.ZipFile(self.source) as source, zipfile.ZipFile(
+            self.root / "probe.zip", "w"
+        ) as dest:
+            self.assertTrue(pack.raw_copy_supported(source, dest))
+
+
+if __name__ == "__main__":
+    unittest.main()
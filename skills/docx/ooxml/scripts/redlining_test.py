@@ -0,0 +1,109 @@
+import io
+import tempfile
+import unittest
+import zipfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from validation.redlining import MAX_DIFF_LINES, RedliningValidator
+
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>{}</w:body></w:document>"
+)
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestWordDiff(unittest.TestCase):
+    def setUp(self):
+        self.validator = RedliningValidator(".", "original.docx")
+
+    def diff(self, original, modified):
+        return self.validator._get_word_diff("\n".join(original), "\n".join(modified))
+
+    def test_changed_words_are_marked_inline(self):
+        diff = self.diff(
+            ["Intro", "The quick brown fox jumps.", "End"],
+            ["Intro", "The quick red fox jumped.", "End"],
+        )
+        self.assertEqual(diff, "The quick [-b-]r[-own-]{+ed+} fox jump[-s-]{+ed+}.")
+
+    def test_only_changed_paragraphs_are_shown(self):
+        paragraphs = [f"Paragraph {i} of the contract." for i in range(1000)]
+        modified = list(paragraphs)
+        modified[10] = "Paragraph 10 of the contracts."
+        del modified[500]
+        modified.append("A new closing paragraph.")
+
+        self.assertEqual(
+            self.diff(paragraphs, modified).splitlines(),
+            [
+                "Paragraph 10 of the contract{+s+}.",
+                "[-Paragraph 500 of the contract.-]",
+                "{+A new closing paragraph.+}",
+            ],
+        )
+
+    def test_identical_text_has_no_diff(self):
+        self.assertIsNone(self.diff(["Same", "text"], ["Same", "text"]))
+
+    def test_divergent_documents_are_reported_within_bounds(self):
+        original = [f"Original paragraph number {i} with some text" for i in range(20000)]
+        modified = [f"Rewritten clause {i * 7} entirely different" for i in range(20000)]
+
+        lines = self.diff(original, modified).splitlines()
+        self.assertEqual(len(lines), MAX_DIFF_LINES + 1)
+        self.assertEqual(lines[-1], "... (more differences not shown)")
+
+
+class TestValidate(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.original = self.root / "original.docx"
+        with zipfile.ZipFile(self.original, "w") as zf:
+            zf.writestr(
+                "word/document.xml",
+                DOCUMENT.format(
+                    "<w:p><w:r><w:t>The term is one year.</w:t></w:r></w:p>"
+                    '<w:p><w:ins w:author="Alice"><w:r><w:t>Added by Alice.</w:t></w:r></w:ins></w:p>'
+                ),
+            )
+        (self.root / "unpacked" / "word").mkdir(parents=True)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def validate(self, body):
+        (self.root / "unpacked" / "word" / "document.xml").write_text(
+            DOCUMENT.format(body), encoding="utf-8"
+        )
+        validator = RedliningValidator(self.root / "unpacked", self.original)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            return validator.validate(), output.getvalue()
+
+    def test_tracked_changes_by_claude_pass(self):
+        valid, _ = self.validate(
+            "<w:p><w:r><w:t>The term is </w:t></w:r>"
+            '<w:del w:author="Claude"><w:r><w:delText>one year</w:delText></w:r></w:del>'
+            '<w:ins w:author="Claude"><w:r><w:t>two years</w:t></w:r></w:ins>'
+            "<w:r><w:t>.</w:t></w:r></w:p>"
+            '<w:p><w:ins w:author="Alice"><w:r><w:t>Added by Alice.</w:t></w:r></w:ins></w:p>'
+            '<w:ins w:author="Claude"><w:p><w:r><w:t>A new paragraph.</w:t></w:r></w:p></w:ins>'
+        )
+        self.assertTrue(valid)
+
+    def test_untracked_edit_is_reported(self):
+        valid, output = self.validate(
+            "<w:p><w:r><w:t>The term is one year.</w:t></w:r>"
+            '<w:ins w:author="Claude"><w:r><w:t> Renewable.</w:t></w:r></w:ins></w:p>'
+            '<w:p><w:ins w:author="Alice"><w:r><w:t>Changed by Alice.</w:t></w:r></w:ins></w:p>'
+        )
+        self.assertFalse(valid)
+        self.assertIn("[-Add-]{+Chang+}ed by Alice.", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
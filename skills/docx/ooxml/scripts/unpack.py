@@ -1,29 +1,366 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx).
 
+Each XML part is parsed straight from the archive and written pretty-printed,
+without extracting the raw form first. Parts are formatted in parallel, and
+parts larger than --max-pretty-size are extracted unchanged.
+
+With --lazy only a manifest of the package, [Content_Types].xml and the .rels
+parts are written; other parts are extracted on first access (materialize_parts,
+Document.__getitem__) or when listed with --parts, and pack.py copies the parts
+that were never extracted straight from the original file.
+
+Example usage:
+    python unpack.py <office_file> <output_dir> [--workers N] [--max-pretty-size BYTES] [--timings]
+    python unpack.py <office_file> <output_dir> --lazy [--parts word/document.xml ...]
+"""
+
+import argparse
+import json
+import os
 import random
+import shutil
 import sys
+import time
 import defusedxml.minidom
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+XML_SUFFIXES = (".xml", ".rels")
+MANIFEST_NAME = ".unpack_manifest.json"
+DEFAULT_MAX_PRETTY_SIZE = 32 * 1024 * 1024
+# Below this much XML the cost of starting worker processes outweighs the gain
+MIN_PARALLEL_BYTES = 1024 * 1024
+
+_worker_zip = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack and format an Office file")
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--workers", type=int, help="Parallel formatting processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--max-pretty-size",
+        type=int,
+        default=DEFAULT_MAX_PRETTY_SIZE,
+        help="Extract XML parts larger than this many bytes without pretty-printing "
+        f"(default: {DEFAULT_MAX_PRETTY_SIZE})",
+    )
+    parser.add_argument(
+        "--timings", action="store_true", help="Print the time spent on each part"
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Only write the manifest; extract parts on first access",
+    )
+    parser.add_argument(
+        "--parts",
+        nargs="+",
+        default=[],
+        metavar="PART",
+        help="With --lazy, extract these parts (e.g. word/document.xml) now",
+    )
+    args = parser.parse_args()
+
+    try:
+        timings = unpack_document(
+            args.input_file,
+            args.output_dir,
+            workers=args.workers,
+            max_pretty_size=args.max_pretty_size,
+            lazy=args.lazy,
+            parts=args.parts,
+        )
+    except (ValueError, zipfile.BadZipFile) as e:
+        sys.exit(f"Error: {e}")
+
+    if args.lazy:
+        manifest = load_manifest(args.output_dir)
+        print(
+            f"Lazily unpacked {len(manifest['members'])} members "
+            f"({len(manifest['extracted'])} extracted)"
+        )
+
+    if args.timings:
+        print_timings(timings)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(
+    input_file,
+    output_dir,
+    workers=None,
+    max_pretty_size=DEFAULT_MAX_PRETTY_SIZE,
+    lazy=False,
+    parts=(),
+):
+    """Unpack an Office file, pretty-printing its XML parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to unpack into (created if missing)
+        workers: Number of formatting processes (default: CPU count)
+        max_pretty_size: XML parts larger than this many bytes are extracted as-is
+        lazy: If True, only write the manifest and extract the package structure
+            and `parts`; a manifest already in output_dir for the same file is reused
+        parts: Part names to extract now in lazy mode
+
+    Returns:
+        list: (part name, seconds, action) tuples, where action is "pretty" or "raw"
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if lazy:
+        manifest = load_manifest(output_path)
+        if manifest is None or not source_unchanged(manifest, input_file):
+            manifest = build_manifest(input_file, max_pretty_size)
+            save_manifest(output_path, manifest)
+        # The package structure is always extracted so relationships and content
+        # types can be followed and validated without touching the source
+        structure = [
+            name
+            for name in manifest["members"]
+            if name.endswith(".rels") or name == "[Content_Types].xml"
+        ]
+        return materialize_parts(output_path, structure + list(parts), manifest=manifest)
+
+    with zipfile.ZipFile(input_file) as zf:
+        pretty, raw = [], []
+        for info in zf.infolist():
+            if info.is_dir():
+                member_path(output_path, info.filename).mkdir(parents=True, exist_ok=True)
+            elif info.filename.endswith(XML_SUFFIXES) and info.file_size <= max_pretty_size:
+                pretty.append(info)
+            else:
+                raw.append(info)
+
+        timings = [extract_raw(zf, info, output_path) for info in raw]
+
+        # Largest parts first so one big part doesn't finish last on its own
+        pretty.sort(key=lambda info: info.file_size, reverse=True)
+        names = [info.filename for info in pretty]
+        workers = min(workers or os.cpu_count() or 1, len(names))
+        if workers > 1 and sum(info.file_size for info in pretty) >= MIN_PARALLEL_BYTES:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(input_file),),
+            ) as executor:
+                timings += executor.map(
+                    _pretty_print_worker, names, [str(output_path)] * len(names)
+                )
+        else:
+            timings += [pretty_print_member(zf, name, output_path) for name in names]
+
+    manifest = build_manifest(input_file, max_pretty_size)
+    _record_extracted(
+        output_path,
+        manifest,
+        [name for name, _, _ in timings],
+        {info.filename: info.CRC for info in raw},
+    )
+    save_manifest(output_path, manifest)
+    return timings
+
+
+def build_manifest(input_file, max_pretty_size=DEFAULT_MAX_PRETTY_SIZE):
+    """Describe a package: its source file and member names, nothing extracted yet."""
+    source = Path(input_file).resolve()
+    stat = source.stat()
+    with zipfile.ZipFile(source) as zf:
+        members = zf.namelist()
+    return {
+        "source": str(source),
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "max_pretty_size": max_pretty_size,
+        "members": members,
+        # part name -> size and CRC-32 of the file as extracted, so pack.py can
+        # tell untouched parts from edited ones
+        "extracted": {},
+    }
+
+
+def load_manifest(unpacked_dir):
+    """Return the manifest written by unpack, or None for directories without one."""
+    manifest_file = Path(unpacked_dir) / MANIFEST_NAME
+    if not manifest_file.exists():
+        return None
+    return json.loads(manifest_file.read_text(encoding="utf-8"))
+
+
+def save_manifest(unpacked_dir, manifest):
+    manifest_file = Path(unpacked_dir) / MANIFEST_NAME
+    tmp_file = manifest_file.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(manifest), encoding="utf-8")
+    os.replace(tmp_file, manifest_file)
+
+
+def unextracted_members(unpacked_dir, manifest=None):
+    """Names of package members that a lazy unpack has not extracted yet.
+
+    Parts that were extracted and later deleted are not included: they were
+    removed on purpose and must not come back from the source file.
+    """
+    unpacked_dir = Path(unpacked_dir)
+    manifest = manifest or load_manifest(unpacked_dir)
+    if manifest is None:
+        return []
+    return [
+        name
+        for name in manifest["members"]
+        if not name.endswith("/")
+        and name not in manifest["extracted"]
+        and not (unpacked_dir / name).exists()
+    ]
+
+
+def materialize_parts(unpacked_dir, names, manifest=None):
+    """Extract parts of a lazily unpacked package that are not on disk yet.
+
+    Directories without a manifest are fully unpacked and are left alone.
+
+    Returns:
+        list: (part name, seconds, action) tuples for the parts extracted
+
+    Raises:
+        ValueError: If a name is not a member of the package, or the source
+            file changed since it was unpacked
+    """
+    output_path = Path(unpacked_dir)
+    manifest = manifest or load_manifest(output_path)
+    if manifest is None:
+        return []
+
+    members = set(manifest["members"])
+    pending = []
+    for name in names:
+        if name not in members:
+            raise ValueError(f"{name} is not a part of {manifest['source']}")
+        if (
+            name not in pending
+            and name not in manifest["extracted"]
+            and not (output_path / name).exists()
+        ):
+            pending.append(name)
+    if not pending:
+        return []
+
+    source = manifest["source"]
+    if not source_unchanged(manifest, source):
+        raise ValueError(f"{source} changed since it was unpacked into {output_path}")
+
+    timings = []
+    raw_crcs = {}
+    with zipfile.ZipFile(source) as zf:
+        for name in pending:
+            info = zf.getinfo(name)
+            if name.endswith(XML_SUFFIXES) and info.file_size <= manifest["max_pretty_size"]:
+                timings.append(pretty_print_member(zf, name, output_path))
+            else:
+                timings.append(extract_raw(zf, info, output_path))
+                raw_crcs[name] = info.CRC
+
+    _record_extracted(output_path, manifest, pending, raw_crcs)
+    save_manifest(output_path, manifest)
+    return timings
+
+
+def file_crc32(path):
+    crc = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _record_extracted(output_path, manifest, names, known_crcs=None):
+    """Record size and CRC of extracted parts; raw copies already have the zip CRC."""
+    known_crcs = known_crcs or {}
+    for name in names:
+        path = output_path / name
+        crc = known_crcs.get(name)
+        manifest["extracted"][name] = {
+            "size": path.stat().st_size,
+            "crc": file_crc32(path) if crc is None else crc,
+        }
+
+
+def source_unchanged(manifest, input_file):
+    """True if input_file is the file the manifest was built from, unmodified since."""
+    try:
+        source = Path(input_file).resolve()
+        stat = source.stat()
+    except OSError:
+        return False
+    return (
+        str(source) == manifest["source"]
+        and stat.st_size == manifest["source_size"]
+        and stat.st_mtime_ns == manifest["source_mtime_ns"]
+    )
+
+
+def member_path(output_path, name):
+    """Resolve an archive member name inside output_path, rejecting path traversal."""
+    target = (output_path / name).resolve()
+    if not target.is_relative_to(output_path.resolve()):
+        raise ValueError(f"Archive member {name} would be written outside {output_path}")
+    return target
+
+
+def pretty_print_member(zf, name, output_path):
+    """Parse one XML part from the archive and write it pretty-printed."""
+    start = time.perf_counter()
+    target = member_path(output_path, name)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    with zf.open(name) as source:
+        dom = defusedxml.minidom.parse(source)
+    # Same output as toprettyxml(indent="  ", encoding="ascii"), written directly to the file
+    with open(target, "w", encoding="ascii", errors="xmlcharrefreplace", newline="\n") as f:
+        dom.writexml(f, "", "  ", "\n", encoding="ascii")
+
+    return name, time.perf_counter() - start, "pretty"
+
+
+def extract_raw(zf, info, output_path):
+    """Copy one archive member to disk unchanged."""
+    start = time.perf_counter()
+    target = member_path(output_path, info.filename)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zf.open(info) as source, open(target, "wb") as f:
+        shutil.copyfileobj(source, f)
+    return info.filename, time.perf_counter() - start, "raw"
+
+
+def _init_worker(input_file):
+    global _worker_zip
+    _worker_zip = zipfile.ZipFile(input_file)
+
+
+def _pretty_print_worker(name, output_dir):
+    return pretty_print_member(_worker_zip, name, Path(output_dir))
+
+
+def print_timings(timings):
+    """Print per-part timing, slowest first."""
+    total = sum(seconds for _, seconds, _ in timings)
+    print(f"Unpacked {len(timings)} parts ({total:.3f}s of part processing):")
+    for name, seconds, action in sorted(timings, key=lambda t: t[1], reverse=True):
+        print(f"  {seconds:8.3f}s  {action:<6}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 Validation modules for Word document processing.
 """
 
-from .base import BaseSchemaValidator
+from .base import BaseSchemaValidator, PackageIndex
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
@@ -10,6 +10,7 @@ from .redlining import RedliningValidator
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "PackageIndex",
     "PPTXSchemaValidator",
     "RedliningValidator",
 ]
@@ -2,11 +2,149 @@
 Base validator with common validation logic for document files.
 """
 
+import json
+import posixpath
 import re
-from pathlib import Path
+import zipfile
+from collections import namedtuple
+from pathlib import Path, PurePosixPath
 
 import lxml.etree
 
+PACKAGE_RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+# One <Relationship> of a .rels part. part is the package part the target
+# resolves to (None if it points outside the package); line is its source line.
+Relationship = namedtuple("Relationship", "id type target part line")
+
+
+def parse_source(source):
+    """Parse a filename or binary stream with lxml, closing the stream afterwards"""
+    try:
+        return lxml.etree.parse(source)
+    finally:
+        if hasattr(source, "close"):
+            source.close()
+
+
+class PackageIndex:
+    """Parts, relationships and content types of a package, read once per validation.
+
+    Part names are package-relative POSIX paths without a leading slash
+    ("word/document.xml"). Every readable .rels part and [Content_Types].xml is
+    parsed up front, so relationship and content-type checks become dictionary
+    and set lookups instead of re-globbing, re-parsing and stat-ing files.
+    """
+
+    CONTENT_TYPES_PART = "[Content_Types].xml"
+
+    def __init__(self, parts, readable, open_part):
+        """
+        Args:
+            parts: Names of all parts in the package
+            readable: Names of the parts that open_part can read
+            open_part: Returns a filename or binary file object for a part name
+        """
+        self.parts = set(parts)
+        self.readable = set(readable)
+        self._open_part = open_part
+        self._root_tags = {}
+
+        # .rels part -> [Relationship] in document order, or the parse error
+        self.relationships = {}
+        self.rels_errors = {}
+        for rels_part in sorted(p for p in self.readable if p.endswith(".rels")):
+            try:
+                self.relationships[rels_part] = self._read_relationships(rels_part)
+            except Exception as e:
+                self.rels_errors[rels_part] = e
+
+        # Content types: part names with an Override, extensions with a Default
+        self.has_content_types = self.CONTENT_TYPES_PART in self.readable
+        self.override_parts = set()
+        self.default_extensions = set()
+        self.content_types_error = None
+        if self.has_content_types:
+            try:
+                self._read_content_types()
+            except Exception as e:
+                self.content_types_error = e
+
+    def rels_part_for(self, part):
+        """Name of the .rels part holding part's relationships: dir/_rels/file.xml.rels"""
+        folder, name = posixpath.split(part)
+        return posixpath.join(folder, "_rels", f"{name}.rels")
+
+    def parts_in(self, folder, suffix):
+        """Readable parts directly inside folder whose names end with suffix, sorted"""
+        return sorted(
+            p for p in self.readable
+            if posixpath.dirname(p) == folder and p.endswith(suffix)
+        )
+
+    def root_tag(self, part):
+        """Local name of a part's root element, reading no further than its start tag"""
+        if part not in self._root_tags:
+            source = self._open_part(part)
+            try:
+                _, root = next(lxml.etree.iterparse(source, events=("start",)))
+                tag = root.tag
+            finally:
+                if hasattr(source, "close"):
+                    source.close()
+            self._root_tags[part] = tag.split("}")[-1] if "}" in tag else tag
+        return self._root_tags[part]
+
+    def parse(self, part):
+        """Parse a readable part into an lxml tree"""
+        return parse_source(self._open_part(part))
+
+    def _read_relationships(self, rels_part):
+        root = self.parse(rels_part).getroot()
+        # Targets are relative to the folder of the part the .rels file belongs
+        # to; the package's own _rels/.rels belongs to the root
+        if posixpath.basename(rels_part) == ".rels":
+            base = ""
+        else:
+            base = posixpath.dirname(posixpath.dirname(rels_part))
+        return [
+            Relationship(
+                rel.get("Id"),
+                rel.get("Type", ""),
+                rel.get("Target"),
+                self._resolve(base, rel.get("Target")),
+                rel.sourceline,
+            )
+            for rel in root.iter(f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship")
+        ]
+
+    @staticmethod
+    def _resolve(base, target):
+        if not target:
+            return None
+        # Absolute part names start from the package root
+        path = target.lstrip("/") if target.startswith("/") else posixpath.join(base, target)
+        path = posixpath.normpath(path)
+        if path == ".." or path.startswith("../"):
+            return None
+        return path
+
+    def _read_content_types(self):
+        root = self.parse(self.CONTENT_TYPES_PART).getroot()
+        for override in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                self.override_parts.add(part_name.lstrip("/"))
+        for default in root.iter(f"{{{CONTENT_TYPES_NAMESPACE}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                self.default_extensions.add(extension.lower())
+
+
+# Compiled XSD schemas by path, shared by all validators in a process
+_SCHEMA_CACHE = {}
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -71,15 +209,14 @@ class BaseSchemaValidator:
     XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
     # Common OOXML namespaces used across validators
-    PACKAGE_RELATIONSHIPS_NAMESPACE = (
-        "http://schemas.openxmlformats.org/package/2006/relationships"
-    )
+    PACKAGE_RELATIONSHIPS_NAMESPACE = PACKAGE_RELATIONSHIPS_NAMESPACE
     OFFICE_RELATIONSHIPS_NAMESPACE = (
         "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
     )
-    CONTENT_TYPES_NAMESPACE = (
-        "http://schemas.openxmlformats.org/package/2006/content-types"
-    )
+    CONTENT_TYPES_NAMESPACE = CONTENT_TYPES_NAMESPACE
+
+    # Manifest written by unpack.py (MANIFEST_NAME there); not a package part
+    UNPACK_MANIFEST_NAME = ".unpack_manifest.json"
 
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
@@ -104,22 +241,114 @@ class BaseSchemaValidator:
     }
 
     def __init__(self, unpacked_dir, original_file, verbose=False):
+        """
+        Args:
+            unpacked_dir: Unpacked document directory, or the document itself
+                (.docx/.pptx/.xlsx) to read its parts straight from the zip
+            original_file: Original document to compare against, or None to
+                report every schema error as new
+            verbose: Enable verbose output
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+        self.original_file = Path(original_file) if original_file is not None else None
         self.verbose = verbose
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
+        # In zip mode files are addressed as paths under the archive path, so
+        # the checks report the same relative paths as for an unpacked directory
+        self.archive = None
+        if self.unpacked_dir.is_file():
+            self.archive = zipfile.ZipFile(self.unpacked_dir)
+
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
-        self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
-        ]
+        if self.archive is not None:
+            names = [n for n in self.archive.namelist() if not n.endswith("/")]
+            self.xml_files = [
+                self.unpacked_dir / name
+                for pattern in patterns
+                for name in names
+                if name.endswith(pattern[1:])
+            ]
+        else:
+            self.xml_files = [
+                f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parts of a lazily unpacked package that have not been extracted yet.
+        # They are unchanged from the original, so they are not validated, but
+        # they still count as existing when checking references.
+        self.unextracted_files = self._load_unextracted_files()
+        self._package = None
+
+    def close(self):
+        """Close the document archive in zip mode."""
+        if self.archive is not None:
+            self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _load_unextracted_files(self):
+        if self.archive is not None:
+            return set()
+        manifest_file = self.unpacked_dir / self.UNPACK_MANIFEST_NAME
+        if not manifest_file.exists():
+            return set()
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        return {
+            (self.unpacked_dir / name).resolve()
+            for name in manifest["members"]
+            if not name.endswith("/")
+            and name not in manifest["extracted"]
+            and not (self.unpacked_dir / name).exists()
+        }
+
+    @property
+    def package(self):
+        """PackageIndex of the unpacked document, built on first use."""
+        if self._package is None and self.archive is not None:
+            names = [n for n in self.archive.namelist() if not n.endswith("/")]
+            self._package = PackageIndex(names, names, self._open_part)
+        elif self._package is None:
+            on_disk = {
+                f.relative_to(self.unpacked_dir).as_posix()
+                for f in self.unpacked_dir.rglob("*")
+                if f.is_file() and f.name != self.UNPACK_MANIFEST_NAME
+            }
+            unextracted = {
+                f.relative_to(self.unpacked_dir).as_posix()
+                for f in self.unextracted_files
+            }
+            self._package = PackageIndex(
+                on_disk | unextracted,
+                on_disk,
+                self._open_part,
+            )
+        return self._package
+
+    def _part_name(self, path):
+        """Package part name of a file in the unpacked directory."""
+        return path.relative_to(self.unpacked_dir).as_posix()
+
+    def _open_part(self, part):
+        """Filename of a part, or in zip mode a stream of the archive member."""
+        if self.archive is not None:
+            return self.archive.open(part)
+        return str(self.unpacked_dir / part)
+
+    def _parse(self, xml_file):
+        """Parse a file of the document into an lxml tree."""
+        return parse_source(self._open_part(self._part_name(xml_file)))
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -131,7 +360,7 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -159,7 +388,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -190,7 +419,7 @@ class BaseSchemaValidator:
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
                 file_ids = {}  # Track IDs that must be unique within this file
 
                 # Remove all mc:AlternateContent elements from the tree
@@ -279,94 +508,57 @@ class BaseSchemaValidator:
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        package = self.package
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        # All .rels files
+        rels_parts = sorted(set(package.relationships) | set(package.rels_errors))
 
-        if not rels_files:
+        if not rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
+        # Get all files in the package (excluding reference files)
+        all_files = {
+            part
+            for part in package.parts
+            if posixpath.basename(part) != "[Content_Types].xml"
+            and not part.endswith(".rels")
+        }  # These files are not referenced by .rels
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(rels_parts)} .rels files and {len(all_files)} target files"
             )
 
         # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
+        for rels_part in rels_parts:
+            if rels_part in package.rels_errors:
+                errors.append(
+                    f"  Error parsing {rels_part}: {package.rels_errors[rels_part]}"
+                )
+                continue
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
+            for rel in package.relationships[rels_part]:
+                if rel.target and not rel.target.startswith(
+                    ("http", "mailto:")
+                ):  # Skip external URLs
+                    if rel.part in package.parts:
+                        all_referenced_files.add(rel.part)
+                    else:
                         errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                            f"  {rels_part}: Line {rel.line}: Broken reference to {rel.target}"
                         )
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
-
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
+        unreferenced_files = all_files - all_referenced_files
 
         if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+            for unref_file in sorted(unreferenced_files, key=PurePosixPath):
+                errors.append(f"  Unreferenced file: {unref_file}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
@@ -390,9 +582,8 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        package = self.package
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
@@ -402,29 +593,26 @@ class BaseSchemaValidator:
 
             # Determine the corresponding .rels file
             # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            rels_part = package.rels_part_for(self._part_name(xml_file))
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if rels_part not in package.readable:
                 continue
 
             try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                # Valid relationship IDs and their types
+                if rels_part in package.rels_errors:
+                    raise package.rels_errors[rels_part]
                 rid_to_type = {}
 
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
+                for rel in package.relationships[rels_part]:
+                    rid = rel.id
+                    rel_type = rel.type
                     if rid:
                         # Check for duplicate rIds
                         if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
                             errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
+                                f"  {rels_part}: Line {rel.line}: "
                                 f"Duplicate relationship ID '{rid}' (IDs must be unique)"
                             )
                         # Extract just the type name from the full URL
@@ -434,7 +622,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -523,33 +711,17 @@ class BaseSchemaValidator:
         """Validate that all content files are properly declared in [Content_Types].xml."""
         errors = []
 
-        # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        package = self.package
+        if not package.has_content_types:
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Declared parts and extensions
+            if package.content_types_error is not None:
+                raise package.content_types_error
+            declared_parts = package.override_parts
+            declared_extensions = package.default_extensions
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,15 +747,12 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            # Get all files in the package
+            all_files = sorted(package.parts, key=PurePosixPath)
 
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
+                path_str = self._part_name(xml_file)
 
                 # Skip non-content files
                 if any(
@@ -593,8 +762,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                    root_name = package.root_tag(path_str)
 
                     if root_name in declarable_roots and path_str not in declared_parts:
                         errors.append(
@@ -605,7 +773,8 @@ class BaseSchemaValidator:
                     continue  # Skip unparseable files
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for part in all_files:
+                file_path = PurePosixPath(part)
                 # Skip XML files and metadata files (already checked above)
                 if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
@@ -618,7 +787,7 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
+                        relative_path = part
                         errors.append(
                             f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
                         )
@@ -654,7 +823,7 @@ class BaseSchemaValidator:
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
+            xml_file, unpacked_dir, self._open_part(self._part_name(xml_file))
         )
 
         if is_valid is None:
@@ -823,24 +992,49 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _load_schema(self, schema_path):
+        """Compiled XSD schema, loaded once per process."""
+        if schema_path not in _SCHEMA_CACHE:
+            with open(schema_path, "rb") as xsd_file:
+                parser = lxml.etree.XMLParser()
+                xsd_doc = lxml.etree.parse(
+                    xsd_file, parser=parser, base_url=str(schema_path)
+                )
+            try:
+                _SCHEMA_CACHE[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+            except lxml.etree.XMLSchemaParseError as e:
+                _SCHEMA_CACHE[schema_path] = e  # Don't retry for every file
+        schema = _SCHEMA_CACHE[schema_path]
+        if isinstance(schema, Exception):
+            raise schema
+        return schema
+
+    def _validate_single_file_xsd(self, xml_file, base_path, source=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        source is a filename or binary stream to read the file from, if not xml_file.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
+            if hasattr(source, "close"):
+                source.close()
             return None, None  # Skip file
 
         try:
             # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            try:
+                schema = self._load_schema(schema_path)
+            except lxml.etree.XMLSchemaParseError:
+                if hasattr(source, "close"):
+                    source.close()
+                # Without an original to compare against, a schema that cannot
+                # be compiled says nothing about this file
+                if self.original_file is None:
+                    return None, None
+                raise
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            xml_doc = parse_source(source if source is not None else str(xml_file))
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -875,31 +1069,24 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
+        if self.original_file is None:
+            return set()
 
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        part = self._part_name(xml_file)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
+        # Read the corresponding file straight from the original
+        with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+            try:
+                info = zip_ref.getinfo(part)
+            except KeyError:
                 # File didn't exist in original, so no original errors
                 return set()
 
             # Validate the specific file in original
             is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+                PurePosixPath(part), PurePosixPath(), zip_ref.open(info)
             )
             return errors if errors else set()
 
@@ -86,7 +86,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         for xml_file in self.xml_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse(xml_file).getroot()
 
                 # Check all elements for ID attributes
                 for elem in root.iter():
@@ -130,9 +130,10 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         import lxml.etree
 
         errors = []
+        package = self.package
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = package.parts_in("ppt/slideMasters", ".xml")
 
         if not slide_masters:
             if self.verbose:
@@ -142,29 +143,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = package.parse(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+                rels_part = package.rels_part_for(slide_master)
 
-                if not rels_file.exists():
+                if rels_part not in package.readable:
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        f"  {slide_master}: "
+                        f"Missing relationships file: {rels_part}"
                     )
                     continue
 
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                if rels_part in package.rels_errors:
+                    raise package.rels_errors[rels_part]
 
                 # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
+                valid_layout_rids = {
+                    rel.id
+                    for rel in package.relationships[rels_part]
+                    if "slideLayout" in rel.type
+                }
 
                 # Find all sldLayoutId elements in the slide master
                 for sld_layout_id in root.findall(
@@ -177,15 +176,13 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
+                            f"  {slide_master}: "
                             f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
                             f"references r:id='{r_id}' which is not found in slide layout relationships"
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(f"  {slide_master}: Error: {e}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
@@ -202,32 +199,25 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        package = self.package
+        slide_rels_files = package.parts_in("ppt/slides/_rels", ".xml.rels")
 
         for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all slideLayout relationships
-                layout_rels = [
-                    rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
-                ]
-
-                if len(layout_rels) > 1:
-                    errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
-                    )
-
-            except Exception as e:
+            if rels_file in package.rels_errors:
+                errors.append(f"  {rels_file}: Error: {package.rels_errors[rels_file]}")
+                continue
+
+            # Find all slideLayout relationships
+            layout_rels = [
+                rel
+                for rel in package.relationships[rels_file]
+                if "slideLayout" in rel.type
+            ]
+
+            if len(layout_rels) > 1:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {rels_file}: has {len(layout_rels)} slideLayout references"
                 )
 
         if errors:
@@ -242,13 +232,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
+        package = self.package
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = package.parts_in("ppt/slides/_rels", ".xml.rels")
 
         if not slide_rels_files:
             if self.verbose:
@@ -256,36 +245,26 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             return True
 
         for rels_file in slide_rels_files:
-            try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            # Normalize the target path to handle relative paths
-                            normalized_target = target.replace("../", "")
-
-                            # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
-                            )  # e.g., "slide1"
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append(
-                                (slide_name, rels_file)
-                            )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            if rels_file in package.rels_errors:
+                errors.append(f"  {rels_file}: Error: {package.rels_errors[rels_file]}")
+                continue
+
+            # Find all notesSlide relationships
+            for rel in package.relationships[rels_file]:
+                if "notesSlide" in rel.type and rel.target:
+                    # Normalize the target path to handle relative paths
+                    normalized_target = rel.target.replace("../", "")
+
+                    # Track which slide references this notesSlide
+                    slide_name = rels_file.split("/")[-1].replace(
+                        ".xml.rels", ""
+                    )  # e.g., "slide1"
+
+                    if normalized_target not in notes_slide_references:
+                        notes_slide_references[normalized_target] = []
+                    notes_slide_references[normalized_target].append(
+                        (slide_name, rels_file)
+                    )
 
         # Check for duplicate references
         for target, references in notes_slide_references.items():
@@ -295,7 +274,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                     f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
                 )
                 for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                    errors.append(f"    - {rels_file}")
 
         if errors:
             print(
@@ -2,11 +2,20 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import re
+import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 
+# Bounds on diff work (roughly sequence length x edit distance), so huge documents
+# that differ almost everywhere still produce a report quickly
+MAX_DIFF_WORK = 2_000_000
+# Changed blocks longer than this are diffed by word rather than by character
+MAX_CHAR_DIFF_LENGTH = 20_000
+MAX_DIFF_LINES = 200
+
+WORD_PATTERN = re.compile(r"\w+|\s+|[^\w\s]")
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
@@ -23,96 +32,74 @@ class RedliningValidator:
         """Main validation method that returns True if valid, False otherwise."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
+        modified = self._open_modified_document()
+        if modified is None:
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        # Text of the modified document with Claude's tracked changes removed,
+        # noting whether there were any
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            with modified as f:
+                modified_text, has_claude_changes = self._extract_text_without_claude_changes(f)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
 
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not has_claude_changes:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
             return True
 
+        # Read the original document.xml straight from the docx
+        try:
+            with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                if "word/document.xml" not in zip_ref.namelist():
+                    print(
+                        f"FAILED - Original document.xml not found in {self.original_docx}"
+                    )
+                    return False
+                with zip_ref.open("word/document.xml") as f:
+                    original_text, _ = self._extract_text_without_claude_changes(f)
+        except ET.ParseError as e:
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        return True
+
+    def _open_modified_document(self):
+        """Binary stream of the modified document.xml, or None if it is missing.
+
+        unpacked_dir may also be the modified .docx itself, which is read from
+        the zip without unpacking.
+        """
+        if self.unpacked_dir.is_file():
+            with zipfile.ZipFile(self.unpacked_dir, "r") as zip_ref:
+                try:
+                    info = zip_ref.getinfo("word/document.xml")
+                except KeyError:
+                    return None
+                # The member stays readable after the archive is closed
+                return zip_ref.open(info)
+        modified_file = self.unpacked_dir / "word" / "document.xml"
+        if not modified_file.exists():
+            return None
+        return open(modified_file, "rb")
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed character/word-level differences."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +114,304 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff of the changed paragraphs, in git --word-diff=plain style.
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
+        Paragraphs are aligned first, then each changed block is diffed by character,
+        falling back to words and then whole paragraphs when that would be too much work.
+        """
+        original_lines = original_text.split("\n")
+        modified_lines = modified_text.split("\n")
+
+        lines = []
+        for tag, i1, i2, j1, j2 in _diff_opcodes(original_lines, modified_lines):
+            if tag == "equal":
+                continue
+            lines.extend(
+                _render_block(original_lines[i1:i2], modified_lines[j1:j2]).split("\n")
+            )
+            if len(lines) > MAX_DIFF_LINES:
+                break
+
+        lines = [line for line in lines if line.strip()]
+        if len(lines) > MAX_DIFF_LINES:
+            lines = lines[:MAX_DIFF_LINES] + ["... (more differences not shown)"]
+        return "\n".join(lines) or None
+
+    def _extract_text_without_claude_changes(self, source):
+        """Extract paragraph text from document.xml as if Claude's tracked changes were rejected.
+
+        Claude's w:ins elements are dropped and Claude's w:del elements unwrapped, with
+        their w:delText counted as text. Empty paragraphs are skipped to avoid false
+        positives when tracked insertions add only structural elements without text
+        content. The XML is streamed, and each element is discarded once it has been
+        read, so memory is bounded by the open paragraph rather than the document.
+
+        Args:
+            source: Binary file object with the document.xml contents
+
+        Returns:
+            tuple: (paragraph texts joined by newlines, whether any w:ins or w:del
+                authored by Claude was found)
+        """
+        w = self.namespaces["w"]
+        p_tag, t_tag = f"{{{w}}}p", f"{{{w}}}t"
+        ins_tag, del_tag, deltext_tag = f"{{{w}}}ins", f"{{{w}}}del", f"{{{w}}}delText"
+        author_attr = f"{{{w}}}author"
+
+        paragraphs = []  # in document order; None until the paragraph is closed
+        open_paragraphs = []  # (element, index in paragraphs, text parts)
+        stack = []
+        claude_ins_depth = claude_del_depth = 0
+        found_claude_changes = False
+
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                stack.append(elem)
+                if tag in (ins_tag, del_tag) and elem.get(author_attr) == "Claude":
+                    found_claude_changes = True
+                    if tag == ins_tag:
+                        claude_ins_depth += 1
+                    else:
+                        claude_del_depth += 1
+                elif tag == p_tag and not claude_ins_depth:
+                    open_paragraphs.append((elem, len(paragraphs), []))
+                    paragraphs.append(None)
+                continue
+
+            if not claude_ins_depth and elem.text:
+                # Nested paragraphs (e.g. in text boxes) also count towards the
+                # text of every paragraph that contains them
+                if tag == t_tag or (tag == deltext_tag and claude_del_depth):
+                    for _, _, parts in open_paragraphs:
+                        parts.append(elem.text)
+            if tag in (ins_tag, del_tag) and elem.get(author_attr) == "Claude":
+                if tag == ins_tag:
+                    claude_ins_depth -= 1
+                else:
+                    claude_del_depth -= 1
+            elif open_paragraphs and open_paragraphs[-1][0] is elem:
+                _, index, parts = open_paragraphs.pop()
+                paragraphs[index] = "".join(parts)
+
+            # The element has just been completed, so it is its parent's last child
+            stack.pop()
+            if stack:
+                del stack[-1][-1]
+
+        return "\n".join(text for text in paragraphs if text), found_claude_changes
+
+
+def _diff_opcodes(a, b):
+    """difflib-style opcodes aligning two lists of paragraphs (patience diff)."""
+    steps = []
+    _patience_diff(a, 0, len(a), b, 0, len(b), steps)
+    return _group_steps(steps)
+
+
+def _patience_diff(a, alo, ahi, b, blo, bhi, steps):
+    """Append ("equal"|"delete"|"insert"|"replace", i1, i2, j1, j2) steps for a[alo:ahi] vs b[blo:bhi].
+
+    Paragraphs that occur exactly once on each side anchor the alignment (longest
+    increasing run of anchors); the gaps between anchors are diffed recursively,
+    and with Myers when they have no unique paragraphs of their own.
+    """
+    # Common prefix and suffix
+    start_a, start_b = alo, blo
+    while alo < ahi and blo < bhi and a[alo] == b[blo]:
+        alo += 1
+        blo += 1
+    if alo > start_a:
+        steps.append(("equal", start_a, alo, start_b, blo))
+    end_a, end_b = ahi, bhi
+    while ahi > alo and bhi > blo and a[ahi - 1] == b[bhi - 1]:
+        ahi -= 1
+        bhi -= 1
+
+    if alo == ahi or blo == bhi:
+        if alo < ahi:
+            steps.append(("delete", alo, ahi, blo, blo))
+        elif blo < bhi:
+            steps.append(("insert", alo, alo, blo, bhi))
+    else:
+        anchors = _unique_anchors(a, alo, ahi, b, blo, bhi)
+        if anchors:
+            i, j = alo, blo
+            for ai, bj in anchors:
+                _patience_diff(a, i, ai, b, j, bj, steps)
+                steps.append(("equal", ai, ai + 1, bj, bj + 1))
+                i, j = ai + 1, bj + 1
+            _patience_diff(a, i, ahi, b, j, bhi, steps)
+        else:
+            opcodes = _myers_opcodes(a[alo:ahi], b[blo:bhi])
+            if opcodes is None:
+                steps.append(("replace", alo, ahi, blo, bhi))
+            else:
+                steps.extend(
+                    (tag, alo + i1, alo + i2, blo + j1, blo + j2)
+                    for tag, i1, i2, j1, j2 in opcodes
                 )
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
-        """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+    if ahi < end_a:
+        steps.append(("equal", ahi, end_a, bhi, end_b))
+
+
+def _unique_anchors(a, alo, ahi, b, blo, bhi):
+    """Pairs (i, j) of paragraphs unique on both sides, longest run in order on both."""
+    counts = {}
+    for i in range(alo, ahi):
+        entry = counts.setdefault(a[i], [0, 0, i])
+        entry[0] += 1
+    for j in range(blo, bhi):
+        entry = counts.get(b[j])
+        if entry is not None:
+            entry[1] += 1
+            entry.append(j)
+    pairs = sorted(
+        (entry[2], entry[3])
+        for entry in counts.values()
+        if entry[0] == 1 and entry[1] == 1
+    )
+    if not pairs:
+        return []
+
+    # Longest increasing subsequence of b-indices (patience sorting)
+    tails, tail_index, previous = [], [], [None] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < j:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > 0:
+            previous[n] = tail_index[lo - 1]
+        if lo == len(tails):
+            tails.append(j)
+            tail_index.append(n)
+        else:
+            tails[lo] = j
+            tail_index[lo] = n
+    result = []
+    n = tail_index[-1]
+    while n is not None:
+        result.append(pairs[n])
+        n = previous[n]
+    return result[::-1]
+
+
+def _myers_opcodes(a, b, max_work=MAX_DIFF_WORK):
+    """difflib-style opcodes from Myers' O(ND) diff, or None if it would exceed max_work."""
+    n, m = len(a), len(b)
+    if n + m == 0:
+        return []
+    max_edits = min(n + m, max_work // (n + m))
+
+    offset = max_edits + 1
+    v = [0] * (2 * max_edits + 3)
+    trace = []
+    for d in range(max_edits + 1):
+        trace.append(v[offset - d - 1 : offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _group_steps(_myers_backtrack(trace, n, m))
+    return None
+
+
+def _myers_backtrack(trace, n, m):
+    steps = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]  # furthest x per diagonal after d - 1 edits, diagonals -d-1..d+1
+        k = x - y
+        if k == -d or (k != d and v[k - 1 + d + 1] < v[k + 1 + d + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k + d + 1] if d > 0 else 0
+        prev_y = prev_x - prev_k if d > 0 else 0
+        if x > prev_x and y > prev_y:
+            snake = min(x - prev_x, y - prev_y) if d > 0 else x
+            steps.append(("equal", x - snake, x, y - snake, y))
+            x, y = x - snake, y - snake
+        if d > 0:
+            if x == prev_x:
+                steps.append(("insert", x, x, prev_y, y))
+            else:
+                steps.append(("delete", prev_x, x, y, y))
+            x, y = prev_x, prev_y
+    return steps[::-1]
+
+
+def _group_steps(steps):
+    """Merge consecutive steps, combining adjacent deletes and inserts into replaces."""
+    opcodes = []
+    for tag, i1, i2, j1, j2 in steps:
+        if i1 == i2 and j1 == j2:
+            continue
+        if opcodes and (opcodes[-1][0] == "equal") == (tag == "equal"):
+            last_tag, li1, _, lj1, _ = opcodes[-1]
+            merged = tag if last_tag == tag else "replace"
+            opcodes[-1] = (merged, li1, i2, lj1, j2)
+            continue
+        opcodes.append((tag, i1, i2, j1, j2))
+    return opcodes
+
+
+def _render_block(original_lines, modified_lines):
+    """Render one block of changed paragraphs with [-deleted-] and {+inserted+} markers."""
+    original = "\n".join(original_lines)
+    modified = "\n".join(modified_lines)
+
+    opcodes = None
+    if len(original) + len(modified) <= MAX_CHAR_DIFF_LENGTH:
+        a, b = original, modified
+        opcodes = _myers_opcodes(a, b)
+    if opcodes is None:
+        a, b = WORD_PATTERN.findall(original), WORD_PATTERN.findall(modified)
+        opcodes = _myers_opcodes(a, b)
+    if opcodes is None:
+        a, b = [original], [modified]
+        opcodes = [("replace", 0, 1, 0, 1)]
+
+    parts = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            parts.append("".join(a[i1:i2]))
+            continue
+        if tag in ("delete", "replace"):
+            parts.append(_mark("".join(a[i1:i2]), "[-", "-]"))
+        if tag in ("insert", "replace"):
+            parts.append(_mark("".join(b[j1:j2]), "{+", "+}"))
+    return "".join(parts)
+
+
+def _mark(text, open_marker, close_marker):
+    """Wrap text in markers, closing and reopening them at paragraph breaks."""
+    return "\n".join(
+        f"{open_marker}{part}{close_marker}" if part else part
+        for part in text.split("\n")
+    )
 
 
 if __name__ == "__main__":
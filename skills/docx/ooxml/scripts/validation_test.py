@@ -0,0 +1,246 @@
+import contextlib
+import io
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path, PurePosixPath
+from unittest import mock
+
+import lxml.etree
+
+from validate import validate_archive
+from validation import PackageIndex, PPTXSchemaValidator
+
+RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+
+
+def rels(*relationships):
+    """A .rels part from (id, type, target) triples."""
+    body = "".join(
+        f'<Relationship Id="{rid}" Type="{REL_TYPE}{rel_type}" Target="{target}"/>'
+        for rid, rel_type, target in relationships
+    )
+    return f'<?xml version="1.0"?><Relationships xmlns="{RELS_NS}">{body}</Relationships>'
+
+
+CONTENT_TYPES = (
+    '<?xml version="1.0"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="PNG" ContentType="image/png"/>'
+    '<Override PartName="/ppt/presentation.xml" ContentType="application/xml"/>'
+    "</Types>"
+)
+MASTER = (
+    '<?xml version="1.0"?>'
+    '<p:sldMaster xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<p:sldLayoutIdLst><p:sldLayoutId id="2147483649" r:id="rId1"/>'
+    '<p:sldLayoutId id="2147483650" r:id="rId2"/></p:sldLayoutIdLst></p:sldMaster>'
+)
+
+PARTS = {
+    "[Content_Types].xml": CONTENT_TYPES,
+    "_rels/.rels": rels(("rId1", "officeDocument", "ppt/presentation.xml")),
+    "ppt/presentation.xml": "<presentation/>",
+    "ppt/_rels/presentation.xml.rels": rels(
+        ("rId1", "slide", "slides/slide1.xml"),
+        ("rId2", "slide", "/ppt/slides/slide2.xml"),
+        ("rId3", "slideMaster", "slideMasters/slideMaster1.xml"),
+        ("rId4", "image", "../../outside.png"),
+    ),
+    "ppt/slides/slide1.xml": "<sld/>",
+    "ppt/slides/slide2.xml": "<sld/>",
+    "ppt/slides/_rels/slide1.xml.rels": rels(
+        ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+        ("rId2", "notesSlide", "../notesSlides/notesSlide1.xml"),
+    ),
+    "ppt/slides/_rels/slide2.xml.rels": rels(
+        ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+        ("rId2", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+        ("rId3", "notesSlide", "../notesSlides/notesSlide1.xml"),
+    ),
+    "ppt/slideLayouts/slideLayout1.xml": "<sldLayout/>",
+    "ppt/notesSlides/notesSlide1.xml": "<notes/>",
+    "ppt/slideMasters/slideMaster1.xml": MASTER,
+    "ppt/slideMasters/_rels/slideMaster1.xml.rels": rels(
+        ("rId1", "slideLayout", "../slideLayouts/slideLayout1.xml"),
+    ),
+    "ppt/media/broken.xml.rels": "<Relationships",
+}
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestPackageIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        for name, content in PARTS.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        self.validator = PPTXSchemaValidator(self.root, self.root / "deck.pptx")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_check(self, check):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            passed = check()
+        return passed, out.getvalue()
+
+    def test_index_resolves_relationship_targets(self):
+        package = self.validator.package
+        self.assertIs(package, self.validator.package)
+        self.assertEqual(
+            [rel.part for rel in package.relationships["ppt/_rels/presentation.xml.rels"]],
+            ["ppt/slides/slide1.xml", "ppt/slides/slide2.xml",
+             "ppt/slideMasters/slideMaster1.xml", None],
+        )
+        self.assertEqual(
+            package.relationships["_rels/.rels"][0].part, "ppt/presentation.xml"
+        )
+        self.assertEqual(
+            package.rels_part_for("ppt/slides/slide1.xml"),
+            "ppt/slides/_rels/slide1.xml.rels",
+        )
+        self.assertIn("ppt/media/broken.xml.rels", package.rels_errors)
+        self.assertEqual(package.override_parts, {"ppt/presentation.xml"})
+        self.assertEqual(package.default_extensions, {"rels", "png"})
+        self.assertEqual(package.root_tag("ppt/slideMasters/slideMaster1.xml"), "sldMaster")
+
+    def test_index_reads_through_any_opener(self):
+        package = PackageIndex(
+            ["word/document.xml", "word/_rels/document.xml.rels", "word/media/a.png"],
+            ["word/document.xml", "word/_rels/document.xml.rels"],
+            lambda part: io.BytesIO(
+                rels(("rId1", "image", "media/a.png")).encode()
+                if part.endswith(".rels")
+                else b"<w:document xmlns:w='urn:w'/>"
+            ),
+        )
+        self.assertEqual(
+            package.relationships["word/_rels/document.xml.rels"][0].part, "word/media/a.png"
+        )
+        self.assertEqual(package.root_tag("word/document.xml"), "document")
+        self.assertFalse(package.has_content_types)
+
+    def test_file_references_use_resolved_targets(self):
+        passed, output = self.run_check(self.validator.validate_file_references)
+        self.assertFalse(passed)
+        self.assertIn("Broken reference to ../../outside.png", output)
+        self.assertNotIn("slide2.xml", output)  # absolute target resolves
+        self.assertIn("Error parsing ppt/media/broken.xml.rels", output)
+
+    def test_pptx_checks_share_the_index(self):
+        passed, output = self.run_check(self.validator.validate_slide_layout_ids)
+        self.assertFalse(passed)
+        self.assertIn(
+            "ppt/slideMasters/slideMaster1.xml: Line 1: sldLayoutId with id='2147483650' "
+            "references r:id='rId2'",
+            output,
+        )
+
+        passed, output = self.run_check(self.validator.validate_no_duplicate_slide_layouts)
+        self.assertFalse(passed)
+        self.assertIn("ppt/slides/_rels/slide2.xml.rels: has 2 slideLayout references", output)
+        self.assertNotIn("slide1.xml.rels", output)
+
+        passed, output = self.run_check(self.validator.validate_notes_slide_references)
+        self.assertFalse(passed)
+        self.assertIn(
+            "Notes slide 'notesSlides/notesSlide1.xml' is referenced by multiple slides: "
+            "slide1, slide2",
+            output,
+        )
+
+
+class TestZipInput(unittest.TestCase):
+    CHECKS = [
+        "validate_xml",
+        "validate_namespaces",
+        "validate_unique_ids",
+        "validate_uuid_ids",
+        "validate_file_references",
+        "validate_slide_layout_ids",
+        "validate_content_types",
+        "validate_notes_slide_references",
+        "validate_all_relationship_ids",
+        "validate_no_duplicate_slide_layouts",
+    ]
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.unpacked = self.root / "unpacked"
+        self.archive = self.root / "deck.pptx"
+        with zipfile.ZipFile(self.archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in PARTS.items():
+                path = self.unpacked / name
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(content, encoding="utf-8")
+                zf.writestr(name, content)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_checks(self, document):
+        results = []
+        with PPTXSchemaValidator(document, self.archive, verbose=True) as validator:
+            for check in self.CHECKS:
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    passed = getattr(validator, check)()
+                # Per-file errors follow directory or archive order
+                results.append((check, passed, sorted(out.getvalue().splitlines())))
+        return results
+
+    def test_archive_gives_the_same_results_as_unpacked_directory(self):
+        from_zip = self.run_checks(self.archive)
+        self.assertEqual(from_zip, self.run_checks(self.unpacked))
+        self.assertIn(
+            "  ppt/media/broken.xml.rels: Line 1: Couldn't find end of Start Tag "
+            "Relationships line 1, line 1, column 15",
+            from_zip[0][2],
+        )
+
+    def test_source_is_closed_when_schema_fails_to_compile(self):
+        for original, expected in [(None, (None, None)), (self.archive, (False, {"bad schema"}))]:
+            source = io.BytesIO(PARTS["_rels/.rels"].encode())
+            with PPTXSchemaValidator(self.archive, original) as validator, mock.patch.object(
+                validator, "_load_schema", side_effect=lxml.etree.XMLSchemaParseError("bad schema")
+            ):
+                result = validator._validate_single_file_xsd(
+                    PurePosixPath("_rels/.rels"), PurePosixPath(), source
+                )
+            self.assertEqual(result, expected)
+            self.assertTrue(source.closed)
+
+    def test_part_missing_from_original_has_no_errors(self):
+        validator = PPTXSchemaValidator(self.unpacked, self.archive)
+        self.assertEqual(validator._get_original_file_errors(self.unpacked / "ppt/slides/slide9.xml"), set())
+
+    def test_validate_archive_without_original(self):
+        passed, output = validate_archive(self.archive)
+        self.assertFalse(passed)
+        self.assertTrue(output.startswith("FAILED - Found 1 XML violations:"))
+
+        fixed = self.root / "fixed.pptx"
+        with zipfile.ZipFile(fixed, "w") as zf:
+            for name, content in PARTS.items():
+                zf.writestr(name, rels() if name == "ppt/media/broken.xml.rels" else content)
+        passed, output = validate_archive(fixed)
+        self.assertFalse(passed)
+        self.assertIn("Broken reference to ../../outside.png", output)
+
+        not_a_zip = self.root / "not_a_zip.pptx"
+        not_a_zip.write_text("not a zip")
+        passed, output = validate_archive(not_a_zip)
+        self.assertFalse(passed)
+        self.assertIn("FAILED - Error reading", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
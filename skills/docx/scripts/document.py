@@ -35,6 +35,7 @@ from pathlib import Path
 
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
+from ooxml.scripts.unpack import load_manifest, materialize_parts
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
@@ -43,6 +44,18 @@ from .utilities import XMLEditor
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Parts checked for existence before they are opened; in a lazily unpacked
+# directory (unpack.py --lazy) these are extracted up front
+EAGER_PARTS = [
+    "word/document.xml",
+    "word/settings.xml",
+    "word/people.xml",
+    "word/comments.xml",
+    "word/commentsExtended.xml",
+    "word/commentsIds.xml",
+    "word/commentsExtensible.xml",
+]
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -641,6 +654,15 @@ class Document:
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
         shutil.copytree(self.original_path, self.unpacked_path)
 
+        # Lazily unpacked directory: other parts are extracted on first access
+        self._manifest = load_manifest(self.unpacked_path)
+        if self._manifest:
+            materialize_parts(
+                self.unpacked_path,
+                [p for p in EAGER_PARTS if p in self._manifest["members"]],
+                manifest=self._manifest,
+            )
+
         # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
         self.original_docx = Path(self.temp_dir) / "original.docx"
         pack_document(self.original_path, self.original_docx, validate=False)
@@ -684,6 +706,9 @@ class Document:
         Enables lazy-loaded editors with bracket notation:
             node = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
 
+        In a lazily unpacked directory the part is extracted from the original
+        file on first access.
+
         Args:
             xml_path: Relative path to XML file (e.g., "word/document.xml", "word/comments.xml")
 
@@ -702,6 +727,12 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
+            if (
+                not file_path.exists()
+                and self._manifest
+                and xml_path in self._manifest["members"]
+            ):
+                materialize_parts(self.unpacked_path, [xml_path], manifest=self._manifest)
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from pack import pack_document
+from unpack import (
+    MANIFEST_NAME,
+    load_manifest,
+    materialize_parts,
+    unextracted_members,
+    unpack_document,
+)
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Default Extension="png" ContentType="image/png"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" '
+    'Target="media/image1.png"/>'
+    "</Relationships>"
+)
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body><w:p><w:r><w:t>Hello</w:t></w:r></w:p></w:body></w:document>"
+)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"/>'
+)
+
+
+def make_package(path):
+    """Write a minimal .docx with a stored (uncompressed) image and return its path."""
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", CONTENT_TYPES)
+        zf.writestr("_rels/.rels", ROOT_RELS)
+        zf.writestr("word/document.xml", DOCUMENT)
+        zf.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+        zf.writestr("word/styles.xml", STYLES)
+        zf.writestr("word/media/image1.png", os.urandom(64 * 1024), zipfile.ZIP_STORED)
+    return path
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestLazyUnpack(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.source = make_package(self.root / "source.docx")
+        self.unpacked = self.root / "unpacked"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_lazy_unpack_extracts_only_package_structure(self):
+        unpack_document(self.source, self.unpacked, lazy=True)
+
+        manifest = load_manifest(self.unpacked)
+        self.assertEqual(len(manifest["members"]), 6)
+        self.assertEqual(
+            sorted(unextracted_members(self.unpacked)),
+            ["word/document.xml", "word/media/image1.png", "word/styles.xml"],
+        )
+        self.assertTrue((self.unpacked / "word/_rels/document.xml.rels").exists())
+        self.assertFalse((self.unpacked / "word/document.xml").exists())
+
+    def test_parts_are_extracted_on_demand_like_a_full_unpack(self):
+        unpack_document(self.source, self.unpacked, lazy=True)
+        materialize_parts(self.unpacked, ["word/document.xml"])
+
+        full = self.root / "full"
+        unpack_document(self.source, full)
+        self.assertEqual(
+            (self.unpacked / "word/document.xml").read_bytes(),
+            (full / "word/document.xml").read_bytes(),
+        )
+        self.assertNotIn("word/document.xml", unextracted_members(self.unpacked))
+        with self.assertRaises(ValueError):
+            materialize_parts(self.unpacked, ["word/missing.xml"])
+
+    def test_pack_copies_unextracted_parts_verbatim(self):
+        unpack_document(self.source, self.unpacked, lazy=True, parts=["word/document.xml"])
+        document = self.unpacked / "word/document.xml"
+        document.write_text(
+            document.read_text(encoding="utf-8").replace("Hello", "Goodbye"),
+            encoding="utf-8",
+        )
+
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output)
+
+        with zipfile.ZipFile(self.source) as original, zipfile.ZipFile(output) as packed:
+            self.assertEqual(packed.namelist(), original.namelist())
+            self.assertIsNone(packed.testzip())
+            self.assertIn(b"Goodbye", packed.read("word/document.xml"))
+            for name in ("word/styles.xml", "word/media/image1.png"):
+                before, after = original.getinfo(name), packed.getinfo(name)
+                self.assertEqual(after.compress_type, before.compress_type)
+                self.assertEqual(after.compress_size, before.compress_size)
+                self.assertEqual(packed.read(name), original.read(name))
+            self.assertNotIn(MANIFEST_NAME, packed.namelist())
+
+    def test_deleted_parts_are_not_restored_from_source(self):
+        unpack_document(self.source, self.unpacked, lazy=True, parts=["word/styles.xml"])
+        (self.unpacked / "word/styles.xml").unlink()
+
+        output = self.root / "output.docx"
+        pack_document(self.unpacked, output)
+
+        with zipfile.ZipFile(output) as packed:
+            self.assertNotIn("word/styles.xml", packed.namelist())
+            self.assertIn("word/media/image1.png", packed.namelist())
+
+
+if __name__ == "__main__":
+    unittest.main()
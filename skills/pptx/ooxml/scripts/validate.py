@@ -4,26 +4,103 @@ Command line tool to validate Office document XML files against XSD schemas and
 
 Usage:
     python validate.py <dir> --original <original_file>
+    python validate.py <file.docx> --original <original_file>
+    python validate.py <file> [<file> ...] [--workers N]
+
+A document given instead of a directory is read straight from the zip without
+unpacking. Several documents without --original are validated concurrently on
+their own: every schema error is reported, and the checks that need the
+original (tracked changes, paragraph counts) are skipped.
 """
 
 import argparse
+import contextlib
+import io
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
 
+SUPPORTED_EXTENSIONS = [".docx", ".pptx", ".xlsx"]
+
+
+def get_validators(file_extension, has_original=True):
+    """Validator classes for a document type, or None if it is not supported."""
+    match file_extension:
+        case ".docx":
+            if has_original:
+                return [DOCXSchemaValidator, RedliningValidator]
+            return [DOCXSchemaValidator]
+        case ".pptx":
+            return [PPTXSchemaValidator]
+        case _:
+            return None
+
+
+def run_validators(validators, document, original_file, verbose=False):
+    """Run each validator on a document (directory or archive), returning True if all pass."""
+    success = True
+    for V in validators:
+        validator = V(document, original_file, verbose=verbose)
+        try:
+            if not validator.validate():
+                success = False
+        finally:
+            if hasattr(validator, "close"):
+                validator.close()
+    return success
+
+
+def validate_archive(path, verbose=False):
+    """Validate one document on its own, returning (success, printed output)."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            validators = get_validators(Path(path).suffix.lower(), has_original=False)
+            success = run_validators(validators, path, None, verbose)
+        except Exception as e:
+            print(f"FAILED - Error reading {path}: {e}")
+            success = False
+    return success, output.getvalue()
+
+
+def validate_archives(paths, workers=None, verbose=False):
+    """Validate documents concurrently, printing each report in order. Returns the failed paths."""
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(validate_archive, paths, [verbose] * len(paths))
+        for path, (success, output) in zip(paths, results):
+            print(f"{'PASSED' if success else 'FAILED'} - {path}")
+            if output and (verbose or not success):
+                print(output.rstrip("\n"))
+                print()
+            if not success:
+                failed.append(path)
+
+    print(f"\n{len(paths) - len(failed)}/{len(paths)} documents passed validation")
+    return failed
+
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
-        "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        "documents",
+        nargs="+",
+        metavar="unpacked_dir",
+        help="Path to unpacked Office document directory, or Office documents to read directly",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Documents validated in parallel without --original (default: CPU count)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -32,32 +109,38 @@ def main():
     )
     args = parser.parse_args()
 
+    # Several documents, each validated on its own
+    if args.original is None:
+        paths = [Path(p) for p in args.documents]
+        for path in paths:
+            assert path.is_file(), (
+                f"Error: {path} is not a file (--original is required for an unpacked directory)"
+            )
+            assert get_validators(path.suffix.lower()) is not None, (
+                f"Error: {path} must be a .docx or .pptx file"
+            )
+        failed = validate_archives(paths, workers=args.workers, verbose=args.verbose)
+        sys.exit(1 if failed else 0)
+
     # Validate paths
-    unpacked_dir = Path(args.unpacked_dir)
+    assert len(args.documents) == 1, "Error: --original applies to a single document"
+    unpacked_dir = Path(args.documents[0])
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.exists(), f"Error: {unpacked_dir} does not exist"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
-    assert file_extension in [".docx", ".pptx", ".xlsx"], (
+    assert file_extension in SUPPORTED_EXTENSIONS, (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
     # Run validations
-    match file_extension:
-        case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
-        case ".pptx":
-            validators = [PPTXSchemaValidator]
-        case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+    validators = get_validators(file_extension)
+    if validators is None:
+        print(f"Error: Validation not supported for file type {file_extension}")
+        sys.exit(1)
 
     # Run validators
-    success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    success = run_validators(validators, unpacked_dir, original_file, args.verbose)
 
     if success:
         print("All validations PASSED!")
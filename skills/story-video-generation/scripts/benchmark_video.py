@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+故事视频生成器 - 合成性能基准
+生成一组测试图片，分别用各合成方式（single / segments / staged）和编码档位
+（draft / standard / final）生成视频并比较耗时与编码速度
+
+每次运行使用独立的输出目录，图片预处理缓存（.frame_cache）都从空开始，
+计时包含图片预处理
+
+用法: python benchmark_video.py [--count 60] [--size 1728x960] [--duration 3] [--fps 30]
+                                [--qualities draft,standard,final]
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import generate_video
+
+
+def make_test_images(ffmpeg, image_dir, count, size):
+    """用 ffmpeg 的 testsrc2 生成 count 张测试图片"""
+    subprocess.run([
+        ffmpeg, "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc2=s={size}:r=1",
+        "-frames:v", str(count),
+        str(Path(image_dir) / "scene_%03d.png")
+    ], check=True)
+    return sorted(Path(image_dir).glob("scene_*.png"))
+
+
+def run_pipeline(pipeline, quality, images, work_dir, args):
+    # 独立的输出目录：预处理缓存写在输出目录下，不与其他运行共享
+    output_dir = Path(work_dir) / f"bench_{pipeline}_{quality}"
+    output_dir.mkdir()
+    config = {
+        "output": str(output_dir / "video.mp4"),
+        "duration": args.duration,
+        "fps": args.fps,
+        "bgm": args.bgm,
+        "pipeline": pipeline,
+        "workers": args.workers,
+        "quality": quality,
+    }
+    return generate_video.create_video(images, config)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='故事视频合成性能基准')
+    parser.add_argument('--count', type=int, default=60, help='图片数量（默认：60）')
+    parser.add_argument('--size', default='1728x960', help='图片尺寸（默认：1728x960）')
+    parser.add_argument('--duration', type=float, default=3.0, help='每张图片时长（秒，默认：3）')
+    parser.add_argument('--fps', type=int, default=30, help='帧率（默认：30）')
+    parser.add_argument('--bgm', help='背景音乐文件（可选）')
+    parser.add_argument('--workers', type=int, help='segments 方式的并行编码数（默认：CPU 核数）')
+    parser.add_argument('--pipelines', default='single,segments,staged', help='要比较的合成方式，逗号分隔')
+    parser.add_argument('--qualities', default='standard', help='要比较的编码档位，逗号分隔（默认：standard）')
+    args = parser.parse_args()
+
+    if not generate_video.check_ffmpeg():
+        print("❌ 错误：未找到支持 drawtext 的 FFmpeg")
+        sys.exit(1)
+
+    pipelines = [p.strip() for p in args.pipelines.split(',') if p.strip()]
+    qualities = [q.strip() for q in args.qualities.split(',') if q.strip()]
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="story_video_bench_") as work_dir:
+        images = make_test_images(generate_video.FFMPEG_PATH, work_dir, args.count, args.size)
+        print(f"已生成 {len(images)} 张 {args.size} 测试图片")
+
+        for quality in qualities:
+            for pipeline in pipelines:
+                print(f"\n=== {pipeline} / {quality} ===")
+                results[(pipeline, quality)] = run_pipeline(pipeline, quality, images, work_dir, args)
+
+    print("\n=== 基准结果 ===")
+    print(f"{args.count} 张图片，每张 {args.duration} 秒，{args.fps} fps，{args.size}")
+    for (pipeline, quality), stats in results.items():
+        line = (f"  {pipeline:<8} {quality:<8} {stats['elapsed']:8.1f} 秒"
+                f"（预处理 {stats['normalize']:.1f} 秒）  {stats['fps']:8.1f} fps")
+        baseline = results.get(("staged", quality))
+        if baseline and pipeline != "staged":
+            line += f"  （相对 staged 提速 {baseline['elapsed'] / stats['elapsed']:.2f}x）"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
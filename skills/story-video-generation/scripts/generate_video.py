@@ -9,7 +9,18 @@ import sys
 import subprocess
 from pathlib import Path
 import argparse
+import hashlib
 import json
+import shutil
+import threading
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:  # 未安装 Pillow 时用 ffprobe 读取尺寸，并由 ffmpeg 完成缩放填充
+    Image = None
 
 class FlushWriter:
     def __init__(self, file):
@@ -55,6 +66,16 @@ def check_ffmpeg():
 FFMPEG_PATH = "ffmpeg"
 FFPROBE_PATH = "ffprobe"
 
+# 编码速度档位：preset/crf 为最终 x264 编码参数，max_height 为画面高度上限（None 表示不限），
+# intermediate 为 staged 方式中间文件的编码方式（"lossless" 使用 ultrafast 无损编码，
+# 编码快且不会在最终编码前引入二次压缩损失；"final" 与最终编码参数相同）
+SPEED_TIERS = {
+    "draft": {"preset": "ultrafast", "crf": 30, "max_height": 540, "intermediate": "final"},
+    "standard": {"preset": "medium", "crf": 23, "max_height": None, "intermediate": "lossless"},
+    "final": {"preset": "slow", "crf": 18, "max_height": None, "intermediate": "lossless"},
+}
+DEFAULT_TIER = "standard"
+
 def get_image_files(image_dir):
     image_dir = Path(image_dir)
     if not image_dir.exists():
@@ -75,66 +96,119 @@ def get_tts_script_path():
         return None
     return str(tts_script)
 
-def generate_narration(subtitles, output_dir, voice='chuichui', speed=1.0):
+def narration_cache_key(text, voice, speed):
+    """配音缓存键：由 (文本, 语音类型, 语速) 的哈希决定"""
+    payload = json.dumps([text, voice, float(speed)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def synthesize_clip(text, cache_file, tts_command, voice, speed, retries=2, timeout=60):
+    """生成单条配音并写入缓存，失败时单独重试
+
+    先写入临时文件再重命名，多个任务同时生成同一条配音也不会读到半个文件
+
+    Returns:
+        (是否成功, 错误信息)
+    """
+    error_message = ""
+    for attempt in range(retries + 1):
+        tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+        try:
+            result = subprocess.run(
+                tts_command + [text, str(tmp_file), voice, str(speed)],
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+            if result.returncode == 0 and tmp_file.exists():
+                os.replace(tmp_file, cache_file)
+                return True, ""
+            error_message = result.stderr.strip() or f"退出码 {result.returncode}"
+        except subprocess.TimeoutExpired:
+            error_message = f"超时（{timeout} 秒）"
+        except Exception as e:
+            error_message = str(e)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
+
+        if attempt < retries:
+            time.sleep(min(2 ** attempt, 8))
+    return False, error_message
+
+def generate_narration(subtitles, output_dir, voice='chuichui', speed=1.0,
+                       concurrency=4, retries=2, cache_dir=None, tts_command=None):
     """使用 z-ai TTS 为字幕生成配音
 
+    多条配音并发生成，每条失败时单独重试；生成结果按 (文本, 语音类型, 语速)
+    的哈希缓存在磁盘上，修改一条字幕后重新生成只会合成这一条
+
     Args:
         subtitles: 字幕文本列表
         output_dir: 配音文件输出目录
         voice: 语音类型，默认为 'chuichui'
         speed: 语速，默认为 1.0
+        concurrency: 同时运行的 TTS 进程数，默认为 4
+        retries: 每条配音失败后的重试次数，默认为 2
+        cache_dir: 配音缓存目录，默认为 output_dir/.tts_cache
+        tts_command: TTS 命令（不含参数），默认为 ["node", generate-tts.js]
 
     Returns:
         配音文件路径列表，如果生成失败返回 None
     """
-    tts_script = get_tts_script_path()
-    if not tts_script:
-        print("警告：未找到 TTS 生成脚本，无法生成配音")
-        return None
+    if tts_command is None:
+        tts_script = get_tts_script_path()
+        if not tts_script:
+            print("警告：未找到 TTS 生成脚本，无法生成配音")
+            return None
+        tts_command = ["node", tts_script]
 
     print(f"\n正在生成配音（语音类型：{voice}，语速：{speed}）...")
 
     output_dir = Path(output_dir)
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-    narration_files = []
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = Path(cache_dir) if cache_dir else output_dir / ".tts_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
 
+    # 生成配音文件名：narration_001.wav, narration_002.wav, ...
+    clips = []
     for i, subtitle in enumerate(subtitles):
         if not subtitle or not subtitle.strip():
             continue
+        cache_file = cache_dir / f"{narration_cache_key(subtitle, voice, speed)}.wav"
+        clips.append((subtitle, output_dir / f"narration_{i+1:03d}.wav", cache_file))
+
+    # 相同文本只合成一次，已缓存的直接复用
+    pending = {}
+    for subtitle, _, cache_file in clips:
+        if not cache_file.exists():
+            pending[cache_file] = subtitle
+    cached_count = len({c for _, _, c in clips}) - len(pending)
+    if cached_count:
+        print(f"复用 {cached_count} 条已缓存的配音")
+
+    failed = []
+    if pending:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {
+                executor.submit(synthesize_clip, text, cache_file, tts_command,
+                                voice, speed, retries): text
+                for cache_file, text in pending.items()
+            }
+            for future, text in futures.items():
+                success, error_message = future.result()
+                if not success:
+                    failed.append(text)
+                    print(f"警告：字幕 '{text[:30]}...' 的配音生成失败")
+                    print(f"错误信息：{error_message}")
+
+    if failed:
+        print(f"❌ {len(failed)} 条配音生成失败（已成功的配音已缓存，重新运行只会生成失败的部分）")
+        return None
 
-        # 生成配音文件名：narration_001.wav, narration_002.wav, ...
-        narration_file = output_dir / f"narration_{i+1:03d}.wav"
-
-        try:
-            # 调用 Node.js TTS 脚本
-            cmd = [
-                "node", tts_script,
-                subtitle, str(narration_file),
-                voice, str(speed)
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-
-            if result.returncode == 0 and narration_file.exists():
-                narration_files.append(str(narration_file))
-            else:
-                print(f"警告：字幕 '{subtitle[:30]}...' 的配音生成失败")
-                print(f"错误信息：{result.stderr}")
-                return None
-
-        except subprocess.TimeoutExpired:
-            print(f"警告：字幕 '{subtitle[:30]}...' 的配音生成超时")
-            return None
-        except Exception as e:
-            print(f"警告：生成配音时出错: {e}")
-            return None
+    narration_files = []
+    for _, narration_file, cache_file in clips:
+        shutil.copyfile(cache_file, narration_file)
+        narration_files.append(str(narration_file))
 
     print(f"✓ 成功生成 {len(narration_files)} 个配音文件")
     return narration_files
@@ -157,7 +231,7 @@ def get_chinese_font():
             return font_path
     return None
 
-def get_video_config(enable_narration=False):
+def get_video_config(enable_narration=False, quality=DEFAULT_TIER):
     print("\n=== 视频配置 ===")
     print("默认设置：")
     if not sys.stdin.isatty():
@@ -180,7 +254,11 @@ def get_video_config(enable_narration=False):
             "transition": "fade",
             "enable_narration": enable_narration,
             "narration_voice": "chuichui",
-            "narration_speed": 1.0
+            "narration_speed": 1.0,
+            "pipeline": DEFAULT_PIPELINE,
+            "workers": None,
+            "quality": quality,
+            "normalize": True
         }
     output_file = input("输出视频文件名（默认：story_video.mp4）：").strip()
     output_file = output_file or "story_video.mp4"
@@ -190,6 +268,8 @@ def get_video_config(enable_narration=False):
     fps = int(fps_input) if fps_input else 30
     bgm_file = input("背景音乐文件路径（可选，直接回车跳过）：").strip()
     bgm_file = bgm_file if bgm_file and Path(bgm_file).exists() else None
+    quality_input = input(f"编码档位（默认：{quality}，可选：{', '.join(SPEED_TIERS)}）：").strip()
+    quality = quality_input if quality_input in SPEED_TIERS else quality
 
     # 配音配置
     narration_voice = "chuichui"
@@ -209,79 +289,372 @@ def get_video_config(enable_narration=False):
         "transition": "fade",
         "enable_narration": enable_narration,
         "narration_voice": narration_voice,
-        "narration_speed": narration_speed
+        "narration_speed": narration_speed,
+        "pipeline": DEFAULT_PIPELINE,
+        "workers": None,
+        "quality": quality,
+        "normalize": True
     }
 
-def create_video(images, config, subtitles=None, narration=None):
-    """创建视频，支持字幕和配音功能
+def get_image_size(image):
+    """读取图片尺寸：优先用 Pillow 只读文件头（不启动子进程），
+    否则用 ffprobe，都失败时返回默认的 1920x1080
+    """
+    if Image is not None:
+        try:
+            with Image.open(image) as im:
+                return im.size
+        except OSError:
+            pass
+    probe_cmd = [
+        FFPROBE_PATH, "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "csv=s=x:p=0", str(image)
+    ]
+    try:
+        result = subprocess.run(probe_cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        result = None
+    if result is None or result.returncode != 0:
+        print("警告：无法获取图片尺寸，使用默认值 1920x1080")
+        return 1920, 1080
+    return tuple(map(int, result.stdout.strip().split("x")))
+
+def get_speed_tier(config):
+    """返回配置中的编码档位参数，未指定时使用 standard"""
+    quality = config.get("quality") or DEFAULT_TIER
+    if quality not in SPEED_TIERS:
+        print(f"❌ 错误：未知的编码档位 {quality}（可选：{', '.join(SPEED_TIERS)}）")
+        sys.exit(1)
+    return SPEED_TIERS[quality]
+
+def cap_resolution(width, height, max_height):
+    """按档位的高度上限等比缩小画布，宽高取偶数（yuv420p 编码要求）"""
+    if max_height and height > max_height:
+        width = width * max_height / height
+        height = max_height
+    return max(2, int(width) // 2 * 2), max(2, int(height) // 2 * 2)
+
+def video_codec_args(config, intermediate=False):
+    """x264 编码参数：最终输出使用档位的 preset/crf，中间文件按档位选择无损快速编码"""
+    tier = get_speed_tier(config)
+    if intermediate and tier["intermediate"] == "lossless":
+        quality_args = ["-preset", "ultrafast", "-qp", "0"]
+    else:
+        quality_args = ["-preset", tier["preset"], "-crf", str(tier["crf"])]
+    return ["-c:v", "libx264"] + quality_args + ["-pix_fmt", "yuv420p"]
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """源文件内容的 sha256，用作预处理缓存键"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def normalize_image(src, cache_file, width, height):
+    """把单张图片等比缩放并居中填充黑边到目标画布，写入缓存文件
+
+    JPEG 先用 draft 模式按缩小比例解码，超大照片不必完整解码到原始分辨率
+    """
+    with Image.open(src) as im:
+        im.draft("RGB", (width, height))
+        im = im.convert("RGB")
+        scale = min(width / im.width, height / im.height)
+        size = (max(1, int(im.width * scale)), max(1, int(im.height * scale)))
+        if size != im.size:
+            im = im.resize(size, Image.LANCZOS)
+        canvas = Image.new("RGB", (width, height), "black")
+        canvas.paste(im, ((width - size[0]) // 2, (height - size[1]) // 2))
+
+    tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp.png")
+    try:
+        canvas.save(tmp_file, compress_level=1)
+        os.replace(tmp_file, cache_file)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
+    return cache_file
+
+def normalize_images(images, width, height, output_dir, cache_dir=None, workers=None):
+    """预处理：在线程池中把所有图片缩放填充到目标画布，结果按
+    (源文件哈希, 目标尺寸) 缓存，之后 ffmpeg 直接读取已是画布尺寸的图片
 
     Args:
         images: 图片路径列表
-        config: 视频配置字典
-        subtitles: 字幕文本列表，每张图片对应一个字幕
-        narration: 配音文件列表，每张图片对应一个配音文件
+        width, height: 目标画布尺寸
+        output_dir: 输出目录
+        cache_dir: 缓存目录，默认为 output_dir/.frame_cache
+        workers: 线程数，默认为 CPU 核数
+
+    Returns:
+        预处理后的图片路径列表（与 images 顺序一致）；未安装 Pillow 时原样返回
     """
-    try:
-        output = config["output"]
-        duration = config["duration"]
-        fps = config["fps"]
-        transition = config.get("transition", "fade")
-
-        # 获取图片尺寸
-        probe_cmd = [
-            FFPROBE_PATH, "-v", "error", "-select_streams", "v:0",
-            "-show_entries", "stream=width,height",
-            "-of", "csv=s=x:p=0", str(images[0])
-        ]
-        result = subprocess.run(probe_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print("警告：无法获取图片尺寸，使用默认值 1920x1080")
-            width, height = 1920, 1080
-        else:
-            width, height = map(int, result.stdout.strip().split("x"))
+    if Image is None:
+        return list(images)
+
+    cache_dir = Path(cache_dir) if cache_dir else Path(output_dir) / ".frame_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        hashes = list(executor.map(file_hash, images))
+        normalized = [cache_dir / f"{h}_{width}x{height}.png" for h in hashes]
+
+        pending = {}
+        for src, cache_file in zip(images, normalized):
+            if not cache_file.exists():
+                pending.setdefault(cache_file, src)
+        cached_count = len(set(normalized)) - len(pending)
+        if cached_count:
+            print(f"复用 {cached_count} 张已预处理的图片")
+        if pending:
+            print(f"正在预处理 {len(pending)} 张图片（{width}x{height}，并发数：{workers}）...")
+            futures = [executor.submit(normalize_image, src, cache_file, width, height)
+                       for cache_file, src in pending.items()]
+            for future in futures:
+                future.result()
+
+    return normalized
+
+def scale_pad_filter(width, height):
+    """缩放并填充到目标画布"""
+    return (f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1")
+
+def subtitle_filter(text, font, height):
+    """字幕样式：白色文字 + 黑色描边，显示在底部"""
+    subtitle_text = text.replace(':', '\\:').replace("'", "\\'")
+    vf = (f"drawtext=text='{subtitle_text}':fontfile='{font}':fontcolor=white:"
+          f"fontsize={int(height*0.05)}:x=(w-tw)/2:y=h-{int(height*0.15)}:"
+          f"shadowcolor=black:shadowx=2:shadowy=2")
+    return vf
+
+def get_fade_duration(duration):
+    """翻页淡入淡出时长（秒），不超过单张图片时长的一半"""
+    return min(1.0, duration / 2)
+
+def segment_fade_filter(index, count, duration):
+    """单张图片片段的淡入淡出：第一张只淡出，最后一张只淡入，中间的两者都有"""
+    fade_duration = get_fade_duration(duration)
+    fades = []
+    if index > 0:
+        fades.append(f"fade=t=in:st=0:d={fade_duration}")
+    if index < count - 1:
+        fades.append(f"fade=t=out:st={duration - fade_duration}:d={fade_duration}")
+    return ",".join(fades)
+
+def still_segment_filter(index, count, config, width, height, subtitle=None, font=None):
+    """单张图片的静帧片段滤镜：缩放填充、字幕只处理一次，再用 loop 滤镜重复成
+    指定时长的片段，最后加上淡入淡出
+    """
+    duration = config["duration"]
+    fps = config["fps"]
+    frames_per_image = int(fps * duration)
+
+    vf = [scale_pad_filter(width, height), "format=yuv420p"]
+    if subtitle and font:
+        vf.append(subtitle_filter(subtitle, font, height))
+    vf.append(f"loop=loop={frames_per_image - 1}:size=1:start=0")
+    vf.append(f"setpts=N/({fps}*TB)")
+    fades = segment_fade_filter(index, count, duration)
+    if fades:
+        vf.append(fades)
+    return ",".join(vf)
+
+def build_audio_filter(narration, bgm, video_duration, first_input):
+    """构建配音/背景音乐的输入参数和混音滤镜
 
-        # 计算每张图片的帧数
-        frames_per_image = int(fps * duration)
+    Args:
+        narration: 配音文件列表
+        bgm: 背景音乐文件
+        video_duration: 视频总时长（秒）
+        first_input: 第一个音频输入在 ffmpeg 命令中的序号
 
-        # 检查并获取中文字体
-        chinese_font = get_chinese_font()
-        if subtitles and chinese_font:
-            print(f"使用中文字体：{chinese_font}")
-        elif subtitles and not chinese_font:
-            print("警告：未找到中文字体，字幕可能无法正确显示")
+    Returns:
+        (输入参数列表, 滤镜字符串)，没有音频时返回 ([], None)
+    """
+    audio_inputs = []
+    audio_filter_parts = []
+    index = first_input
 
-        print(f"\n正在将 {len(images)} 张图片合成为视频...")
+    # 添加配音（如果存在）：在滤镜中解码拼接，避免先写临时文件
+    if narration:
+        for audio_path in narration:
+            audio_inputs.extend(["-i", str(audio_path)])
+        voice_inputs = "".join(f"[{index + k}:a]" for k in range(len(narration)))
+        audio_filter_parts.append(f"{voice_inputs}concat=n={len(narration)}:v=0:a=1[voice]")
+        index += len(narration)
+
+    # 添加背景音乐（如果存在）：补齐时长并降低音量
+    if bgm:
+        audio_inputs.extend(["-i", str(bgm)])
+        audio_filter_parts.append(f"[{index}:a]apad=whole_dur={video_duration}s,volume=0.3[bgm]")
+
+    if not audio_filter_parts:
+        return [], None
+
+    # 构建音频混合滤镜
+    if narration and bgm:
+        audio_filter_parts.append("[voice][bgm]amix=inputs=2:duration=first:dropout_transition=2[audioout]")
+    elif narration:
+        audio_filter_parts.append("[voice]acopy[audioout]")
+    else:
+        audio_filter_parts.append("[bgm]acopy[audioout]")
+
+    return audio_inputs, ";".join(audio_filter_parts)
+
+def _subtitle_for(subtitles, index):
+    if subtitles and index < len(subtitles) and subtitles[index]:
+        return subtitles[index]
+    return None
+
+def _image_path(img):
+    return str(Path(img).absolute()).replace("\\", "/")
+
+def create_video_single_pass(images, config, width, height, subtitles=None, narration=None, font=None):
+    """单次调用 ffmpeg 完成合成：所有图片、字幕、翻页效果和音频放在同一个滤镜图中，
+    只编码一次，中间结果不落盘
+
+    每张图片只解码、缩放和绘制字幕一次，再用 loop 滤镜重复成静帧片段，
+    避免 -loop 1 输入在每一帧都重新解码和缩放原图
+    """
+    output = config["output"]
+    fps = config["fps"]
+    count = len(images)
+    video_duration = count * config["duration"]
+
+    inputs = []
+    filter_parts = []
+    for i, img in enumerate(images):
+        inputs.extend(["-framerate", str(fps), "-i", _image_path(img)])
+        vf = still_segment_filter(i, count, config, width, height,
+                                  subtitle=_subtitle_for(subtitles, i), font=font)
+        filter_parts.append(f"[{i}:v]{vf}[v{i}]")
+
+    concat_inputs = "".join(f"[v{i}]" for i in range(count))
+    filter_parts.append(f"{concat_inputs}concat=n={count}:v=1:a=0[outv]")
+
+    audio_inputs, audio_filter = build_audio_filter(narration, config["bgm"], video_duration, count)
+    if audio_filter:
+        filter_parts.append(audio_filter)
+
+    cmd = [
+        FFMPEG_PATH, "-y",
+    ] + inputs + audio_inputs + [
+        "-filter_complex", ";".join(filter_parts),
+        "-map", "[outv]",
+    ]
+    if audio_filter:
+        cmd += ["-map", "[audioout]", "-c:a", "aac", "-shortest"]
+    cmd += video_codec_args(config) + [
+        "-r", str(fps),
+        output
+    ]
+    subprocess.run(cmd, check=True)
+
+def encode_segment(img, segment_path, index, count, config, width, height,
+                   subtitle=None, font=None, threads=0):
+    """把单张图片编码为独立的视频片段（已包含字幕和淡入淡出）
+
+    所有片段使用相同的编码参数，因此可以用 concat 分离器直接流复制拼接
+    """
+    fps = config["fps"]
+    vf = still_segment_filter(index, count, config, width, height, subtitle=subtitle, font=font)
+    cmd = [
+        FFMPEG_PATH, "-y", "-loglevel", "error",
+        "-framerate", str(fps),
+        "-i", _image_path(img),
+        "-vf", vf,
+        "-frames:v", str(int(fps * config["duration"])),
+    ] + video_codec_args(config) + [
+        "-r", str(fps),
+        "-threads", str(threads),
+        str(segment_path)
+    ]
+    subprocess.run(cmd, check=True)
+    return segment_path
+
+def create_video_segments(images, config, width, height, subtitles=None, narration=None, font=None):
+    """并行编码每张图片的片段，再用 concat 分离器流复制拼接（不再重新编码），
+    音频在拼接时一并混入
+
+    片段写在本次运行独立的临时目录中，多个任务同时运行也不会互相覆盖
+    """
+    output = config["output"]
+    count = len(images)
+    video_duration = count * config["duration"]
+    workers = config.get("workers") or os.cpu_count() or 1
+    workers = max(1, min(workers, count))
+    # 并行时限制每个 ffmpeg 的编码线程数，避免线程数远超 CPU 核数
+    threads = max(1, (os.cpu_count() or 1) // workers) if workers > 1 else 0
+
+    with tempfile.TemporaryDirectory(prefix="story_video_") as work_dir:
+        work_dir = Path(work_dir)
+        segment_paths = [work_dir / f"segment_{i:04d}.mp4" for i in range(count)]
+
+        print(f"正在并行编码 {count} 个片段（并发数：{workers}）...")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(encode_segment, img, segment_paths[i], i, count, config,
+                                width, height, subtitle=_subtitle_for(subtitles, i),
+                                font=font, threads=threads)
+                for i, img in enumerate(images)
+            ]
+            for future in futures:
+                future.result()
+
+        list_file = work_dir / "segments.txt"
+        list_file.write_text("".join(f"file '{p.name}'\n" for p in segment_paths), encoding="utf-8")
+
+        print("正在拼接片段（流复制，不重新编码）...")
+        audio_inputs, audio_filter = build_audio_filter(narration, config["bgm"], video_duration, 1)
+        cmd = [
+            FFMPEG_PATH, "-y",
+            "-f", "concat", "-safe", "0", "-i", str(list_file),
+        ] + audio_inputs
+        if audio_filter:
+            cmd += [
+                "-filter_complex", audio_filter,
+                "-map", "0:v:0",
+                "-map", "[audioout]",
+                "-c:a", "aac",
+                "-shortest",
+            ]
+        cmd += ["-c:v", "copy", output]
+        subprocess.run(cmd, check=True)
+
+def create_video_staged(images, config, width, height, subtitles=None, narration=None, font=None):
+    """分阶段合成：每张图片先编码为临时视频，再拼接，最后单独添加音频"""
+    output = config["output"]
+    duration = config["duration"]
+    fps = config["fps"]
+
+    with tempfile.TemporaryDirectory(prefix="story_video_") as work_dir:
+        work_dir = Path(work_dir)
 
         # 创建输入文件列表
         input_files = []
 
         for i, img in enumerate(images):
-            temp_video = f"temp_{i}.mp4"
+            temp_video = str(work_dir / f"temp_{i}.mp4")
             input_files.append(temp_video)
 
-            # 为每张图片创建临时视频（不添加平移效果）
-            img_path = str(img.absolute()).replace("\\", "/")
-
             # 构建 video filter - 缩放、填充和可选的字幕
-            vf = f"fps={fps},scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+            vf = f"fps={fps},{scale_pad_filter(width, height)}"
 
             # 如果有字幕，添加 drawtext 滤镜
-            if subtitles and i < len(subtitles) and subtitles[i] and chinese_font:
-                subtitle_text = subtitles[i].replace(':', '\\:').replace("'", "\\'")
-                # 字幕样式：白色文字 + 黑色描边，显示在底部
-                # text=字幕文本: fontcolor=白色: fontsize=字号: x=居中: y=底部位置: shadowcolor=黑色: shadowx=描边偏移: shadowy=描边偏移
-                vf += f",drawtext=text='{subtitle_text}':fontfile='{chinese_font}':fontcolor=white:fontsize={int(height*0.05)}:x=(w-tw)/2:y=h-{int(height*0.15)}:shadowcolor=black:shadowx=2:shadowy=2"
+            subtitle = _subtitle_for(subtitles, i)
+            if subtitle and font:
+                vf += "," + subtitle_filter(subtitle, font, height)
 
             temp_cmd = [
                 FFMPEG_PATH, "-y",
                 "-loop", "1",
-                "-i", img_path,
+                "-i", _image_path(img),
                 "-t", str(duration),
                 "-vf", vf,
-                "-c:v", "libx264",
-                "-preset", "medium",
-                "-crf", "23",
-                "-pix_fmt", "yuv420p",
+            ] + video_codec_args(config, intermediate=True) + [
                 temp_video
             ]
             subprocess.run(temp_cmd, check=True)
@@ -291,21 +664,9 @@ def create_video(images, config, subtitles=None, narration=None):
         # 构建带有翻页效果的 filter_complex
         # 使用 fade 滤镜为每张视频添加淡入淡出效果
         filter_parts = []
-        fade_duration = 1.0
-        fade_frames = int(fps * fade_duration)
-
         for i in range(len(images)):
-            if i == 0:
-                # 第一张图片：只在末尾添加淡出
-                start_out = frames_per_image - fade_frames
-                filter_parts.append(f"[{i}:v]fade=t=out:st={start_out}:d={fade_frames}:alpha=1[v{i}]")
-            elif i == len(images) - 1:
-                # 最后一张图片：只在开头添加淡入
-                filter_parts.append(f"[{i}:v]fade=t=in:st=0:d={fade_frames}:alpha=1[v{i}]")
-            else:
-                # 中间的图片：开头淡入，末尾淡出
-                start_out = frames_per_image - fade_frames
-                filter_parts.append(f"[{i}:v]fade=t=in:st=0:d={fade_frames}:alpha=1,fade=t=out:st={start_out}:d={fade_frames}:alpha=1[v{i}]")
+            fades = segment_fade_filter(i, len(images), duration) or "null"
+            filter_parts.append(f"[{i}:v]{fades}[v{i}]")
 
         # 连接所有视频
         concat_inputs = "".join([f"[v{i}]" for i in range(len(images))])
@@ -318,74 +679,29 @@ def create_video(images, config, subtitles=None, narration=None):
         for f in input_files:
             inputs.extend(["-i", f])
 
+        combined = str(work_dir / "temp_combined.mp4")
         cmd = [
             FFMPEG_PATH, "-y",
         ] + inputs + [
             "-filter_complex", filter_complex,
             "-map", "[outv]",
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", "23",
-            "-pix_fmt", "yuv420p",
-            "temp_combined.mp4"
+        ] + video_codec_args(config) + [
+            combined
         ]
         subprocess.run(cmd, check=True)
 
         # 添加音频（背景音乐和/或配音）
-        if narration or config["bgm"]:
-            # 获取视频总时长
-            video_duration = len(images) * duration
-
-            # 构建音频输入列表
-            audio_inputs = []
-            audio_maps = []
-            audio_filter_parts = []
-
-            # 添加配音（如果存在）
+        audio_inputs, audio_filter = build_audio_filter(
+            narration, config["bgm"], len(images) * duration, 1)
+        if audio_filter:
             if narration:
                 print("正在添加配音...")
-                # 合并所有配音文件
-                concat_inputs = "|".join(narration)
-                temp_narration = "temp_narration.wav"
-                concat_cmd = [
-                    FFMPEG_PATH, "-y",
-                    "-i", f"concat:{concat_inputs}",
-                    "-c", "copy",
-                    temp_narration
-                ]
-                subprocess.run(concat_cmd, check=True)
-                audio_inputs.extend(["-i", temp_narration])
-                audio_maps.append(f"[1:a]")
-
-                # 调整配音时长以匹配视频
-                audio_filter_parts.append("[1:a]atempo=1.0[voice]")
-
-            # 添加背景音乐（如果存在）
             if config["bgm"]:
                 print("正在添加背景音乐...")
-                bgm_index = 2 if narration else 1
-                audio_inputs.extend(["-i", config["bgm"]])
-                audio_maps.append(f"[{bgm_index}:a]")
-
-                # 调整背景音乐时长并降低音量
-                bgm_filter = f"[{bgm_index}:a]apad=whole_dur={video_duration}s,volume=0.3[bgm]"
-                audio_filter_parts.append(bgm_filter)
-
-            # 构建音频混合滤镜
-            if narration and config["bgm"]:
-                # 配音和背景音乐混合
-                audio_filter = ";".join(audio_filter_parts) + ";[voice][bgm]amix=inputs=2:duration=first:dropout_transition=2[audioout]"
-            elif narration:
-                # 只有配音
-                audio_filter = ";".join(audio_filter_parts) + ";[voice]acopy[audioout]"
-            else:
-                # 只有背景音乐
-                audio_filter = ";".join(audio_filter_parts) + ";[bgm]acopy[audioout]"
 
-            # 合成最终视频
             audio_cmd = [
                 FFMPEG_PATH, "-y",
-                "-i", "temp_combined.mp4",
+                "-i", combined,
             ] + audio_inputs + [
                 "-filter_complex", audio_filter,
                 "-map", "0:v:0",
@@ -396,27 +712,75 @@ def create_video(images, config, subtitles=None, narration=None):
                 output
             ]
             subprocess.run(audio_cmd, check=True)
+        else:
+            shutil.move(combined, output)
 
-            # 清理临时配音文件
-            if narration and Path("temp_narration.wav").exists():
-                Path("temp_narration.wav").unlink()
+PIPELINES = {
+    "single": create_video_single_pass,
+    "segments": create_video_segments,
+    "staged": create_video_staged,
+}
+# 默认仍使用原有的分阶段方式；single / segments 需显式选择
+DEFAULT_PIPELINE = "staged"
 
-        else:
-            os.rename("temp_combined.mp4", output)
+def create_video(images, config, subtitles=None, narration=None):
+    """创建视频，支持字幕和配音功能
+
+    Args:
+        images: 图片路径列表
+        config: 视频配置字典，config["pipeline"] 选择合成方式：
+                "staged"（默认，分阶段）、"single"（单次 ffmpeg 调用一次编码）
+                或 "segments"（并行编码片段后流复制拼接，config["workers"] 为并发数）；config["quality"] 选择编码档位
+                （draft / standard / final，见 SPEED_TIERS）；config["normalize"]
+                为 False 时跳过图片预处理
+        subtitles: 字幕文本列表，每张图片对应一个字幕
+        narration: 配音文件列表，每张图片对应一个配音文件
+
+    Returns:
+        本次合成的统计：{"elapsed": 耗时秒数（含图片预处理）, "normalize": 其中预处理耗时秒数,
+        "frames": 输出帧数, "fps": 每秒编码帧数}
+    """
+    pipeline = config.get("pipeline") or DEFAULT_PIPELINE
+    if pipeline not in PIPELINES:
+        print(f"❌ 错误：未知的合成方式 {pipeline}（可选：{', '.join(PIPELINES)}）")
+        sys.exit(1)
+    tier = get_speed_tier(config)
+
+    try:
+        # 获取图片尺寸，并按档位限制输出分辨率
+        width, height = cap_resolution(*get_image_size(images[0]), tier["max_height"])
+
+        # 预处理：所有图片先缩放填充到画布尺寸，ffmpeg 不再逐次缩放原图（计入总耗时）
+        start_time = time.perf_counter()
+        if config.get("normalize", True):
+            images = normalize_images(images, width, height, Path(config["output"]).resolve().parent,
+                                      workers=config.get("workers"))
+        normalize_elapsed = time.perf_counter() - start_time
+
+        # 检查并获取中文字体
+        chinese_font = get_chinese_font()
+        if subtitles and chinese_font:
+            print(f"使用中文字体：{chinese_font}")
+        elif subtitles and not chinese_font:
+            print("警告：未找到中文字体，字幕可能无法正确显示")
 
-        print(f"\n✅ 视频创建成功：{Path(output).absolute()}")
+        print(f"\n正在将 {len(images)} 张图片合成为视频"
+              f"（{width}x{height}，档位：{config.get('quality') or DEFAULT_TIER}）...")
+
+        PIPELINES[pipeline](images, config, width, height,
+                            subtitles=subtitles, narration=narration, font=chinese_font)
+        elapsed = time.perf_counter() - start_time
+        frames = len(images) * int(config["fps"] * config["duration"])
+        encode_fps = frames / elapsed if elapsed > 0 else 0.0
+
+        print(f"\n✅ 视频创建成功：{Path(config['output']).absolute()}"
+              f"（耗时 {elapsed:.1f} 秒，其中图片预处理 {normalize_elapsed:.1f} 秒）")
+        print(f"编码速度：{frames} 帧，{encode_fps:.1f} fps")
+        return {"elapsed": elapsed, "normalize": normalize_elapsed, "frames": frames, "fps": encode_fps}
 
     except subprocess.CalledProcessError as e:
         print(f"❌ 错误：视频创建失败 - {e}")
         sys.exit(1)
-    finally:
-        # 清理临时文件
-        for i in range(len(images)):
-            temp_video = f"temp_{i}.mp4"
-            if Path(temp_video).exists():
-                Path(temp_video).unlink()
-        if Path("temp_combined.mp4").exists():
-            Path("temp_combined.mp4").unlink()
 
 def main():
     print("=== 故事视频生成器 ===")
@@ -436,6 +800,16 @@ def main():
     parser.add_argument('--auto-narration', action='store_true', help='自动生成配音（使用 z-ai TTS）')
     parser.add_argument('--narration-voice', default='chuichui', help='配音语音类型（默认：chuichui）')
     parser.add_argument('--narration-speed', type=float, default=1.0, help='配音语速（默认：1.0，范围：0.5-2.0）')
+    parser.add_argument('--narration-concurrency', type=int, default=4, help='同时生成配音的数量（默认：4）')
+    parser.add_argument('--pipeline', choices=sorted(PIPELINES), default=DEFAULT_PIPELINE,
+                        help='合成方式：staged 分阶段逐张编码（默认），single 单次 ffmpeg 调用一次编码，'
+                             'segments 并行编码片段后流复制拼接')
+    parser.add_argument('--workers', type=int, help='segments 方式的并行编码数（默认：CPU 核数）')
+    parser.add_argument('--quality', choices=list(SPEED_TIERS), default=DEFAULT_TIER,
+                        help='编码档位：draft 快速预览（ultrafast，最高 540p），'
+                             'standard 标准（默认，medium，不限分辨率），final 成片（slow，不限分辨率）')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='不预处理图片，由 ffmpeg 在合成时缩放填充')
     args = parser.parse_args()
 
     image_dir = args.image_dir
@@ -467,7 +841,10 @@ def main():
         if narration and len(narration) != len(images):
             print(f"警告：配音数量({len(narration)})与图片数量({len(images)})不匹配")
 
-    config = get_video_config(enable_narration=args.auto_narration)
+    config = get_video_config(enable_narration=args.auto_narration, quality=args.quality)
+    config["pipeline"] = args.pipeline
+    config["workers"] = args.workers
+    config["normalize"] = not args.no_normalize
 
     # 如果启用自动生成配音且有字幕，生成配音
     if args.auto_narration and subtitles and not narration:
@@ -475,7 +852,8 @@ def main():
             subtitles,
             Path(image_dir),
             voice=config.get("narration_voice", args.narration_voice),
-            speed=config.get("narration_speed", args.narration_speed)
+            speed=config.get("narration_speed", args.narration_speed),
+            concurrency=args.narration_concurrency
         )
         if generated_narration:
             narration = generated_narration
@@ -0,0 +1,262 @@
+import shutil
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from generate_video import (
+    DEFAULT_PIPELINE, PIPELINES, SPEED_TIERS, build_audio_filter, cap_resolution,
+    create_video_segments, create_video_single_pass, create_video_staged, generate_narration,
+    get_image_size, get_speed_tier, normalize_images, segment_fade_filter, still_segment_filter, video_codec_args
+)
+
+# 需要 ffmpeg/ffprobe 实际编码的测试在没有安装时跳过
+HAS_FFMPEG = bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
+
+
+# 测试用的 TTS 桩脚本：把文本写入输出文件，并记录每次调用；
+# 文本包含 FLAKY 时第一次调用失败，用于验证单条重试
+STUB_TTS = textwrap.dedent("""
+    import sys
+    from pathlib import Path
+
+    text, output, voice, speed = sys.argv[1:5]
+    log = Path(__file__).with_name("calls.log")
+    with open(log, "a", encoding="utf-8") as f:
+        f.write(text + "\\n")
+
+    if "FLAKY" in text:
+        marker = Path(__file__).with_name("flaky.marker")
+        if not marker.exists():
+            marker.write_text("seen")
+            sys.stderr.write("transient failure")
+            sys.exit(1)
+    if "BROKEN" in text:
+        sys.exit(1)
+
+    Path(output).write_text(f"{text}|{voice}|{speed}", encoding="utf-8")
+""")
+
+
+# Currently this is not run automatically in CI; it's just for documentation and manual checking.
+class TestGenerateNarration(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        stub = self.root / "stub_tts.py"
+        stub.write_text(STUB_TTS, encoding="utf-8")
+        self.tts_command = [sys.executable, str(stub)]
+        self.output_dir = self.root / "out"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def calls(self):
+        log = self.root / "calls.log"
+        return log.read_text(encoding="utf-8").splitlines() if log.exists() else []
+
+    def narrate(self, subtitles, **kwargs):
+        kwargs.setdefault("retries", 1)
+        return generate_narration(subtitles, self.output_dir, voice="tongtong", speed=1.0,
+                                  tts_command=self.tts_command, **kwargs)
+
+    def test_generates_clips_in_subtitle_order(self):
+        files = self.narrate(["第一句", "第二句", "第三句"], concurrency=3)
+
+        self.assertEqual([Path(f).name for f in files],
+                         ["narration_001.wav", "narration_002.wav", "narration_003.wav"])
+        self.assertEqual(Path(files[1]).read_text(encoding="utf-8"), "第二句|tongtong|1.0")
+        self.assertEqual(sorted(self.calls()), sorted(["第一句", "第二句", "第三句"]))
+
+    def test_only_edited_subtitle_is_regenerated(self):
+        self.narrate(["第一句", "第二句", "第三句"])
+        files = self.narrate(["第一句", "改过的第二句", "第三句"])
+
+        self.assertEqual(len(self.calls()), 4)
+        self.assertEqual(self.calls()[-1], "改过的第二句")
+        self.assertEqual(Path(files[1]).read_text(encoding="utf-8"), "改过的第二句|tongtong|1.0")
+
+    def test_failed_clip_is_retried_individually(self):
+        files = self.narrate(["第一句", "FLAKY 第二句"])
+
+        self.assertIsNotNone(files)
+        self.assertEqual(self.calls().count("FLAKY 第二句"), 2)
+        self.assertEqual(self.calls().count("第一句"), 1)
+
+    def test_persistent_failure_keeps_successful_clips_cached(self):
+        self.assertIsNone(self.narrate(["第一句", "BROKEN 第二句"], retries=0))
+        self.assertIsNone(self.narrate(["第一句", "BROKEN 第二句"], retries=0))
+
+        self.assertEqual(self.calls().count("第一句"), 1)
+        self.assertEqual(self.calls().count("BROKEN 第二句"), 2)
+
+
+class TestNormalizeImages(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.out = self.root / "out"
+        self.wide = self.root / "wide.jpg"
+        Image.new("RGB", (1200, 300), "red").save(self.wide)
+        self.tall = self.root / "tall.png"
+        Image.new("RGB", (100, 400), "blue").save(self.tall)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_reads_size_without_ffprobe(self):
+        self.assertEqual(get_image_size(self.wide), (1200, 300))
+
+    def test_scales_and_pads_to_canvas(self):
+        wide, tall = normalize_images([self.wide, self.tall], 320, 180, self.out)
+
+        with Image.open(wide) as im:
+            self.assertEqual(im.size, (320, 180))
+            self.assertEqual(im.getpixel((0, 0)), (0, 0, 0))
+            self.assertGreater(im.getpixel((160, 90))[0], 200)
+        with Image.open(tall) as im:
+            self.assertEqual(im.size, (320, 180))
+            self.assertEqual(im.getpixel((0, 90)), (0, 0, 0))
+            self.assertGreater(im.getpixel((160, 90))[2], 200)
+
+    def test_cache_is_keyed_by_content_and_canvas(self):
+        first = normalize_images([self.wide], 320, 180, self.out)[0]
+        mtime = first.stat().st_mtime_ns
+        copy = self.root / "copy.jpg"
+        copy.write_bytes(self.wide.read_bytes())
+
+        self.assertEqual(normalize_images([copy], 320, 180, self.out)[0], first)
+        self.assertEqual(first.stat().st_mtime_ns, mtime)
+        self.assertNotEqual(normalize_images([self.wide], 640, 360, self.out)[0], first)
+
+    def test_cache_goes_under_output_dir(self):
+        frame = normalize_images([self.wide], 320, 180, self.out)[0]
+        self.assertEqual(frame.parent, self.out / ".frame_cache")
+        self.assertFalse((self.root / ".frame_cache").exists())
+
+
+class TestFilterGraph(unittest.TestCase):
+
+    def test_still_segment_is_decoded_once_and_looped(self):
+        vf = still_segment_filter(0, 3, {"duration": 2, "fps": 10}, 320, 180)
+
+        self.assertTrue(vf.startswith("scale=320:180:force_original_aspect_ratio=decrease,"))
+        self.assertIn("loop=loop=19:size=1:start=0,setpts=N/(10*TB)", vf)
+        self.assertIn("fade=t=out:st=1.0:d=1.0", vf)
+        self.assertNotIn("fade=t=in", vf)
+        self.assertNotIn("drawtext", vf)
+        self.assertIn("drawtext=text='第一句'",
+                      still_segment_filter(1, 3, {"duration": 2, "fps": 10}, 320, 180,
+                                           subtitle="第一句", font="font.ttf"))
+
+    def test_audio_filter_numbers_inputs_after_images(self):
+        inputs, audio_filter = build_audio_filter(["a.wav", "b.wav"], "bgm.mp3", 6, 3)
+
+        self.assertEqual(inputs, ["-i", "a.wav", "-i", "b.wav", "-i", "bgm.mp3"])
+        self.assertEqual(audio_filter.split(";"), [
+            "[3:a][4:a]concat=n=2:v=0:a=1[voice]",
+            "[5:a]apad=whole_dur=6s,volume=0.3[bgm]",
+            "[voice][bgm]amix=inputs=2:duration=first:dropout_transition=2[audioout]",
+        ])
+        self.assertEqual(build_audio_filter(None, "bgm.mp3", 6, 1)[1],
+                         "[1:a]apad=whole_dur=6s,volume=0.3[bgm];[bgm]acopy[audioout]")
+        self.assertEqual(build_audio_filter(None, None, 6, 3), ([], None))
+
+    def test_staged_stays_the_default_pipeline(self):
+        self.assertIs(PIPELINES[DEFAULT_PIPELINE], create_video_staged)
+
+    def test_segment_fades_only_at_inner_boundaries(self):
+        self.assertEqual(segment_fade_filter(0, 3, 3), "fade=t=out:st=2.0:d=1.0")
+        self.assertEqual(segment_fade_filter(1, 3, 3),
+                         "fade=t=in:st=0:d=1.0,fade=t=out:st=2.0:d=1.0")
+        self.assertEqual(segment_fade_filter(2, 3, 1), "fade=t=in:st=0:d=0.5")
+        self.assertEqual(segment_fade_filter(0, 1, 3), "")
+
+
+class TestSpeedTiers(unittest.TestCase):
+
+    def test_tiers_trade_quality_for_speed(self):
+        self.assertEqual(list(SPEED_TIERS), ["draft", "standard", "final"])
+        crfs = [tier["crf"] for tier in SPEED_TIERS.values()]
+        self.assertEqual(crfs, sorted(crfs, reverse=True))
+        self.assertEqual(get_speed_tier({}), SPEED_TIERS["standard"])
+        self.assertEqual(get_speed_tier({"quality": None}), SPEED_TIERS["standard"])
+        with self.assertRaises(SystemExit):
+            get_speed_tier({"quality": "ultra"})
+
+    def test_resolution_is_capped_to_even_dimensions(self):
+        draft = SPEED_TIERS["draft"]["max_height"]
+        standard = SPEED_TIERS["standard"]["max_height"]
+
+        self.assertEqual(cap_resolution(1920, 1080, draft), (960, 540))
+        self.assertEqual(cap_resolution(3001, 2001, draft), (808, 540))
+        self.assertEqual(cap_resolution(4000, 3000, 1080), (1440, 1080))
+        self.assertEqual(cap_resolution(1001, 751, 1080), (1000, 750))
+        # The default tier keeps the source resolution, as before tiers existed
+        self.assertEqual(cap_resolution(4001, 3001, standard), (4000, 3000))
+        self.assertEqual(cap_resolution(1, 1, draft), (2, 2))
+
+    def test_intermediate_files_are_lossless_except_in_draft(self):
+        self.assertEqual(video_codec_args({"quality": "final"}),
+                         ["-c:v", "libx264", "-preset", "slow", "-crf", "18", "-pix_fmt", "yuv420p"])
+        self.assertEqual(video_codec_args({"quality": "standard"}, intermediate=True),
+                         ["-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", "-pix_fmt", "yuv420p"])
+        self.assertEqual(video_codec_args({"quality": "draft"}, intermediate=True),
+                         video_codec_args({"quality": "draft"}))
+
+
+@unittest.skipUnless(HAS_FFMPEG, "ffmpeg/ffprobe not on PATH")
+class TestPipelines(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.images = []
+        for i, color in enumerate(["red", "green", "blue"]):
+            path = self.root / f"{i}.png"
+            Image.new("RGB", (64, 36), color).save(path)
+            self.images.append(path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_video(self, pipeline, **config):
+        config = {"output": str(self.root / "out.mp4"), "duration": 0.5, "fps": 10,
+                  "bgm": None, "quality": "draft", **config}
+        pipeline(self.images, config, 64, 36)
+        return config["output"]
+
+    def probe(self, video):
+        """返回 (宽, 高, 帧数)"""
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "v:0", "-count_frames",
+             "-show_entries", "stream=width,height,nb_read_frames", "-of", "csv=p=0", video],
+            capture_output=True, text=True, check=True,
+        )
+        return tuple(int(v) for v in result.stdout.strip().split(","))
+
+    def test_single_pass(self):
+        self.assertEqual(self.probe(self.make_video(create_video_single_pass)), (64, 36, 15))
+
+    def test_segments_are_joined_by_stream_copy(self):
+        for workers in (1, 3):
+            video = self.make_video(create_video_segments, workers=workers)
+            self.assertEqual(self.probe(video), (64, 36, 15))
+        # 片段写在临时目录中，不留在输出目录
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()),
+                         ["0.png", "1.png", "2.png", "out.mp4"])
+
+    def test_staged_with_each_tier(self):
+        for quality in SPEED_TIERS:
+            video = self.make_video(create_video_staged, quality=quality)
+            self.assertEqual(self.probe(video), (64, 36, 15))
+
+
+if __name__ == "__main__":
+    unittest.main()